@@ -0,0 +1,215 @@
+"""
+Applicant search index: typo-tolerant names and emails, phone prefixes.
+
+Every applicant has an ``ApplicantSearchEntry`` holding its normalized name
+(plus the name of the user account sharing its email), email and
+digits-only phone, and one ``ApplicantTrigram`` row per trigram of the name
+and of the email's local part. Trigrams follow ``pg_trgm``: each word is
+padded with two leading spaces and one trailing space.
+
+A name query is split into trigrams and candidate applicants are those that
+share enough of them (one indexed ``GROUP BY``). The score is the share of
+the query's trigrams found (like ``pg_trgm``'s ``word_similarity``, so a
+first name alone still matches a full name); ties go to the closer overall
+match ``shared / (query + entry - shared)``. A phone
+query is a range scan on the phone index, and an email query adds a prefix
+match on the email index.
+
+Entries are refreshed when an Applicant or User is saved. Run
+``python manage.py rebuild_applicant_search`` to (re)build the whole index.
+"""
+import math
+import re
+import unicodedata
+
+from django.db import transaction
+from django.db.models import Count, Q
+from django.db.models.functions import Lower
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from admin_panel.models import Applicant, ApplicantSearchEntry, ApplicantTrigram, User
+
+SIMILARITY_THRESHOLD = 0.5
+MAX_CANDIDATES = 200
+MIN_PHONE_DIGITS = 3
+
+PHONE_QUERY = re.compile(r'^[\d\s()+\-.]+$')
+
+
+# ---------------------------------------------------------------------------
+# Normalization
+# ---------------------------------------------------------------------------
+
+def normalize(text):
+    """Lowercase, strip accents and punctuation, collapse whitespace."""
+    text = unicodedata.normalize('NFKD', text or '')
+    text = ''.join(char for char in text if not unicodedata.combining(char))
+    return ' '.join(re.sub(r'[\W_]+', ' ', text.lower()).split())
+
+
+def trigrams(text):
+    result = set()
+    for word in normalize(text).split():
+        padded = f'  {word} '
+        result.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return result
+
+
+def phone_digits(phone):
+    return re.sub(r'\D', '', phone or '')[:20]
+
+
+# ---------------------------------------------------------------------------
+# Maintaining the index
+# ---------------------------------------------------------------------------
+
+def _linked_users(applicants):
+    emails = {applicant.email.lower() for applicant in applicants if applicant.email}
+    users = {}
+    matching = User.objects.annotate(email_lower=Lower('email')).filter(email_lower__in=emails)
+    for user in matching.only('id', 'email', 'first_name', 'last_name').order_by('pk'):
+        users.setdefault(user.email.lower(), user)
+    return users
+
+
+def _entry(applicant, user):
+    names = [applicant.full_name]
+    if user is not None:
+        names.append(user.get_full_name())
+    name = ' '.join(dict.fromkeys(part for part in map(normalize, names) if part))
+    email = (applicant.email or '').lower()
+    name_trigrams = trigrams(name)
+    email_trigrams = trigrams(email.split('@')[0])
+    entry = ApplicantSearchEntry(
+        applicant_id=applicant.pk,
+        user_id=getattr(user, 'pk', None),
+        name=name[:511],
+        email=email,
+        phone=phone_digits(applicant.mobile_number),
+        name_trigrams=len(name_trigrams),
+        email_trigrams=len(email_trigrams),
+    )
+    rows = [ApplicantTrigram(trigram=t, field='n', applicant_id=applicant.pk) for t in name_trigrams]
+    rows += [ApplicantTrigram(trigram=t, field='e', applicant_id=applicant.pk) for t in email_trigrams]
+    return entry, rows
+
+
+def refresh(applicants, batch_size=1000):
+    """Rebuild the entries and trigrams of ``applicants``."""
+    applicants = list(applicants)
+    if not applicants:
+        return
+    users = _linked_users(applicants)
+    entries, rows = [], []
+    for applicant in applicants:
+        entry, trigram_rows = _entry(applicant, users.get((applicant.email or '').lower()))
+        entries.append(entry)
+        rows.extend(trigram_rows)
+
+    ids = [applicant.pk for applicant in applicants]
+    with transaction.atomic():
+        ApplicantTrigram.objects.filter(applicant_id__in=ids).delete()
+        ApplicantSearchEntry.objects.filter(applicant_id__in=ids).delete()
+        ApplicantSearchEntry.objects.bulk_create(entries, batch_size=batch_size)
+        ApplicantTrigram.objects.bulk_create(rows, batch_size=batch_size)
+
+
+def rebuild(batch_size=1000):
+    """Re-index every applicant; returns the number indexed."""
+    total = 0
+    last_pk = 0
+    while True:
+        applicants = list(Applicant.objects.filter(pk__gt=last_pk).order_by('pk')[:batch_size])
+        if not applicants:
+            return total
+        refresh(applicants, batch_size=batch_size)
+        total += len(applicants)
+        last_pk = applicants[-1].pk
+
+
+@receiver(post_save, sender=Applicant)
+def _applicant_saved(sender, instance, raw=False, **kwargs):
+    if not raw:
+        refresh([instance])
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def _user_changed(sender, instance, raw=False, update_fields=None, **kwargs):
+    if raw or (update_fields and not {'email', 'first_name', 'last_name'} & set(update_fields)):
+        return
+    # Applicants matching the user's (new) email, and any still linked to it.
+    linked = Q(search_entry__user_id=instance.pk)
+    if instance.email:
+        linked |= Q(email__iexact=instance.email)
+    refresh(Applicant.objects.filter(linked))
+
+
+# ---------------------------------------------------------------------------
+# Searching
+# ---------------------------------------------------------------------------
+
+def _phone_matches(digits, limit):
+    upper = digits[:-1] + chr(ord(digits[-1]) + 1)
+    ids = ApplicantSearchEntry.objects.filter(
+        phone__gte=digits, phone__lt=upper
+    ).order_by('phone').values_list('applicant_id', flat=True)[:limit]
+    return {applicant_id: 1.0 for applicant_id in ids}
+
+
+def _email_matches(text, limit):
+    ids = ApplicantSearchEntry.objects.filter(
+        email__gte=text, email__lt=text + '\uffff'
+    ).order_by('email').values_list('applicant_id', flat=True)[:limit]
+    return {applicant_id: 1.0 for applicant_id in ids}
+
+
+def _trigram_matches(text, threshold, limit):
+    query = trigrams(text)
+    if not query:
+        return {}
+    # score >= threshold needs at least threshold * |query| shared trigrams
+    min_shared = max(1, math.ceil(threshold * len(query)))
+    candidates = list(
+        ApplicantTrigram.objects.filter(trigram__in=query)
+        .values('applicant_id', 'field')
+        .annotate(shared=Count('id'))
+        .filter(shared__gte=min_shared)
+        .order_by('-shared')[:limit * 2]
+    )
+    sizes = {
+        row['applicant_id']: row
+        for row in ApplicantSearchEntry.objects.filter(
+            applicant_id__in={c['applicant_id'] for c in candidates}
+        ).values('applicant_id', 'name_trigrams', 'email_trigrams')
+    }
+    scores = {}
+    for candidate in candidates:
+        size = sizes.get(candidate['applicant_id'])
+        if size is None:
+            continue
+        own = size['name_trigrams'] if candidate['field'] == 'n' else size['email_trigrams']
+        shared = candidate['shared']
+        score = (shared / len(query), shared / (len(query) + own - shared))
+        applicant_id = candidate['applicant_id']
+        scores[applicant_id] = max(score, scores.get(applicant_id, (0, 0)))
+    return scores
+
+
+def search(text, threshold=SIMILARITY_THRESHOLD, limit=MAX_CANDIDATES):
+    """
+    Return ``{applicant_id: score}`` (0..1, best first) for ``text``: a
+    phone number prefix, an email prefix, or a possibly misspelt name.
+    """
+    text = (text or '').strip()
+    digits = phone_digits(text)
+    if PHONE_QUERY.match(text) and len(digits) >= MIN_PHONE_DIGITS:
+        return _phone_matches(digits, limit)
+
+    scores = _trigram_matches(text, threshold, limit)
+    if '@' in text or ' ' not in text:
+        for applicant_id in _email_matches(text.lower(), limit):
+            scores[applicant_id] = (1.0, 1.0)
+    ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)[:limit]
+    return {applicant_id: score[0] for applicant_id, score in ranked}
@@ -5,3 +5,13 @@ class AdminPanelConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'admin_panel'
     verbose_name = 'FacultyPlus Admin Panel'
+
+    def ready(self):
+        # Register counter, scope, search index and cache receivers, and checks.
+        from admin_panel import applicant_search  # noqa: F401
+        from admin_panel import checks  # noqa: F401
+        from admin_panel import counters  # noqa: F401
+        from admin_panel import org_tree  # noqa: F401
+        from admin_panel import response_cache  # noqa: F401
+        from admin_panel import scope  # noqa: F401
+        from admin_panel import search  # noqa: F401
@@ -0,0 +1,301 @@
+"""
+Buffered ActivityLog writer.
+
+Call sites use ``log_activity(...)`` instead of ``ActivityLog.objects.create``
+(``log_activities(...)`` for one entry per object of a bulk action).
+Entries are built in the request thread (timestamp included) and handed to
+the backend selected by ``settings.ACTIVITY_LOG_WRITER['BACKEND']``:
+
+``sync``
+    Insert immediately in the calling thread.
+``thread``
+    Queue in-process; a daemon thread flushes with ``bulk_create`` once
+    ``BATCH_SIZE`` entries are waiting or ``FLUSH_INTERVAL`` seconds have
+    passed since the oldest one.
+``celery``
+    Batch like ``thread`` but hand each batch to the
+    ``admin_panel.write_activity_logs`` task (needs a configured Celery app).
+
+Either way nothing is handed over before the transaction the entries were
+logged in commits (immediately in autocommit): the entries of a rolled back
+transaction, or savepoint, are dropped with it.
+
+``durable=True`` (or ``'DURABLE': True``) bypasses the queue: entries are
+inserted in the calling thread when the transaction commits, so they are on
+disk before the response is returned.
+"""
+import atexit
+import logging
+import os
+import queue
+import threading
+import time
+from functools import partial
+
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.core.signals import setting_changed
+from django.db import close_old_connections, transaction
+from django.dispatch import receiver
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from admin_panel.models import ActivityLog
+
+logger = logging.getLogger(__name__)
+
+DEFAULTS = {
+    'BACKEND': 'thread',
+    'BATCH_SIZE': 100,
+    'FLUSH_INTERVAL': 2.0,
+    'QUEUE_SIZE': 10000,
+    'DURABLE': False,
+}
+
+# ActivityLog fields shipped to the Celery task.
+ENTRY_FIELDS = (
+    'user_id', 'action', 'description', 'content_type_id', 'object_id',
+    'ip_address', 'user_agent', 'created_at',
+)
+
+
+def _config():
+    return {**DEFAULTS, **getattr(settings, 'ACTIVITY_LOG_WRITER', {})}
+
+
+def _insert(entries):
+    ActivityLog.objects.bulk_create(entries, batch_size=_config()['BATCH_SIZE'])
+
+
+def _send_to_celery(entries):
+    from admin_panel.tasks import write_activity_logs
+    rows = []
+    for entry in entries:
+        row = {name: getattr(entry, name) for name in ENTRY_FIELDS}
+        row['created_at'] = row['created_at'].isoformat()
+        rows.append(row)
+    write_activity_logs.delay(rows)
+
+
+def insert_rows(rows):
+    """Insert serialized entries (the Celery task payload)."""
+    entries = []
+    for row in rows:
+        row = dict(row)
+        row['created_at'] = parse_datetime(row['created_at'])
+        entries.append(ActivityLog(**row))
+    _insert(entries)
+
+
+class _Stop:
+    pass
+
+
+class _Flush:
+    def __init__(self):
+        self.done = threading.Event()
+
+
+class QueuedBackend:
+    """Background thread that drains a queue into batched writes."""
+
+    def __init__(self, write, batch_size, flush_interval, queue_size):
+        self.write = write
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.queue = queue.Queue(maxsize=queue_size)
+        self._lock = threading.Lock()
+        self._thread = None
+        self._pid = None
+
+    def _ensure_thread(self):
+        # Start lazily, and again in forked worker processes.
+        if self._thread is not None and self._pid == os.getpid() and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is None or self._pid != os.getpid() or not self._thread.is_alive():
+                self._pid = os.getpid()
+                self._thread = threading.Thread(
+                    target=self._run, name='activity-log-writer', daemon=True
+                )
+                self._thread.start()
+
+    def submit(self, entry):
+        self._ensure_thread()
+        try:
+            self.queue.put_nowait(entry)
+        except queue.Full:
+            # Back-pressure: never drop audit rows, write inline instead.
+            self._write([entry])
+
+    def submit_many(self, entries):
+        for entry in entries:
+            self.submit(entry)
+
+    def flush(self, timeout=10):
+        if self._thread is None or not self._thread.is_alive():
+            return
+        request = _Flush()
+        self.queue.put(request)
+        request.done.wait(timeout)
+
+    def stop(self, timeout=10):
+        if self._thread is not None and self._thread.is_alive():
+            self.queue.put(_Stop())
+            self._thread.join(timeout)
+
+    def _write(self, batch):
+        try:
+            self.write(batch)
+        except Exception:
+            logger.exception('Failed to write %d activity log entries', len(batch))
+        finally:
+            close_old_connections()
+
+    def _run(self):
+        batch = []
+        deadline = None
+        while True:
+            timeout = max(0.0, deadline - time.monotonic()) if batch else None
+            try:
+                item = self.queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+
+            if isinstance(item, (_Stop, _Flush)):
+                if batch:
+                    self._write(batch)
+                    batch = []
+                if isinstance(item, _Flush):
+                    item.done.set()
+                    continue
+                return
+
+            if item is not None:
+                batch.append(item)
+                if len(batch) == 1:
+                    deadline = time.monotonic() + self.flush_interval
+
+            if batch and (len(batch) >= self.batch_size or time.monotonic() >= deadline):
+                self._write(batch)
+                batch = []
+
+
+class SyncBackend:
+    def submit(self, entry):
+        _insert([entry])
+
+    def submit_many(self, entries):
+        _insert(entries)
+
+    def flush(self, timeout=None):
+        pass
+
+    def stop(self, timeout=None):
+        pass
+
+
+_backend = None
+_backend_lock = threading.Lock()
+
+
+def get_backend():
+    global _backend
+    if _backend is None:
+        with _backend_lock:
+            if _backend is None:
+                config = _config()
+                name = config['BACKEND']
+                if name == 'sync':
+                    _backend = SyncBackend()
+                elif name in ('thread', 'celery'):
+                    _backend = QueuedBackend(
+                        _insert if name == 'thread' else _send_to_celery,
+                        config['BATCH_SIZE'], config['FLUSH_INTERVAL'], config['QUEUE_SIZE'],
+                    )
+                else:
+                    raise ValueError(f'Unknown ACTIVITY_LOG_WRITER backend: {name}')
+    return _backend
+
+
+def flush():
+    """Block until everything queued so far has been written."""
+    if _backend is not None:
+        _backend.flush()
+
+
+@atexit.register
+def _shutdown():
+    if _backend is not None:
+        _backend.stop()
+
+
+@receiver(setting_changed)
+def _reset_backend(setting, **kwargs):
+    global _backend
+    if setting == 'ACTIVITY_LOG_WRITER':
+        with _backend_lock:
+            if _backend is not None:
+                _backend.stop()
+            _backend = None
+
+
+def _enqueue(entries):
+    if len(entries) == 1:
+        get_backend().submit(entries[0])
+    else:
+        get_backend().submit_many(entries)
+
+
+def _submit(entries, durable):
+    if durable is None:
+        durable = _config()['DURABLE']
+    # Only once the surrounding transaction commits (immediately in
+    # autocommit): entries of a rolled back transaction or savepoint are
+    # discarded along with its on_commit callbacks.
+    transaction.on_commit(partial(_insert if durable else _enqueue, entries))
+
+
+def log_activity(action, description='', user=None, obj=None, ip_address=None,
+                 user_agent=None, durable=None):
+    """Record an ActivityLog entry through the configured writer."""
+    entry = ActivityLog(
+        user_id=getattr(user, 'pk', None),
+        action=action,
+        description=description,
+        ip_address=ip_address,
+        user_agent=user_agent,
+        created_at=timezone.now(),
+    )
+    if obj is not None:
+        entry.content_type_id = ContentType.objects.get_for_model(obj).pk
+        entry.object_id = obj.pk
+    _submit([entry], durable)
+    return entry
+
+
+def log_activities(action, model, object_ids, description='', user=None, ip_address=None,
+                   user_agent=None, durable=None):
+    """
+    Record one entry per ID of ``model``; written with a single
+    ``bulk_create`` (or batched by the queue). ``description`` is either
+    shared text or a ``{object_id: text}`` mapping.
+    """
+    content_type_id = ContentType.objects.get_for_model(model).pk
+    created_at = timezone.now()
+    entries = [
+        ActivityLog(
+            user_id=getattr(user, 'pk', None),
+            action=action,
+            description=description[object_id] if isinstance(description, dict) else description,
+            content_type_id=content_type_id,
+            object_id=object_id,
+            ip_address=ip_address,
+            user_agent=user_agent,
+            created_at=created_at,
+        )
+        for object_id in object_ids
+    ]
+    if entries:
+        _submit(entries, durable)
+    return entries
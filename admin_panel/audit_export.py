@@ -0,0 +1,77 @@
+"""
+Streaming export of the ActivityLog table.
+
+Rows are read in ``(created_at, id)`` order with ``QuerySet.iterator()``,
+which on PostgreSQL is a server-side cursor fetching ``batch_size`` rows at
+a time. The read runs inside a transaction so the cursor is not declared
+``WITH HOLD`` (which would materialize the whole result on the server).
+A ``since`` / ``until`` range is pruned to the overlapping monthly
+partitions (see ``admin_panel.partitions``).
+
+Output is encoded by the export renderers (``admin_panel.renderers``) and
+can be gzip-compressed on the fly, chunk by chunk, so memory use stays flat
+however many rows are exported. Used by the ``export_activity_logs``
+command and ``GET /api/activity-logs/export/``.
+"""
+import zlib
+from datetime import datetime, time
+
+from django.db import transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+
+from admin_panel.models import ActivityLog
+from admin_panel.partitions import ARCHIVE_FIELDS
+
+BATCH_SIZE = 5000
+
+
+def parse_bound(value):
+    """
+    Parse an ISO date or datetime into an aware datetime (a date means its
+    midnight); returns None for empty values and raises ValueError otherwise.
+    """
+    if not value:
+        return None
+    parsed = parse_datetime(value)
+    if parsed is None:
+        day = parse_date(value)
+        if day is None:
+            raise ValueError(f'Invalid date or datetime: {value!r}')
+        parsed = datetime.combine(day, time.min)
+    if timezone.is_naive(parsed):
+        parsed = timezone.make_aware(parsed)
+    return parsed
+
+
+def export_queryset(since=None, until=None, using=None):
+    """Rows with ``since <= created_at < until``, in export order."""
+    queryset = ActivityLog.objects.using(using)
+    if since is not None:
+        queryset = queryset.filter(created_at__gte=since)
+    if until is not None:
+        queryset = queryset.filter(created_at__lt=until)
+    return queryset.order_by('created_at', 'id')
+
+
+def iter_rows(queryset, batch_size=BATCH_SIZE):
+    """Yield ``queryset`` rows as dicts of ``ARCHIVE_FIELDS`` from one cursor."""
+    with transaction.atomic(using=queryset.db):
+        yield from queryset.values(*ARCHIVE_FIELDS).iterator(chunk_size=batch_size)
+
+
+def gzip_chunks(chunks, level=6):
+    """Compress a stream of byte chunks into one gzip stream."""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def stream(renderer, since=None, until=None, compress=False, batch_size=BATCH_SIZE, using=None):
+    """Encoded (and optionally gzipped) export chunks, read from ``using`` (or the router's choice)."""
+    rows = iter_rows(export_queryset(since, until, using), batch_size)
+    chunks = renderer.stream(list(ARCHIVE_FIELDS), rows)
+    return gzip_chunks(chunks) if compress else chunks
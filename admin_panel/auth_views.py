@@ -7,8 +7,11 @@ from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from django.contrib.auth import authenticate
 from django.utils import timezone
-from admin_panel.models import User, ActivityLog, Applicant
-from admin_panel.serializers import UserDetailSerializer, UserProfileSerializer, ChangePasswordSerializer
+from admin_panel.models import User, Applicant
+from admin_panel.audit import log_activity
+from admin_panel.serializers import (
+    UserSummarySerializer, UserDetailSerializer, UserProfileSerializer, ChangePasswordSerializer
+)
 import logging
 
 # JWT imports
@@ -45,14 +48,20 @@ class CustomObtainPairView(TokenObtainPairView):
         if user.status == 'inactive':
             return Response({'error': 'User account is inactive'}, status=status.HTTP_401_UNAUTHORIZED)
 
-        # Log the login action
+        # Log the login action: one UPDATE of the tracking columns rather
+        # than save(), which rewrites every column and runs the User signals.
         ip_address = get_client_ip(request)
         user.last_login_ip = ip_address
         user.last_action = 'login'
         user.last_action_time = timezone.now()
-        user.save()
+        User.objects.filter(pk=user.pk).update(
+            last_login_ip=user.last_login_ip,
+            last_action=user.last_action,
+            last_action_time=user.last_action_time,
+        )
 
-        ActivityLog.objects.create(
+        # Queued by the activity log writer, not written in this request.
+        log_activity(
             user=user,
             action='login',
             description=f'{user.username} logged in from {ip_address}',
@@ -60,11 +69,15 @@ class CustomObtainPairView(TokenObtainPairView):
             user_agent=request.META.get('HTTP_USER_AGENT', '')
         )
 
+        # ?full=true returns the detailed profile (institution, assignments, ...)
+        full = request.query_params.get('full', '').lower() in ('1', 'true', 'yes')
+        user_serializer = UserDetailSerializer if full else UserSummarySerializer
+
         data = serializer.validated_data
         return Response({
             'access': data.get('access'),
             'refresh': data.get('refresh'),
-            'user': UserDetailSerializer(user).data,
+            'user': user_serializer(user).data,
             'message': f'Welcome {user.get_full_name() or user.username}!'
         })
 
@@ -104,7 +117,7 @@ class CustomTokenAuth(ObtainAuthToken):
         user.last_action_time = timezone.now()
         user.save()
         
-        ActivityLog.objects.create(
+        log_activity(
             user=user,
             action='login',
             # description=f'{user.username} logged in from {ip_address}',
@@ -130,7 +143,7 @@ def logout_view(request):
     ip_address = request.META.get('REMOTE_ADDR', '')
     
     # Log the logout action
-    ActivityLog.objects.create(
+    log_activity(
         user=user,
         action='logout',
         description=f'{user.username} logged out',
@@ -181,7 +194,7 @@ def change_password(request):
     user.save()
     
     # Log password change
-    ActivityLog.objects.create(
+    log_activity(
         user=user,
         action='update',
         description='User changed password',
@@ -205,7 +218,7 @@ def register_applicant(request):
         user = serializer.save(role='applicant')
         token, created = Token.objects.get_or_create(user=user)
         
-        ActivityLog.objects.create(
+        log_activity(
             user=user,
             action='create',
             description='New applicant registered',
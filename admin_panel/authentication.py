@@ -0,0 +1,93 @@
+"""
+JWT authentication from token claims.
+
+Tokens issued at login carry the user's ``username``, ``role``,
+``institution_id`` and ``scope_version`` (``admin_panel.scope``). While the
+claimed version is still the user's current one, ``ClaimsJWTAuthentication``
+builds ``request.user`` from the claims without reading the ``users`` row: a
+``User`` whose other columns are deferred, and loaded together, in one
+query, the first time a view reads one of them.
+
+The scope version is bumped whenever the user's assignments, role,
+institution, status or active flag change (see ``admin_panel.scope``), so a
+token issued before such a change no longer matches. That request falls
+back to loading the row, as ``JWTAuthentication`` does, which rejects
+deleted and inactive users and picks up the new role and scope. Refreshing
+the token re-issues the claims.
+
+The version is only trusted from a cache shared by all workers
+(``admin_panel.checks``): with a per-process cache a bump made by one worker
+would not reach the others, so every request loads the row instead.
+"""
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer, TokenRefreshSerializer
+from rest_framework_simplejwt.settings import api_settings
+
+from admin_panel.checks import cache_is_shared
+from admin_panel.models import User
+from admin_panel.scope import scope_version
+
+CLAIMS = ('username', 'role', 'institution_id')
+
+
+def add_claims(token, user):
+    for claim in CLAIMS:
+        token[claim] = getattr(user, claim)
+    token['scope_version'] = scope_version(user.pk)
+    return token
+
+
+def user_from_claims(token):
+    """A ``User`` holding only the claimed fields; the rest load on first access."""
+    values = {
+        'id': token[api_settings.USER_ID_CLAIM],
+        'is_active': True,
+        **{claim: token[claim] for claim in CLAIMS},
+    }
+    # from_db() takes the values in the order of the model's fields.
+    names = [field.attname for field in User._meta.concrete_fields if field.attname in values]
+    user = User.from_db('default', names, [values[name] for name in names])
+    user._from_claims = True
+    return user
+
+
+class ClaimsJWTAuthentication(JWTAuthentication):
+    def get_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_('Token contained no recognizable user identification'))
+
+        claimed = validated_token.get('scope_version')
+        if claimed is not None and cache_is_shared() \
+                and all(claim in validated_token for claim in CLAIMS) \
+                and claimed == scope_version(user_id):
+            return user_from_claims(validated_token)
+        # Token from before a role/scope change (or without claims), or no
+        # shared cache to check the version against.
+        return super().get_user(validated_token)
+
+
+class ClaimsTokenObtainPairSerializer(TokenObtainPairSerializer):
+    @classmethod
+    def get_token(cls, user):
+        return add_claims(super().get_token(user), user)
+
+
+class ClaimsTokenRefreshSerializer(TokenRefreshSerializer):
+    """Re-issues the claims of the new access token if they are out of date."""
+
+    def validate(self, attrs):
+        data = super().validate(attrs)
+        access = self.token_class.access_token_class(data['access'], verify=False)
+        user_id = access.get(api_settings.USER_ID_CLAIM)
+        if access.get('scope_version') == scope_version(user_id):
+            return data
+
+        user = User.objects.filter(pk=user_id).first()
+        if user is None or not user.is_active:
+            raise AuthenticationFailed(_('User not found or inactive'), code='user_inactive')
+        data['access'] = str(add_claims(access, user))
+        return data
@@ -0,0 +1,208 @@
+"""
+Benchmarks of the REST hot paths, with committed budgets.
+
+Every scenario is requested through the DRF test client, the way a client
+would: each role first logs in (``POST /api/auth/login/``) and uses the JWT
+access token it gets back; ``anonymous`` sends no credentials. For each
+(scenario, role) pair the runner records:
+
+- ``status``: HTTP status of the response;
+- ``queries``: database queries of one steady-state request;
+- ``p50_ms`` / ``p95_ms``: latency over ``iterations`` timed requests;
+- ``peak_kb``: peak Python memory allocated during one request (tracemalloc).
+
+``check`` compares the results with a budgets file (``benchmarks/budgets.json``)
+and returns every exceeded budget, so a new N+1 query fails the run. Run it
+with ``python manage.py benchmark``.
+"""
+import json
+import statistics
+import time
+import tracemalloc
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext, override_settings
+from rest_framework.test import APIClient
+
+from admin_panel import audit
+from admin_panel.models import Applicant, Application, Job, User
+
+ROLES = ('super_admin', 'institution_admin', 'hr', 'hod', 'applicant', 'anonymous')
+PASSWORD = 'bench-password-1'
+USERNAME = 'bench_{}'
+
+# name -> (method, path); {job} is a published job every role can see
+SCENARIOS = {
+    'login': ('post', '/api/auth/login/'),
+    'jobs_list': ('get', '/api/jobs/'),
+    'jobs_detail': ('get', '/api/jobs/{job}/'),
+    'applications_list': ('get', '/api/applications/'),
+    'applications_statistics': ('get', '/api/applications/statistics/'),
+    'applications_search': ('get', '/api/applications/search/?q=bench+applicant'),
+    'activity_logs_list': ('get', '/api/activity-logs/'),
+}
+
+METRICS = ('queries', 'p95_ms', 'p50_ms', 'peak_kb')
+
+
+def prepare_users():
+    """
+    Create (or reset) one user per role, scoped to the department of the
+    first published job; the applicant has an Applicant profile (same
+    email) that applied to it. Returns ``(users by role, job)``.
+    """
+    job = (
+        Job.objects.filter(job_status='published', department__isnull=False)
+        .select_related('department')
+        .order_by('pk')
+        .first()
+    )
+    if job is None:
+        raise ValueError('The dataset has no published job with a department')
+
+    users = {}
+    for role in ROLES:
+        if role == 'anonymous':
+            continue
+        username = USERNAME.format(role)
+        user = User.objects.filter(username=username).first()
+        if user is None:
+            user = User(username=username, email=f'{username}@bench.example.com')
+        user.role = role
+        user.status = 'active'
+        user.institution_id = job.institution_id if role in ('institution_admin', 'hr', 'hod') else None
+        user.set_password(PASSWORD)
+        user.save()
+        user.assigned_colleges.set([job.college_id] if role == 'hr' else [])
+        user.assigned_departments.set([job.department_id] if role == 'hod' else [])
+        if role == 'applicant':
+            applicant, _ = Applicant.objects.update_or_create(
+                email=user.email,
+                defaults={'full_name': 'Bench Applicant', 'mobile_number': '9000000000'},
+            )
+            Application.objects.get_or_create(
+                job=job,
+                applicant=applicant,
+                defaults={
+                    'applicant_name': applicant.full_name,
+                    'applicant_email': applicant.email,
+                    'applicant_phone': applicant.mobile_number,
+                },
+            )
+        users[role] = user
+    return users, job
+
+
+def _request(client, scenario, role, job):
+    method, path = SCENARIOS[scenario]
+    path = path.format(job=job.pk)
+    if scenario == 'login':
+        return client.post(path, {'username': USERNAME.format(role), 'password': PASSWORD}, format='json')
+    return getattr(client, method)(path)
+
+
+def measure(client, scenario, role, job, iterations, warmup):
+    # Every request is followed by audit.flush(), outside the timed window:
+    # queued activity log writes (the login audit row) would otherwise run
+    # during the next request, and lock the in-memory SQLite test database.
+    for _ in range(warmup):
+        _request(client, scenario, role, job)
+        audit.flush()
+
+    with CaptureQueriesContext(connection) as queries:
+        response = _request(client, scenario, role, job)
+    # Read it now: the next request resets connection.queries.
+    query_count = len(queries.captured_queries)
+    audit.flush()
+    tracemalloc.start()
+    try:
+        _request(client, scenario, role, job)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    audit.flush()
+
+    timings = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        _request(client, scenario, role, job)
+        timings.append((time.perf_counter() - started) * 1000)
+        audit.flush()
+    p95 = statistics.quantiles(timings, n=20)[18] if len(timings) > 1 else timings[0]
+    return {
+        'scenario': scenario,
+        'role': role,
+        'status': response.status_code,
+        'queries': query_count,
+        'p50_ms': round(statistics.median(timings), 2),
+        'p95_ms': round(p95, 2),
+        'peak_kb': round(peak / 1024, 1),
+    }
+
+
+def run(iterations=20, warmup=2, response_cache=False, scenarios=None, roles=None):
+    """Measure every scenario for every role; returns a list of result dicts."""
+    scenarios = scenarios or list(SCENARIOS)
+    roles = roles or list(ROLES)
+    results = []
+    with override_settings(RESPONSE_CACHE={'ENABLED': response_cache}):
+        users, job = prepare_users()
+        for role in roles:
+            client = APIClient(raise_request_exception=False)
+            if role != 'anonymous':
+                response = client.post(
+                    SCENARIOS['login'][1],
+                    {'username': users[role].username, 'password': PASSWORD},
+                    format='json',
+                )
+                if response.status_code != 200:
+                    raise ValueError(f'{role} could not log in: {response.status_code}')
+                audit.flush()
+                client.credentials(HTTP_AUTHORIZATION=f'Bearer {response.data["access"]}')
+            for scenario in scenarios:
+                if scenario == 'login' and role == 'anonymous':
+                    continue
+                results.append(measure(client, scenario, role, job, iterations, warmup))
+    return results
+
+
+def load_budgets(path):
+    with open(path) as handle:
+        return json.load(handle)
+
+
+def check(results, budgets):
+    """
+    Return ``[(scenario, role, message), ...]`` for every exceeded budget.
+    A server error always fails; a client error only passes as the budgeted
+    status (e.g. 403 for a role without access).
+    """
+    failures = []
+    defaults = budgets.get('defaults', {})
+    for result in results:
+        scenario, role = result['scenario'], result['role']
+        budget = {**defaults, **budgets.get('scenarios', {}).get(scenario, {}).get(role, {})}
+        if result['status'] >= 500:
+            failures.append((scenario, role, f'server error {result["status"]}'))
+        elif result['status'] >= 400 and 'status' not in budget:
+            failures.append((scenario, role, f'status {result["status"]} not budgeted'))
+        elif 'status' in budget and result['status'] != budget['status']:
+            failures.append((scenario, role, f'status {result["status"]} != {budget["status"]}'))
+        for metric in METRICS:
+            if metric in budget and result[metric] > budget[metric]:
+                failures.append((scenario, role, f'{metric} {result[metric]} > {budget[metric]}'))
+    return failures
+
+
+def suggest_budgets(results, defaults=None):
+    """Budgets matching ``results``: exact query counts and statuses."""
+    errors = [f'{r["scenario"]} [{r["role"]}]' for r in results if r['status'] >= 500]
+    if errors:
+        raise ValueError(f'Not budgeting server errors: {", ".join(errors)}')
+    scenarios = {}
+    for result in results:
+        scenarios.setdefault(result['scenario'], {})[result['role']] = {
+            'status': result['status'],
+            'queries': result['queries'],
+        }
+    return {'defaults': defaults or {}, 'scenarios': scenarios}
@@ -0,0 +1,52 @@
+"""
+System checks.
+
+Role scope versions (``admin_panel.scope``), and with them the JWT claims
+of ``admin_panel.authentication``, live in the default cache. An
+invalidation made by one worker only reaches the others through a cache
+they all share; without one, scopes and users are read from the database on
+every request instead, which is correct but slower. The primary pins of
+read-replica routing (``admin_panel.db_router``) have no such fallback, so
+replicas are refused without a shared cache.
+"""
+from django.conf import settings
+from django.core.checks import Error, Tags, Warning, register
+
+PROCESS_LOCAL_BACKENDS = (
+    'django.core.cache.backends.locmem.LocMemCache',
+    'django.core.cache.backends.dummy.DummyCache',
+)
+
+
+def cache_is_shared(alias='default'):
+    """Whether ``alias`` is one cache for all processes (not per process)."""
+    return settings.CACHES[alias]['BACKEND'] not in PROCESS_LOCAL_BACKENDS
+
+
+@register(Tags.caches)
+def check_shared_cache(app_configs, **kwargs):
+    if cache_is_shared():
+        return []
+    return [Warning(
+        'The default cache is local to each process.',
+        hint=(
+            'Role scopes and JWT claims are then checked against the database on every '
+            'request. Set CACHE_BACKEND=redis (or file, on a single host) to cache them.'
+        ),
+        id='admin_panel.W001',
+    )]
+
+
+@register(Tags.caches)
+def check_replica_pins(app_configs, **kwargs):
+    if not getattr(settings, 'DATABASE_REPLICAS', None) or cache_is_shared():
+        return []
+    return [Error(
+        'DB_REPLICAS requires a cache shared between processes.',
+        hint=(
+            'After a write, users are pinned to the primary in the default cache; a '
+            'per-process cache only pins them on the worker that served the write. '
+            'Set CACHE_BACKEND=redis (or file, on a single host).'
+        ),
+        id='admin_panel.E002',
+    )]
@@ -0,0 +1,269 @@
+"""
+Materialized application and job counters.
+
+``ApplicationCounter`` keeps the number of applications per (job, status)
+and ``JobCounter`` the number of jobs per (college, department, status).
+Both are adjusted inside the same transaction as the row change that
+causes them:
+
+- ``Application.save`` / ``Job.save`` call ``sync_saved`` atomically;
+- deletions (including cascades) are handled by the receivers below;
+- set-based code that uses ``QuerySet.update`` must call
+  ``adjust_application_counts`` / ``adjust_job_counts`` itself.
+
+``python manage.py rebuild_counters`` recomputes both tables and can
+report drift without writing.
+
+``job_counts_changed`` is sent with the affected ``institution_ids`` after
+``JobCounter`` is adjusted, for caches built on top of the counters.
+Adjusting ``ApplicationCounter`` bumps the ``jobs`` response cache, whose
+payloads carry each job's total.
+"""
+from collections import Counter
+
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Max, OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce
+from django.db.models.signals import post_delete, pre_delete
+from django.dispatch import Signal, receiver
+from django.utils import timezone
+
+from admin_panel.models import (
+    Application, ApplicationCounter, College, Department, Job, JobCounter
+)
+from admin_panel.response_cache import invalidate
+
+APPLICATION_KEY = ('job_id', 'status')
+JOB_KEY = ('institution_id', 'college_id', 'department_id', 'job_status')
+
+job_counts_changed = Signal()
+
+
+# ---------------------------------------------------------------------------
+# Tracking row state
+# ---------------------------------------------------------------------------
+
+def remember(instance, key_fields):
+    """Record the counted key of a freshly loaded instance (if fully loaded)."""
+    deferred = instance.get_deferred_fields()
+    if any(field in deferred for field in key_fields):
+        instance.__dict__.pop('_counter_key', None)
+    else:
+        instance._counter_key = tuple(getattr(instance, f) for f in key_fields)
+
+
+def previous_key(instance, key_fields):
+    """Key under which ``instance`` is currently counted, or None if new."""
+    if instance._state.adding:
+        return None
+    if '_counter_key' in instance.__dict__:
+        return instance._counter_key
+    row = type(instance).objects.filter(pk=instance.pk).values_list(*key_fields).first()
+    return tuple(row) if row else None
+
+
+def sync_saved(instance, key_fields, previous, update_fields=None):
+    """Move ``instance`` between counter buckets after a save."""
+    if update_fields is None or previous is None:
+        current = tuple(getattr(instance, f) for f in key_fields)
+    else:
+        saved = set()
+        for name in update_fields:
+            field = instance._meta.get_field(name)
+            saved.update((field.name, field.attname))
+        current = tuple(
+            getattr(instance, f) if f in saved else previous[i]
+            for i, f in enumerate(key_fields)
+        )
+
+    if current != previous:
+        changes = Counter({current: 1})
+        if previous is not None:
+            changes[previous] -= 1
+        _adjust_for(type(instance), changes)
+    instance._counter_key = current
+
+
+def _adjust_for(model, changes):
+    if model is Application:
+        adjust_application_counts(changes)
+    else:
+        adjust_job_counts(changes)
+
+
+# ---------------------------------------------------------------------------
+# Adjusting counters
+# ---------------------------------------------------------------------------
+
+def _adjust(model, lookup, delta, lock=None, **values):
+    if not delta:
+        return
+    rows = model.objects.filter(**lookup)
+    if rows.update(count=F('count') + delta, **values) or delta < 0:
+        return
+    if lock is not None:
+        # No unique constraint covers a NULL department, so serialize the
+        # insert on the parent row and re-check before creating.
+        list(lock.select_for_update())
+        if rows.update(count=F('count') + delta, **values):
+            return
+    try:
+        with transaction.atomic():
+            model.objects.create(count=delta, **lookup, **values)
+    except IntegrityError:
+        rows.update(count=F('count') + delta, **values)
+
+
+def adjust_application_counts(changes):
+    """Apply ``{(job_id, status): delta}`` to ``ApplicationCounter``."""
+    now = timezone.now()
+    with transaction.atomic():
+        for (job_id, status), delta in sorted(changes.items()):
+            _adjust(ApplicationCounter, {'job_id': job_id, 'status': status}, delta, updated_at=now)
+    if any(changes.values()):
+        invalidate('jobs')
+
+
+def adjust_job_counts(changes):
+    """Apply ``{(institution_id, college_id, department_id, job_status): delta}``."""
+    with transaction.atomic():
+        for key, delta in sorted(changes.items(), key=lambda item: tuple(str(k) for k in item[0])):
+            institution_id, college_id, department_id, job_status = key
+            _adjust(
+                JobCounter,
+                {
+                    'institution_id': institution_id,
+                    'college_id': college_id,
+                    'department_id': department_id,
+                    'job_status': job_status,
+                },
+                delta,
+                lock=College.objects.filter(pk=college_id),
+            )
+    institution_ids = {key[0] for key, delta in changes.items() if delta}
+    if institution_ids:
+        job_counts_changed.send(sender=JobCounter, institution_ids=institution_ids)
+
+
+@receiver(post_delete, sender=Application)
+def _application_deleted(sender, instance, **kwargs):
+    key = instance.__dict__.get('_counter_key') or tuple(getattr(instance, f) for f in APPLICATION_KEY)
+    adjust_application_counts(Counter({key: -1}))
+
+
+@receiver(post_delete, sender=Job)
+def _job_deleted(sender, instance, **kwargs):
+    key = instance.__dict__.get('_counter_key') or tuple(getattr(instance, f) for f in JOB_KEY)
+    adjust_job_counts(Counter({key: -1}))
+
+
+@receiver(pre_delete, sender=Department)
+def _department_deleted(sender, instance, **kwargs):
+    # Job.department is SET_NULL (a plain UPDATE), so fold the department's
+    # counts into the college-level bucket before its rows cascade away.
+    changes = Counter()
+    for row in JobCounter.objects.filter(department=instance):
+        changes[(row.institution_id, row.college_id, None, row.job_status)] += row.count
+    adjust_job_counts(changes)
+
+
+# ---------------------------------------------------------------------------
+# Reading counters
+# ---------------------------------------------------------------------------
+
+def application_count_subquery():
+    """Annotation expression: total applications of the outer Job."""
+    totals = (
+        ApplicationCounter.objects.filter(job=OuterRef('pk'))
+        .order_by().values('job').annotate(total=Sum('count')).values('total')
+    )
+    return Coalesce(Subquery(totals), 0)
+
+
+def job_count_subquery(scope, job_status='published'):
+    """Annotation expression: jobs in ``job_status`` for the outer ``scope`` row."""
+    totals = (
+        JobCounter.objects.filter(**{scope: OuterRef('pk'), 'job_status': job_status})
+        .order_by().values(scope).annotate(total=Sum('count')).values('total')
+    )
+    return Coalesce(Subquery(totals), 0)
+
+
+def application_stamp(jobs):
+    """``(total, last adjusted)`` of the application counters of ``jobs``."""
+    stamp = ApplicationCounter.objects.filter(job__in=jobs.order_by().values('pk')).aggregate(
+        total=Sum('count'), weighted=Sum(F('count') * F('job_id')), last=Max('updated_at'),
+    )
+    # The weighted sum changes when an application moves between jobs too.
+    return f"{stamp['total'] or 0}:{stamp['weighted'] or 0}", stamp['last']
+
+
+def application_total(job_id, status=None):
+    rows = ApplicationCounter.objects.filter(job_id=job_id)
+    if status:
+        rows = rows.filter(status=status)
+    return rows.aggregate(total=Sum('count'))['total'] or 0
+
+
+def job_total(job_status='published', **scope):
+    rows = JobCounter.objects.filter(job_status=job_status, **scope)
+    return rows.aggregate(total=Sum('count'))['total'] or 0
+
+
+# ---------------------------------------------------------------------------
+# Rebuild and drift detection
+# ---------------------------------------------------------------------------
+
+def expected_counts():
+    """Recompute both counter tables from the source rows."""
+    applications = {
+        (row['job_id'], row['status']): row['n']
+        for row in Application.objects.order_by().values('job_id', 'status').annotate(n=Count('id'))
+    }
+    jobs = {
+        tuple(row[f] for f in JOB_KEY): row['n']
+        for row in Job.objects.order_by().values(*JOB_KEY).annotate(n=Count('id'))
+    }
+    return applications, jobs
+
+
+def stored_counts():
+    applications = Counter()
+    for row in ApplicationCounter.objects.values_list('job_id', 'status', 'count'):
+        applications[row[:2]] += row[2]
+    jobs = Counter()
+    for row in JobCounter.objects.values_list(*JOB_KEY, 'count'):
+        jobs[row[:4]] += row[4]
+    return applications, jobs
+
+
+def find_drift():
+    """Return ``[(table, key, expected, stored), ...]`` for every mismatch."""
+    drift = []
+    for table, expected, stored in zip(
+        ('application', 'job'), expected_counts(), stored_counts()
+    ):
+        for key in sorted(set(expected) | set(stored), key=str):
+            if expected.get(key, 0) != stored.get(key, 0):
+                drift.append((table, key, expected.get(key, 0), stored.get(key, 0)))
+    return drift
+
+
+def rebuild(batch_size=1000):
+    """Replace both counter tables with freshly computed values."""
+    applications, jobs = expected_counts()
+    with transaction.atomic():
+        ApplicationCounter.objects.all().delete()
+        JobCounter.objects.all().delete()
+        ApplicationCounter.objects.bulk_create(
+            [ApplicationCounter(job_id=job_id, status=status, count=n)
+             for (job_id, status), n in applications.items()],
+            batch_size=batch_size,
+        )
+        JobCounter.objects.bulk_create(
+            [JobCounter(**dict(zip(JOB_KEY, key)), count=n) for key, n in jobs.items()],
+            batch_size=batch_size,
+        )
+    job_counts_changed.send(sender=JobCounter, institution_ids={key[0] for key in jobs})
+    invalidate('jobs')
+    return len(applications), len(jobs)
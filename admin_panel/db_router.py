@@ -0,0 +1,80 @@
+"""
+Read-replica routing.
+
+The replicas of ``settings.DATABASE_REPLICAS`` (see ``DB_REPLICAS``) only
+serve reads made inside ``use_replicas()``: code that can tolerate
+replication lag opts in, everything else reads from and writes to
+``default``. A block uses one replica throughout, chosen at random, so its
+reads are consistent with each other. Reads inside a transaction on
+``default`` stay on ``default`` so they see that transaction's writes.
+
+``ReplicaReadMixin`` opts the safe-method requests of a viewset in. So that
+users see their own changes, ``ReplicaPinMiddleware`` pins a user to the
+primary for ``DATABASE_REPLICA_PIN_SECONDS`` after any unsafe request
+(``pin_to_primary``). Anything cached across requests (responses, the org
+tree, role scopes) is built inside ``use_primary()``, so a lagging replica
+can never be cached under a new version.
+"""
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, connections
+
+PIN_KEY = 'admin_panel:primary_pin:{}'
+
+_replica = ContextVar('admin_panel_replica', default=None)
+
+
+def replicas():
+    return list(getattr(settings, 'DATABASE_REPLICAS', ()))
+
+
+@contextmanager
+def use_replicas():
+    """Route the reads of the enclosed block to one replica (if any)."""
+    aliases = replicas()
+    token = _replica.set(random.choice(aliases) if aliases else None)
+    try:
+        yield
+    finally:
+        _replica.reset(token)
+
+
+@contextmanager
+def use_primary():
+    """Route the reads of the enclosed block to ``default``, even within ``use_replicas()``."""
+    token = _replica.set(None)
+    try:
+        yield
+    finally:
+        _replica.reset(token)
+
+
+def pin_to_primary(user_id):
+    """Read ``user_id``'s requests from the primary for the pin window."""
+    cache.set(PIN_KEY.format(user_id), 1, timeout=getattr(settings, 'DATABASE_REPLICA_PIN_SECONDS', 5))
+
+
+def pinned_to_primary(user_id):
+    return cache.get(PIN_KEY.format(user_id)) is not None
+
+
+class ReplicaRouter:
+    def db_for_read(self, model, **hints):
+        alias = _replica.get()
+        if alias is None or connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            return DEFAULT_DB_ALIAS
+        return alias
+
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Replicas hold the same rows as default.
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db == DEFAULT_DB_ALIAS
@@ -1,7 +1,10 @@
+from datetime import datetime, time, timedelta
+
 import django_filters
+from django.utils import timezone
 from .models import (
     User, Institution, College, Department, Job,
-    HRAssignment, Applicant, Application
+    HRAssignment, Applicant, Application, ActivityLog
 )
 
 
@@ -99,3 +102,44 @@ class ApplicationFilter(django_filters.FilterSet):
     class Meta:
         model = Application
         fields = ['status', 'job', 'applicant', 'applied_date']
+
+
+# Activity Log Filter
+# created_at=<date> is one day, created_at_after/created_at_before a range of
+# days. Each is a range over created_at itself, so PostgreSQL prunes to the
+# monthly partitions it spans.
+class ActivityLogFilter(django_filters.FilterSet):
+    created_at = django_filters.DateFilter(method='filter_created_on')
+    created_at_after = django_filters.DateFilter(method='filter_created_after')
+    created_at_before = django_filters.DateFilter(method='filter_created_before')
+    
+    class Meta:
+        model = ActivityLog
+        fields = ['user', 'action', 'created_at']
+    
+    def filter_created_on(self, queryset, name, value):
+        return queryset.filter(created_at__gte=day_start(value), created_at__lt=day_end(value))
+    
+    def filter_created_after(self, queryset, name, value):
+        return queryset.filter(created_at__gte=day_start(value))
+    
+    def filter_created_before(self, queryset, name, value):
+        return queryset.filter(created_at__lt=day_end(value))
+    
+    def created_range(self):
+        """``[start, end)`` of the selected days; None where open-ended."""
+        data = self.form.cleaned_data
+        starts = [day for day in (data.get('created_at'), data.get('created_at_after')) if day]
+        ends = [day for day in (data.get('created_at'), data.get('created_at_before')) if day]
+        return (
+            day_start(max(starts)) if starts else None,
+            day_end(min(ends)) if ends else None,
+        )
+
+
+def day_start(day):
+    return timezone.make_aware(datetime.combine(day, time.min))
+
+
+def day_end(day):
+    return day_start(day + timedelta(days=1))
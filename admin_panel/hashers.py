@@ -0,0 +1,26 @@
+"""
+Password hashers.
+
+``PBKDF2PasswordHasher`` is Django's PBKDF2-SHA256 hasher with the work
+factor taken from ``settings.PASSWORD_HASHER_ITERATIONS`` (env
+``PASSWORD_HASHER_ITERATIONS``; 0 keeps Django's default). It hashes under
+the same ``pbkdf2_sha256`` algorithm name, so existing hashes still verify.
+Hashes with fewer iterations than configured are re-encoded on the user's
+next login; stronger ones are kept, so a lowered setting never weakens them.
+Lower it only where logins are load-tested, never in production.
+"""
+from django.conf import settings
+from django.contrib.auth import hashers
+
+
+class PBKDF2PasswordHasher(hashers.PBKDF2PasswordHasher):
+    @property
+    def iterations(self):
+        return getattr(settings, 'PASSWORD_HASHER_ITERATIONS', 0) or super().iterations
+
+    def must_update(self, encoded):
+        # Upgrade only: Django's hasher also re-encodes hashes stronger than
+        # the configured work factor.
+        decoded = self.decode(encoded)
+        update_salt = hashers.must_update_salt(decoded['salt'], self.salt_entropy)
+        return decoded['iterations'] < self.iterations or update_salt
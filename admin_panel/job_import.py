@@ -0,0 +1,222 @@
+"""
+Bulk job import from CSV or JSON lines.
+
+Rows are read lazily and handled in batches. For each batch the
+institution, college and department codes it references are loaded into
+in-memory maps (``ImportLookups``; at most three queries per batch, and
+none for codes already seen). Each row is then validated by
+``JobImportSerializer`` without any further query and checked against the
+importing user's scope. The valid rows of a batch are inserted with one
+``bulk_create`` in their own transaction, together with their counter
+adjustment and audit entries. Invalid rows are reported with their line
+number and do not stop the import.
+
+Imported jobs are drafts created by the importing user, exactly as if they
+had been posted one by one through ``POST /api/jobs/``.
+"""
+import csv
+import json
+from collections import Counter
+from itertools import islice
+
+from django.db import transaction
+
+from admin_panel.audit import log_activities
+from admin_panel.counters import adjust_job_counts
+from admin_panel.models import College, Department, Institution, Job
+from admin_panel.scope import get_user_scope
+from admin_panel.serializers import JobImportSerializer
+
+FORMATS = ('csv', 'jsonl')
+BATCH_SIZE = 200
+# Rows accepted by the API endpoint; larger files go through the command.
+MAX_ROWS = 5000
+
+
+def detect_format(filename):
+    name = (filename or '').lower()
+    if name.endswith('.csv'):
+        return 'csv'
+    if name.endswith(('.jsonl', '.ndjson')):
+        return 'jsonl'
+    return None
+
+
+def read_rows(lines, file_format):
+    """
+    Yield ``(line number, row dict or None, error or None)`` from an
+    iterable of text lines. Empty CSV cells are left out so model defaults
+    apply.
+    """
+    if file_format == 'csv':
+        reader = csv.DictReader(lines)
+        try:
+            for row in reader:
+                data = {
+                    key.strip(): value.strip()
+                    for key, value in row.items()
+                    if key is not None and isinstance(value, str) and value.strip()
+                }
+                yield reader.line_num, data, None
+        except csv.Error as exc:
+            raise ValueError(f'Line {reader.line_num}: {exc}')
+    elif file_format == 'jsonl':
+        for number, line in enumerate(lines, 1):
+            if not line.strip():
+                continue
+            try:
+                data = json.loads(line)
+            except ValueError as exc:
+                yield number, None, f'Invalid JSON: {exc}'
+                continue
+            if not isinstance(data, dict):
+                yield number, None, 'Each line must be a JSON object.'
+                continue
+            yield number, data, None
+    else:
+        raise ValueError(f'Unsupported format {file_format!r}; use one of {", ".join(FORMATS)}')
+
+
+class ImportLookups:
+    """Code -> row maps for the institutions, colleges and departments of an import."""
+
+    def __init__(self, user):
+        self.default_institution = user.institution if user.institution_id else None
+        self._institutions = {}
+        self._colleges = {}
+        self._departments = {}
+
+    def institution(self, code):
+        return self._institutions.get(code.strip())
+
+    def college(self, institution_id, code):
+        return self._colleges.get((institution_id, code.strip()))
+
+    def department(self, college_id, code):
+        return self._departments.get((college_id, code.strip()))
+
+    def load(self, rows):
+        """Load every code referenced by ``rows`` that is not known yet."""
+        def codes(row, field):
+            return str(row.get(field) or '').strip()
+
+        missing = {codes(row, 'institution_code') for row in rows} - {''} - set(self._institutions)
+        if missing:
+            found = {
+                institution.institution_code: institution
+                for institution in Institution.objects.filter(institution_code__in=missing)
+            }
+            self._institutions.update({code: found.get(code) for code in missing})
+
+        colleges = set()
+        for row in rows:
+            code = codes(row, 'institution_code')
+            institution = self._institutions.get(code) if code else self.default_institution
+            if institution is not None and codes(row, 'college_code'):
+                colleges.add((institution.pk, codes(row, 'college_code')))
+        missing = colleges - set(self._colleges)
+        if missing:
+            found = {
+                (college.institution_id, college.college_code): college
+                for college in College.objects.filter(
+                    institution_id__in={key[0] for key in missing},
+                    college_code__in={key[1] for key in missing},
+                )
+            }
+            self._colleges.update({key: found.get(key) for key in missing})
+
+        departments = set()
+        for row in rows:
+            code = codes(row, 'institution_code')
+            institution = self._institutions.get(code) if code else self.default_institution
+            if institution is None or not codes(row, 'department_code'):
+                continue
+            college = self._colleges.get((institution.pk, codes(row, 'college_code')))
+            if college is not None:
+                departments.add((college.pk, codes(row, 'department_code')))
+        missing = departments - set(self._departments)
+        if missing:
+            found = {
+                (department.college_id, department.department_code): department
+                for department in Department.objects.filter(
+                    college_id__in={key[0] for key in missing},
+                    department_code__in={key[1] for key in missing},
+                )
+            }
+            self._departments.update({key: found.get(key) for key in missing})
+
+
+def _scope_error(user, scope, attrs):
+    """Why ``user`` may not post this job, or None."""
+    if user.role == 'super_admin':
+        return None
+    if user.role == 'institution_admin':
+        if attrs['institution'].pk != user.institution_id:
+            return 'You can only import jobs for your own institution.'
+        return None
+    if user.role == 'hr':
+        if attrs['college'].pk not in scope.college_ids:
+            return 'College is not assigned to you.'
+        return None
+    if user.role == 'hod':
+        if attrs['department'] is None or attrs['department'].pk not in scope.department_ids:
+            return 'Department is not assigned to you.'
+        return None
+    return 'You cannot create jobs.'
+
+
+def _create(jobs, user, ip_address, user_agent):
+    with transaction.atomic():
+        Job.objects.bulk_create(jobs)
+        # bulk_create skips Job.save and its signals: adjust what they would.
+        adjust_job_counts(Counter(
+            (job.institution_id, job.college_id, job.department_id, job.job_status) for job in jobs
+        ))
+        log_activities(
+            'create',
+            Job,
+            [job.pk for job in jobs],
+            description={job.pk: f'Imported job: {job.job_title}' for job in jobs},
+            user=user,
+            ip_address=ip_address,
+            user_agent=user_agent,
+        )
+
+
+def import_jobs(rows, user, batch_size=BATCH_SIZE, dry_run=False, ip_address=None, user_agent=None):
+    """
+    Validate and create jobs from ``rows`` (as yielded by ``read_rows``).
+    Returns ``{'rows', 'created', 'job_ids', 'errors'}``; each error is
+    ``{'row': line number, 'errors': {...}}``. With ``dry_run`` nothing is
+    written and ``created`` counts the rows that would be.
+    """
+    lookups = ImportLookups(user)
+    scope = get_user_scope(user) if user.role in ('hr', 'hod') else None
+    result = {'rows': 0, 'created': 0, 'job_ids': [], 'errors': []}
+    rows = iter(rows)
+    while True:
+        batch = list(islice(rows, batch_size))
+        if not batch:
+            return result
+        result['rows'] += len(batch)
+        lookups.load([data for _, data, _ in batch if data is not None])
+
+        jobs = []
+        for line, data, error in batch:
+            if error is not None:
+                result['errors'].append({'row': line, 'errors': {'non_field_errors': [error]}})
+                continue
+            serializer = JobImportSerializer(data=data, context={'lookups': lookups})
+            if not serializer.is_valid():
+                result['errors'].append({'row': line, 'errors': serializer.errors})
+                continue
+            error = _scope_error(user, scope, serializer.validated_data)
+            if error is not None:
+                result['errors'].append({'row': line, 'errors': {'non_field_errors': [error]}})
+                continue
+            jobs.append(Job(**serializer.validated_data, created_by=user, job_status='draft'))
+
+        if jobs and not dry_run:
+            _create(jobs, user, ip_address, user_agent)
+            result['job_ids'].extend(job.pk for job in jobs)
+        result['created'] += len(jobs)
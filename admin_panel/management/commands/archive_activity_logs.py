@@ -0,0 +1,72 @@
+"""
+Management command to apply the ActivityLog retention policy.
+Run with: python manage.py archive_activity_logs [--retain-months 12] [--dry-run]
+
+Creates the upcoming monthly partitions (PostgreSQL), then moves every month
+older than the retention window to a gzip JSONL archive file.
+"""
+from django.core.management.base import BaseCommand, CommandError
+from admin_panel import partitions
+import logging
+
+logger = logging.getLogger('admin_panel')
+
+
+class Command(BaseCommand):
+    help = 'Create upcoming ActivityLog partitions and archive months past the retention window'
+
+    def add_arguments(self, parser):
+        options = partitions.config()
+        parser.add_argument(
+            '--retain-months',
+            type=int,
+            default=options['RETAIN_MONTHS'],
+            help=f'Months kept in the live table, not counting the current one '
+                 f'(default: {options["RETAIN_MONTHS"]})',
+        )
+        parser.add_argument(
+            '--archive-dir',
+            default=options['ARCHIVE_DIR'],
+            help='Directory archive files are written to',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=options['BATCH_SIZE'],
+            help=f'Rows fetched/deleted per batch (default: {options["BATCH_SIZE"]})',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Only list the months that would be archived',
+        )
+
+    def handle(self, *args, **options):
+        if options['retain_months'] < 0:
+            raise CommandError('--retain-months must be zero or more')
+
+        expired = partitions.expired_months(options['retain_months'])
+        if options['dry_run']:
+            for month in expired:
+                self.stdout.write(f'Would archive {month:%Y-%m}')
+            self.stdout.write(self.style.SUCCESS(f'{len(expired)} month(s) past retention'))
+            return
+
+        for month in partitions.ensure_partitions():
+            self.stdout.write(f'Created partition {partitions.partition_name(month)}')
+
+        archived = 0
+        for month in expired:
+            archive = partitions.archive_month(
+                month, directory=options['archive_dir'], batch_size=options['batch_size']
+            )
+            if archive is None:
+                self.stdout.write(f'{month:%Y-%m}: empty, removed')
+                continue
+            archived += archive.row_count
+            self.stdout.write(f'{month:%Y-%m}: {archive.row_count} rows -> {archive.path}')
+
+        logger.info(f'Archived {archived} activity log rows from {len(expired)} month(s)')
+        self.stdout.write(
+            self.style.SUCCESS(f'Archived {archived} rows from {len(expired)} month(s)')
+        )
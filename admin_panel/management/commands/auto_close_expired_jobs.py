@@ -1,51 +1,148 @@
 """
 Management command to auto-close jobs with passed deadlines.
-Run with: python manage.py auto_close_expired_jobs
+Run with: python manage.py auto_close_expired_jobs [--dry-run] [--batch-size 500]
+
+Jobs are closed in primary-key chunks, each in its own short transaction:
+lock the chunk (skipping rows another run holds), close it with one UPDATE,
+adjust the job counters and write its audit rows in one insert. Rows that
+are no longer published are never touched, so re-runs and concurrent runs
+are safe.
 """
-from django.core.management.base import BaseCommand
+from collections import Counter
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
 from django.utils import timezone
-from admin_panel.models import Job, ActivityLog
-from django.contrib.contenttypes.models import ContentType
+from admin_panel.models import Job
+from admin_panel.audit import log_activities
+from admin_panel.counters import adjust_job_counts
 import logging
+import time
 
 logger = logging.getLogger('admin_panel')
 
 
 class Command(BaseCommand):
     help = 'Automatically close jobs with passed deadlines'
-    
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Only report the jobs that would be closed',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='Jobs closed per transaction (default: 500)',
+        )
+
+    def expired_jobs(self):
+        """Published jobs whose deadline has passed and have no selection."""
+        return Job.objects.filter(
+            job_status='published',
+            last_date__lt=timezone.now().date(),
+            selected_applicant__isnull=True
+        )
+
     def handle(self, *args, **options):
         """
         Close all published jobs where deadline has passed
         and no applicant has been selected.
         """
-        today = timezone.now().date()
-        expired_jobs = Job.objects.filter(
-            job_status='published',
-            last_date__lt=today,
-            selected_applicant__isnull=True
-        )
-        
-        closed_count = 0
-        for job in expired_jobs:
-            job.auto_close_if_deadline_passed()
-            closed_count += 1
-            
-            # Log this action
-            ActivityLog.objects.create(
-                user=None,  # System action
-                action='update',
-                content_type=ContentType.objects.get_for_model(Job),
-                object_id=job.id,
-                description=f'Auto-closed job due to deadline: {job.job_title}',
-                ip_address='0.0.0.0',  # System action
-                user_agent='auto_close_expired_jobs_command'
+        batch_size = options['batch_size']
+        if batch_size < 1:
+            raise CommandError('--batch-size must be at least 1')
+
+        started = time.monotonic()
+        if options['dry_run']:
+            jobs = self.expired_jobs().order_by('pk').values_list('pk', 'job_title', 'last_date')
+            count = 0
+            for pk, title, last_date in jobs.iterator(chunk_size=batch_size):
+                count += 1
+                if options['verbosity'] >= 2:
+                    self.stdout.write(f'Would close job {pk}: {title} (deadline {last_date})')
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f'Dry run: {count} expired jobs would be closed '
+                    f'({time.monotonic() - started:.2f}s)'
+                )
             )
-            
-            logger.info(f'Auto-closed job {job.id}: {job.job_title}')
-        
+            return
+
+        closed_count = batches = 0
+        last_pk = 0
+        while True:
+            batch_started = time.monotonic()
+            closed, last_pk = self.close_batch(last_pk, batch_size)
+            if last_pk is None:
+                break
+            batches += 1
+            closed_count += closed
+            if options['verbosity'] >= 2:
+                self.stdout.write(
+                    f'Batch {batches}: closed {closed} jobs up to id {last_pk} '
+                    f'({time.monotonic() - batch_started:.2f}s)'
+                )
+
+        elapsed = time.monotonic() - started
+        logger.info(f'Auto-closed {closed_count} expired jobs in {batches} batches ({elapsed:.2f}s)')
         self.stdout.write(
             self.style.SUCCESS(
-                f'Successfully closed {closed_count} expired jobs'
+                f'Successfully closed {closed_count} expired jobs in {batches} batches '
+                f'({elapsed:.2f}s)'
             )
         )
+
+    def close_batch(self, after_pk, batch_size):
+        """
+        Close the next chunk of expired jobs with pk > ``after_pk``.
+        Returns (jobs closed, last pk seen), or (0, None) when done.
+        """
+        with transaction.atomic():
+            rows = list(
+                self.expired_jobs()
+                .filter(pk__gt=after_pk)
+                .order_by('pk')
+                .select_for_update(skip_locked=True)
+                .values_list('pk', 'institution_id', 'college_id', 'department_id', 'job_title')
+                [:batch_size]
+            )
+            if not rows:
+                return 0, None
+
+            ids = [row[0] for row in rows]
+            last_pk = ids[-1]
+            now = timezone.now()
+            closed = Job.objects.filter(pk__in=ids, job_status='published').update(
+                job_status='closed', closed_at=now, updated_at=now
+            )
+
+            if closed != len(rows):
+                # Backends without row locks: another run may have closed
+                # some of these first; keep only the rows stamped here.
+                ours = set(Job.objects.filter(pk__in=ids, closed_at=now).values_list('pk', flat=True))
+                rows = [row for row in rows if row[0] in ours]
+
+            changes = Counter()
+            for pk, institution_id, college_id, department_id, title in rows:
+                changes[(institution_id, college_id, department_id, 'published')] -= 1
+                changes[(institution_id, college_id, department_id, 'closed')] += 1
+            adjust_job_counts(changes)
+
+            # System action: written when this chunk commits
+            log_activities(
+                'update',
+                Job,
+                [row[0] for row in rows],
+                description={
+                    pk: f'Auto-closed job due to deadline: {title}' for pk, *_, title in rows
+                },
+                user=None,
+                ip_address='0.0.0.0',
+                user_agent='auto_close_expired_jobs_command',
+                durable=True,
+            )
+
+            logger.info(f'Auto-closed {closed} jobs with ids {ids[0]}..{last_pk}')
+        return closed, last_pk
@@ -0,0 +1,137 @@
+"""
+Management command to benchmark the REST hot paths against their budgets.
+Run with: python manage.py benchmark [--iterations 20] [--keepdb] [--existing]
+
+By default a throwaway test database is created and filled with
+create_sample_data (sizes and seed below). With --existing it runs against
+the configured database as is. Fails when a result exceeds
+benchmarks/budgets.json.
+"""
+from django.conf import settings
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from admin_panel import benchmark
+from admin_panel.models import Job
+import io
+import json
+import logging
+import os
+
+logger = logging.getLogger('admin_panel')
+
+DEFAULT_BUDGETS = os.path.join(settings.BASE_DIR, 'benchmarks', 'budgets.json')
+
+
+class Command(BaseCommand):
+    help = 'Benchmark the REST hot paths per role and check query/latency/memory budgets'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--iterations', type=int, default=20, help='Timed requests per scenario (default: 20)')
+        parser.add_argument('--warmup', type=int, default=2, help='Untimed requests first (default: 2)')
+        parser.add_argument('--budgets', default=DEFAULT_BUDGETS, help='Budgets JSON file')
+        parser.add_argument(
+            '--write-budgets',
+            action='store_true',
+            help='Rewrite the query/status budgets from this run (keeps defaults)',
+        )
+        parser.add_argument('--json', dest='json_path', help='Also write the results to this file')
+        parser.add_argument('--scenario', action='append', choices=list(benchmark.SCENARIOS), help='Only these scenarios')
+        parser.add_argument('--role', action='append', choices=benchmark.ROLES, help='Only these roles')
+        parser.add_argument(
+            '--response-cache',
+            action='store_true',
+            help='Keep the response cache on (measures cache hits instead of the query path)',
+        )
+        parser.add_argument(
+            '--existing',
+            action='store_true',
+            help='Use the configured database and its data instead of a test database',
+        )
+        parser.add_argument('--keepdb', action='store_true', help='Keep (and reuse) the test database')
+        parser.add_argument('--institutions', type=int, default=20, help='Generated institutions (default: 20)')
+        parser.add_argument('--jobs', type=int, default=5000, help='Generated jobs (default: 5000)')
+        parser.add_argument('--applications', type=int, default=50000, help='Generated applications (default: 50000)')
+        parser.add_argument('--activity-logs', type=int, default=20000, help='Generated activity logs (default: 20000)')
+        parser.add_argument('--seed', type=int, default=42, help='Dataset seed (default: 42)')
+
+    def handle(self, *args, **options):
+        if options['iterations'] < 1:
+            raise CommandError('--iterations must be at least 1')
+
+        if options['existing']:
+            results = self.run(options)
+        else:
+            verbosity = max(options['verbosity'] - 1, 0)
+            old_name = connection.creation.create_test_db(
+                verbosity=verbosity, autoclobber=True, keepdb=options['keepdb']
+            )
+            try:
+                if not Job.objects.exists():
+                    self.stdout.write('Generating the benchmark dataset...')
+                    call_command(
+                        'create_sample_data',
+                        institutions=options['institutions'],
+                        jobs=options['jobs'],
+                        applications=options['applications'],
+                        activity_logs=options['activity_logs'],
+                        seed=options['seed'],
+                        prefix='BENCH',
+                        skip_search_index=True,
+                        stdout=self.stdout if options['verbosity'] > 1 else io.StringIO(),
+                    )
+                results = self.run(options)
+            finally:
+                if not options['keepdb']:
+                    connection.creation.destroy_test_db(old_name, verbosity=verbosity)
+
+        self.report(results)
+        if options['json_path']:
+            with open(options['json_path'], 'w') as handle:
+                json.dump(results, handle, indent=2)
+
+        budgets = benchmark.load_budgets(options['budgets']) if os.path.exists(options['budgets']) else {}
+        if options['write_budgets']:
+            try:
+                budgets = benchmark.suggest_budgets(results, budgets.get('defaults'))
+            except ValueError as exc:
+                raise CommandError(str(exc))
+            os.makedirs(os.path.dirname(os.path.abspath(options['budgets'])), exist_ok=True)
+            with open(options['budgets'], 'w') as handle:
+                json.dump(budgets, handle, indent=2)
+                handle.write('\n')
+            self.stdout.write(self.style.SUCCESS(f'Wrote budgets to {options["budgets"]}'))
+            return
+
+        if not budgets:
+            self.stdout.write(self.style.WARNING(f'No budgets at {options["budgets"]}; nothing checked'))
+            return
+        failures = benchmark.check(results, budgets)
+        for scenario, role, message in failures:
+            self.stderr.write(f'{scenario} [{role}]: {message}')
+        if failures:
+            logger.warning(f'Benchmark: {len(failures)} budget(s) exceeded')
+            raise CommandError(f'{len(failures)} budget(s) exceeded')
+        self.stdout.write(self.style.SUCCESS(f'All {len(results)} results within budget'))
+
+    def run(self, options):
+        try:
+            return benchmark.run(
+                iterations=options['iterations'],
+                warmup=options['warmup'],
+                response_cache=options['response_cache'],
+                scenarios=options['scenario'],
+                roles=options['role'],
+            )
+        except ValueError as exc:
+            raise CommandError(str(exc))
+
+    def report(self, results):
+        header = f'{"scenario":<26}{"role":<19}{"status":>6}{"queries":>9}{"p50 ms":>10}{"p95 ms":>10}{"peak KB":>10}'
+        self.stdout.write(header)
+        self.stdout.write('-' * len(header))
+        for r in results:
+            self.stdout.write(
+                f'{r["scenario"]:<26}{r["role"]:<19}{r["status"]:>6}{r["queries"]:>9}'
+                f'{r["p50_ms"]:>10.2f}{r["p95_ms"]:>10.2f}{r["peak_kb"]:>10.1f}'
+            )
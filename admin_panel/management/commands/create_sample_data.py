@@ -1,140 +1,294 @@
 """
 Management command to create sample institutions, colleges, and departments.
 Run with: python manage.py create_sample_data
+
+With --institutions it generates synthetic data at benchmark scale instead:
+    python manage.py create_sample_data --institutions 10000 --jobs 1000000 --applications 10000000
+
+Every row is derived from --seed and its position, so the same arguments
+always produce the same data. Rows are inserted with bulk_create in
+batches of --batch-size, each batch in its own transaction, and the job and
+application counters are written alongside instead of being rebuilt.
+Applications, by far the largest table, skip bulk_create's per-field
+preparation and are inserted as plain multi-row INSERTs.
+Staff users (one institution admin per institution, one HR per college, one
+HOD per department) get the password given by --password.
 """
-from django.core.management.base import BaseCommand
-from admin_panel.models import Institution, College, Department
+from array import array
+from collections import Counter
+from datetime import date, timedelta
+from django.contrib.auth.hashers import make_password
+from django.contrib.contenttypes.models import ContentType
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.utils import timezone
+from rest_framework.authtoken.models import Token
+from admin_panel import applicant_search
+from admin_panel.models import (
+    Institution, College, Department, Job, JobCounter, Applicant, Application,
+    ApplicationCounter, ActivityLog, User
+)
+from admin_panel.response_cache import invalidate
+import logging
+import random
+import time
+
+logger = logging.getLogger('admin_panel')
+
+INSTITUTIONS_DATA = [
+    {
+        'institution_name': 'Anna University',
+        'institution_code': 'ANNA',
+        'institution_email': 'admin@annauniv.edu.in',
+        'institution_phone': '044-12345678',
+        'address': 'Chennai'
+    },
+    {
+        'institution_name': 'Madras University',
+        'institution_code': 'MADRAS',
+        'institution_email': 'admin@madrasuniv.edu.in',
+        'institution_phone': '044-87654321',
+        'address': 'Guindy, Chennai'
+    },
+    {
+        'institution_name': 'SASTRA University',
+        'institution_code': 'SASTRA',
+        'institution_email': 'admin@sastra.edu.in',
+        'institution_phone': '04362-264101',
+        'address': 'Thanjavur'
+    }
+]
+
+# Colleges per institution code, departments per (institution code, college code)
+COLLEGES_DATA = {
+    'ANNA': [
+        {'college_name': 'College of Engineering', 'college_code': 'COE'},
+        {'college_name': 'College of Arts', 'college_code': 'COA'},
+        {'college_name': 'College of Science', 'college_code': 'COS'},
+    ],
+    'MADRAS': [
+        {'college_name': 'Engineering College', 'college_code': 'ENG'},
+        {'college_name': 'Arts College', 'college_code': 'ART'},
+    ],
+    'SASTRA': [
+        {'college_name': 'School of Engineering', 'college_code': 'SOE'},
+        {'college_name': 'School of Law', 'college_code': 'SOL'},
+    ]
+}
+
+DEPARTMENTS_DATA = {
+    ('ANNA', 'COE'): [
+        {'department_name': 'Computer Science', 'department_code': 'CSE'},
+        {'department_name': 'Electrical Engineering', 'department_code': 'EEE'},
+        {'department_name': 'Mechanical Engineering', 'department_code': 'MECH'},
+        {'department_name': 'Civil Engineering', 'department_code': 'CIVIL'},
+    ],
+    ('ANNA', 'COA'): [
+        {'department_name': 'English', 'department_code': 'ENG'},
+        {'department_name': 'Tamil', 'department_code': 'TAM'},
+        {'department_name': 'History', 'department_code': 'HIST'},
+    ],
+    ('ANNA', 'COS'): [
+        {'department_name': 'Physics', 'department_code': 'PHY'},
+        {'department_name': 'Chemistry', 'department_code': 'CHEM'},
+        {'department_name': 'Botany', 'department_code': 'BOT'},
+    ],
+    ('MADRAS', 'ENG'): [
+        {'department_name': 'Computer Science', 'department_code': 'CSE'},
+        {'department_name': 'Electronics', 'department_code': 'ECE'},
+    ],
+    ('MADRAS', 'ART'): [
+        {'department_name': 'Economics', 'department_code': 'ECO'},
+        {'department_name': 'Political Science', 'department_code': 'POLI'},
+    ],
+    ('SASTRA', 'SOE'): [
+        {'department_name': 'Computer Science', 'department_code': 'CSE'},
+        {'department_name': 'Information Technology', 'department_code': 'IT'},
+    ],
+    ('SASTRA', 'SOL'): [
+        {'department_name': 'Constitutional Law', 'department_code': 'CON'},
+        {'department_name': 'Criminal Law', 'department_code': 'CRIM'},
+    ]
+}
+
+# Vocabulary for synthetic rows
+CITIES = [
+    'Chennai', 'Madurai', 'Coimbatore', 'Trichy', 'Salem', 'Tirunelveli', 'Vellore',
+    'Erode', 'Thanjavur', 'Bengaluru', 'Hyderabad', 'Pune', 'Mumbai', 'Delhi', 'Kolkata',
+]
+COLLEGE_TYPES = [
+    ('Engineering', 'ENG'), ('Arts', 'ART'), ('Science', 'SCI'), ('Law', 'LAW'),
+    ('Management', 'MGT'), ('Medicine', 'MED'), ('Education', 'EDU'), ('Architecture', 'ARC'),
+]
+SUBJECTS = [
+    ('Computer Science', 'CSE'), ('Electronics', 'ECE'), ('Mechanical Engineering', 'MECH'),
+    ('Civil Engineering', 'CIVIL'), ('Physics', 'PHY'), ('Chemistry', 'CHEM'),
+    ('Mathematics', 'MATH'), ('English', 'ENG'), ('Tamil', 'TAM'), ('History', 'HIST'),
+    ('Economics', 'ECO'), ('Commerce', 'COM'), ('Botany', 'BOT'), ('Zoology', 'ZOO'),
+]
+POSITIONS = ['Assistant Professor', 'Associate Professor', 'Professor', 'Lecturer', 'Guest Faculty']
+QUALIFICATIONS = ['PhD', 'M.Tech', 'M.E.', 'M.Sc', 'M.A.', 'MBA', 'NET/SET']
+FIRST_NAMES = [
+    'Arun', 'Priya', 'Karthik', 'Divya', 'Suresh', 'Lakshmi', 'Vijay', 'Meena', 'Rajesh',
+    'Anitha', 'Ganesh', 'Kavya', 'Prakash', 'Deepa', 'Senthil', 'Revathi', 'Ashok', 'Nithya',
+]
+LAST_NAMES = [
+    'Kumar', 'Raman', 'Subramanian', 'Iyer', 'Natarajan', 'Krishnan', 'Pillai', 'Reddy',
+    'Sharma', 'Nair', 'Menon', 'Rao', 'Murugan', 'Selvam', 'Balaji', 'Shankar',
+]
+
+JOB_STATUS_WEIGHTS = {'published': 50, 'closed': 20, 'draft': 12, 'pending_approval': 10, 'archived': 8}
+APPLICATION_STATUS_WEIGHTS = {
+    'submitted': 45, 'under_review': 25, 'interviewing': 10, 'shortlisted': 8, 'rejected': 11, 'selected': 1,
+}
+# Only jobs that were published at some point receive applications
+OPEN_STATUSES = ('published', 'closed', 'archived')
 
 
 class Command(BaseCommand):
-    help = 'Create sample institutions, colleges, and departments'
-    
+    help = 'Create sample institutions, colleges, and departments (or synthetic data at scale)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--institutions',
+            type=int,
+            default=0,
+            help='Generate this many synthetic institutions instead of the sample ones',
+        )
+        parser.add_argument(
+            '--colleges-per-institution',
+            type=int,
+            default=3,
+            help='Colleges per synthetic institution (default: 3)',
+        )
+        parser.add_argument(
+            '--departments-per-college',
+            type=int,
+            default=4,
+            help='Departments per synthetic college (default: 4)',
+        )
+        parser.add_argument(
+            '--jobs',
+            type=int,
+            default=0,
+            help='Synthetic jobs, spread over the departments',
+        )
+        parser.add_argument(
+            '--applications',
+            type=int,
+            default=0,
+            help='Synthetic applications, spread over published/closed/archived jobs',
+        )
+        parser.add_argument(
+            '--applicants',
+            type=int,
+            help='Synthetic applicants (default: one per five applications)',
+        )
+        parser.add_argument(
+            '--activity-logs',
+            type=int,
+            default=0,
+            help='Synthetic activity log entries over the last 180 days',
+        )
+        parser.add_argument(
+            '--seed',
+            type=int,
+            default=42,
+            help='Random seed; the same seed and sizes give the same data (default: 42)',
+        )
+        parser.add_argument(
+            '--prefix',
+            default='SYN',
+            help='Prefix of synthetic codes, usernames and emails (default: SYN)',
+        )
+        parser.add_argument(
+            '--password',
+            default='password123',
+            help='Password of the synthetic staff users (default: password123)',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=5000,
+            help='Rows per bulk_create / transaction (default: 5000)',
+        )
+        parser.add_argument(
+            '--skip-search-index',
+            action='store_true',
+            help='Do not index synthetic applicants (run rebuild_applicant_search later)',
+        )
+
     def handle(self, *args, **options):
         """Create sample data"""
-        
-        # Create Institutions
-        institutions_data = [
-            {
-                'institution_name': 'Anna University',
-                'institution_code': 'ANNA',
-                'institution_email': 'admin@annauniv.edu.in',
-                'institution_phone': '044-12345678',
-                'address': 'Chennai'
-            },
-            {
-                'institution_name': 'Madras University',
-                'institution_code': 'MADRAS',
-                'institution_email': 'admin@madrasuniv.edu.in',
-                'institution_phone': '044-87654321',
-                'address': 'Guindy, Chennai'
-            },
-            {
-                'institution_name': 'SASTRA University',
-                'institution_code': 'SASTRA',
-                'institution_email': 'admin@sastra.edu.in',
-                'institution_phone': '04362-264101',
-                'address': 'Thanjavur'
-            }
-        ]
-        
-        institutions = {}
-        for inst_data in institutions_data:
-            inst, created = Institution.objects.get_or_create(**inst_data)
-            institutions[inst.id] = inst
-            status = "Created" if created else "Already exists"
-            self.stdout.write(self.style.SUCCESS(f'✓ Institution: {inst.institution_name} - {status}'))
-        
+        if options['institutions'] > 0:
+            return self.generate(options)
+        if options['jobs'] or options['applications']:
+            raise CommandError('--jobs and --applications need --institutions')
+        self.create_samples()
+
+    # ------------------------------------------------------------------
+    # Sample institutions (default)
+    # ------------------------------------------------------------------
+
+    def create_samples(self):
+        codes = [data['institution_code'] for data in INSTITUTIONS_DATA]
+        existing = {i.institution_code: i for i in Institution.objects.filter(institution_code__in=codes)}
+        Institution.objects.bulk_create(
+            [Institution(**data) for data in INSTITUTIONS_DATA if data['institution_code'] not in existing]
+        )
+        institutions = {i.institution_code: i for i in Institution.objects.filter(institution_code__in=codes)}
+        for code in codes:
+            status = "Already exists" if code in existing else "Created"
+            self.stdout.write(
+                self.style.SUCCESS(f'✓ Institution: {institutions[code].institution_name} - {status}')
+            )
+
         # Create Colleges for each institution
-        colleges_data = {
-            1: [
-                {'college_name': 'College of Engineering', 'college_code': 'COE'},
-                {'college_name': 'College of Arts', 'college_code': 'COA'},
-                {'college_name': 'College of Science', 'college_code': 'COS'},
-            ],
-            2: [
-                {'college_name': 'Engineering College', 'college_code': 'ENG'},
-                {'college_name': 'Arts College', 'college_code': 'ART'},
-            ],
-            3: [
-                {'college_name': 'School of Engineering', 'college_code': 'SOE'},
-                {'college_name': 'School of Law', 'college_code': 'SOL'},
-            ]
+        existing = {
+            (c.institution_id, c.college_name): c
+            for c in College.objects.filter(institution__in=institutions.values())
         }
-        
+        new = [
+            College(institution=institutions[code], **data)
+            for code, colleges_list in COLLEGES_DATA.items()
+            for data in colleges_list
+            if (institutions[code].pk, data['college_name']) not in existing
+        ]
+        College.objects.bulk_create(new)
         colleges = {}
-        for inst_id, colleges_list in colleges_data.items():
-            institution = Institution.objects.get(id=inst_id)
-            for college_data in colleges_list:
-                college_data['institution'] = institution
-                college, created = College.objects.get_or_create(
-                    college_name=college_data['college_name'],
-                    institution=institution,
-                    defaults={'college_code': college_data['college_code']}
-                )
-                colleges[college.id] = college
-                status = "Created" if created else "Already exists"
+        for college in College.objects.filter(institution__in=institutions.values()).select_related('institution'):
+            colleges[(college.institution.institution_code, college.college_code)] = college
+        for code, colleges_list in COLLEGES_DATA.items():
+            for data in colleges_list:
+                college = colleges[(code, data['college_code'])]
+                status = "Already exists" if (college.institution_id, college.college_name) in existing else "Created"
                 self.stdout.write(
                     self.style.SUCCESS(
-                        f'  ✓ College: {college.college_name} ({institution.institution_name}) - {status}'
+                        f'  ✓ College: {college.college_name} ({college.institution.institution_name}) - {status}'
                     )
                 )
-        
+
         # Create Departments for each college
-        departments_data = {
-            1: [  # College of Engineering
-                {'department_name': 'Computer Science', 'department_code': 'CSE'},
-                {'department_name': 'Electrical Engineering', 'department_code': 'EEE'},
-                {'department_name': 'Mechanical Engineering', 'department_code': 'MECH'},
-                {'department_name': 'Civil Engineering', 'department_code': 'CIVIL'},
-            ],
-            2: [  # College of Arts
-                {'department_name': 'English', 'department_code': 'ENG'},
-                {'department_name': 'Tamil', 'department_code': 'TAM'},
-                {'department_name': 'History', 'department_code': 'HIST'},
-            ],
-            3: [  # College of Science
-                {'department_name': 'Physics', 'department_code': 'PHY'},
-                {'department_name': 'Chemistry', 'department_code': 'CHEM'},
-                {'department_name': 'Botany', 'department_code': 'BOT'},
-            ],
-            4: [  # Engineering College (Madras Univ)
-                {'department_name': 'Computer Science', 'department_code': 'CSE'},
-                {'department_name': 'Electronics', 'department_code': 'ECE'},
-            ],
-            5: [  # Arts College (Madras Univ)
-                {'department_name': 'Economics', 'department_code': 'ECO'},
-                {'department_name': 'Political Science', 'department_code': 'POLI'},
-            ],
-            6: [  # School of Engineering (SASTRA)
-                {'department_name': 'Computer Science', 'department_code': 'CSE'},
-                {'department_name': 'Information Technology', 'department_code': 'IT'},
-            ],
-            7: [  # School of Law (SASTRA)
-                {'department_name': 'Constitutional Law', 'department_code': 'CON'},
-                {'department_name': 'Criminal Law', 'department_code': 'CRIM'},
-            ]
+        existing = {
+            (d.college_id, d.department_name)
+            for d in Department.objects.filter(college__in=colleges.values())
         }
-        
-        for college_id, departments_list in departments_data.items():
-            college = College.objects.get(id=college_id)
-            for dept_data in departments_list:
-                dept, created = Department.objects.get_or_create(
-                    department_name=dept_data['department_name'],
-                    college=college,
-                    defaults={
-                        'department_code': dept_data['department_code'],
-                        'institution': college.institution
-                    }
-                )
-                status = "Created" if created else "Already exists"
+        new = []
+        for key, departments_list in DEPARTMENTS_DATA.items():
+            college = colleges[key]
+            for data in departments_list:
+                status = "Already exists" if (college.pk, data['department_name']) in existing else "Created"
+                if status == "Created":
+                    new.append(Department(college=college, institution_id=college.institution_id, **data))
                 self.stdout.write(
                     self.style.SUCCESS(
-                        f'    ✓ Department: {dept.department_name} ({dept.department_code}) - {status}'
+                        f'    ✓ Department: {data["department_name"]} ({data["department_code"]}) - {status}'
                     )
                 )
-        
+        Department.objects.bulk_create(new)
+
         self.stdout.write(self.style.SUCCESS('\n✅ Sample data creation completed!'))
-        
+
         # Print summary
         self.stdout.write('\n' + self.style.WARNING('=== Summary ==='))
         self.stdout.write(f'Institutions: {Institution.objects.count()}')
@@ -144,3 +298,360 @@ class Command(BaseCommand):
         self.stdout.write('1. Create users (HOD, HR, Admin) with these institutions/colleges/departments')
         self.stdout.write('2. Login with admin credentials')
         self.stdout.write('3. Assign users to institutions and departments')
+
+    # ------------------------------------------------------------------
+    # Synthetic data (--institutions)
+    # ------------------------------------------------------------------
+
+    def generate(self, options):
+        for name in ('colleges_per_institution', 'departments_per_college', 'batch_size'):
+            if options[name] < 1:
+                raise CommandError(f'--{name.replace("_", "-")} must be at least 1')
+        prefix = options['prefix'].upper()
+        if Institution.objects.filter(institution_code__startswith=f'{prefix}-').exists():
+            raise CommandError(f'Synthetic data with prefix {prefix} already exists; use another --prefix')
+        self.prefix = prefix
+        self.batch_size = options['batch_size']
+        self.rng = random.Random(options['seed'])
+        started = time.monotonic()
+
+        departments = self.generate_organizations(options)
+        hods = self.generate_staff(options['password'], departments)
+        job_ids, job_statuses = self.generate_jobs(options['jobs'], departments, hods)
+        per_job = self.plan_applications(options['applications'], job_statuses)
+        applicants = options['applicants']
+        if applicants is None:
+            # One per five applications, and enough for the busiest job
+            applicants = max(options['applications'] // 5, max(per_job.values(), default=0))
+        applicant_ids = self.generate_applicants(applicants, not options['skip_search_index'])
+        applications = self.generate_applications(per_job, job_ids, applicant_ids)
+        activity_logs = self.generate_activity_logs(options['activity_logs'], job_ids)
+        invalidate('jobs')
+
+        elapsed = time.monotonic() - started
+        summary = (
+            f'{options["institutions"]} institutions, {len(departments)} departments, '
+            f'{len(job_ids)} jobs, {len(applicant_ids)} applicants, {applications} applications, '
+            f'{activity_logs} activity logs'
+        )
+        logger.info(f'Generated synthetic data ({prefix}, seed {options["seed"]}): {summary} in {elapsed:.1f}s')
+        self.stdout.write(self.style.SUCCESS(f'✅ Generated {summary} in {elapsed:.1f}s'))
+
+    def step(self, label, count, started):
+        self.stdout.write(f'  {label}: {count} ({time.monotonic() - started:.1f}s)')
+
+    def batches(self, rows):
+        """Split an iterable into lists of batch_size."""
+        batch = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) == self.batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def generate_organizations(self, options):
+        """Create institutions, colleges and departments; returns [(department, college, institution) ids]."""
+        started = time.monotonic()
+        rng, prefix = self.rng, self.prefix
+
+        def institutions():
+            for i in range(options['institutions']):
+                city = rng.choice(CITIES)
+                yield Institution(
+                    institution_name=f'{city} University {i + 1}',
+                    institution_code=f'{prefix}-{i + 1:05d}',
+                    institution_email=f'admin{i + 1}@{prefix.lower()}.example.edu',
+                    institution_phone=f'044-{rng.randrange(10 ** 7, 10 ** 8)}',
+                    address=city,
+                )
+
+        institution_ids = []
+        for batch in self.batches(institutions()):
+            with transaction.atomic():
+                Institution.objects.bulk_create(batch)
+            institution_ids.extend(institution.pk for institution in batch)
+
+        def colleges():
+            for institution_id in institution_ids:
+                for kind, code in rng.sample(COLLEGE_TYPES, min(options['colleges_per_institution'], len(COLLEGE_TYPES))):
+                    yield College(college_name=f'College of {kind}', college_code=code, institution_id=institution_id)
+                for n in range(len(COLLEGE_TYPES), options['colleges_per_institution']):
+                    yield College(college_name=f'College {n + 1}', college_code=f'C{n + 1}', institution_id=institution_id)
+
+        college_ids = []
+        for batch in self.batches(colleges()):
+            with transaction.atomic():
+                College.objects.bulk_create(batch)
+            college_ids.extend((college.pk, college.institution_id) for college in batch)
+
+        def departments():
+            for college_id, institution_id in college_ids:
+                for name, code in rng.sample(SUBJECTS, min(options['departments_per_college'], len(SUBJECTS))):
+                    yield Department(
+                        department_name=name, department_code=code,
+                        college_id=college_id, institution_id=institution_id,
+                    )
+                for n in range(len(SUBJECTS), options['departments_per_college']):
+                    yield Department(
+                        department_name=f'Department {n + 1}', department_code=f'D{n + 1}',
+                        college_id=college_id, institution_id=institution_id,
+                    )
+
+        department_ids = []
+        for batch in self.batches(departments()):
+            with transaction.atomic():
+                Department.objects.bulk_create(batch)
+            department_ids.extend((d.pk, d.college_id, d.institution_id) for d in batch)
+
+        self.college_ids = college_ids
+        self.step('organizations', len(institution_ids) + len(college_ids) + len(department_ids), started)
+        return department_ids
+
+    def generate_staff(self, password, departments):
+        """One institution admin per institution, HR per college, HOD per department; returns {department id: HOD id}."""
+        started = time.monotonic()
+        prefix = self.prefix.lower()
+        password = make_password(password)
+
+        def users():
+            institution_ids = dict.fromkeys(institution_id for _, institution_id in self.college_ids)
+            for institution_id in institution_ids:
+                yield 'institution_admin', institution_id, None, institution_id
+            for college_id, institution_id in self.college_ids:
+                yield 'hr', college_id, None, institution_id
+            for department_id, _, institution_id in departments:
+                yield 'hod', None, department_id, institution_id
+
+        hods = {}
+        count = 0
+        assigned_colleges = User.assigned_colleges.through
+        assigned_departments = User.assigned_departments.through
+        for batch in self.batches(users()):
+            rows = []
+            for role, college_id, department_id, institution_id in batch:
+                key = college_id or department_id or institution_id
+                username = f'{prefix}_{role}_{key}'
+                rows.append(User(
+                    username=username, email=f'{username}@{prefix}.example.edu', password=password,
+                    role=role, institution_id=institution_id, first_name=role.replace('_', ' ').title(),
+                    last_name=str(key),
+                ))
+            with transaction.atomic():
+                User.objects.bulk_create(rows)
+                Token.objects.bulk_create([Token(user=user, key=Token.generate_key()) for user in rows])
+                assigned_colleges.objects.bulk_create([
+                    assigned_colleges(user_id=user.pk, college_id=college_id)
+                    for user, (role, college_id, _, _) in zip(rows, batch) if role == 'hr'
+                ])
+                assigned_departments.objects.bulk_create([
+                    assigned_departments(user_id=user.pk, department_id=department_id)
+                    for user, (role, _, department_id, _) in zip(rows, batch) if role == 'hod'
+                ])
+            hods.update({department_id: user.pk for user, (role, _, department_id, _) in zip(rows, batch) if role == 'hod'})
+            count += len(rows)
+        self.step('staff users', count, started)
+        return hods
+
+    def generate_jobs(self, total, departments, hods):
+        """Create jobs and their JobCounter rows; returns (job ids, status per job)."""
+        if not total:
+            return array('q'), []
+        started = time.monotonic()
+        rng = self.rng
+        statuses, weights = list(JOB_STATUS_WEIGHTS), list(JOB_STATUS_WEIGHTS.values())
+        today = date.today()
+
+        def jobs():
+            for n in range(total):
+                department_id, college_id, institution_id = departments[rng.randrange(len(departments))]
+                job_status = rng.choices(statuses, weights)[0]
+                position, subject = rng.choice(POSITIONS), rng.choice(SUBJECTS)[0]
+                if job_status in ('closed', 'archived'):
+                    last_date = today - timedelta(days=rng.randrange(1, 365))
+                else:
+                    last_date = today + timedelta(days=rng.randrange(1, 120))
+                yield Job(
+                    job_title=f'{position} - {subject}',
+                    job_description=f'{position} in {subject}. Teaching, research and mentoring (#{n + 1}).',
+                    institution_id=institution_id, college_id=college_id, department_id=department_id,
+                    job_type=rng.choice(('full_time', 'full_time', 'full_time', 'part_time', 'contract')),
+                    experience_required=f'{rng.randrange(0, 15)} years',
+                    qualification=rng.choice(QUALIFICATIONS),
+                    last_date=last_date,
+                    salary_range=f'{rng.randrange(4, 20)}-{rng.randrange(20, 40)} LPA',
+                    job_status=job_status,
+                    priority=rng.choice(('low', 'medium', 'medium', 'high', 'urgent')),
+                    created_by_id=hods.get(department_id),
+                )
+
+        job_ids, job_statuses = array('q'), []
+        counts = Counter()
+        for batch in self.batches(jobs()):
+            with transaction.atomic():
+                Job.objects.bulk_create(batch)
+            for job in batch:
+                job_ids.append(job.pk)
+                job_statuses.append(job.job_status)
+                counts[(job.institution_id, job.college_id, job.department_id, job.job_status)] += 1
+        # The departments are new, so their counters can be inserted outright.
+        for batch in self.batches(counts.items()):
+            JobCounter.objects.bulk_create([
+                JobCounter(institution_id=i, college_id=c, department_id=d, job_status=s, count=n)
+                for (i, c, d, s), n in batch
+            ])
+        self.step('jobs', len(job_ids), started)
+        return job_ids, job_statuses
+
+    def applicant_fields(self, n):
+        """Name, email and phone of synthetic applicant ``n`` (no randomness needed)."""
+        first = FIRST_NAMES[n % len(FIRST_NAMES)]
+        last = LAST_NAMES[(n // len(FIRST_NAMES)) % len(LAST_NAMES)]
+        return f'{first} {last}', f'{self.prefix.lower()}.applicant{n + 1}@example.com', f'9{n:09d}'[-10:]
+
+    def generate_applicants(self, total, index):
+        if not total:
+            return array('q')
+        started = time.monotonic()
+        rng = self.rng
+
+        def applicants():
+            for n in range(total):
+                name, email, phone = self.applicant_fields(n)
+                yield Applicant(
+                    full_name=name, email=email, mobile_number=phone,
+                    current_location=rng.choice(CITIES),
+                    education_qualification=rng.choice(QUALIFICATIONS),
+                    education_specialization=rng.choice(SUBJECTS)[0],
+                    education_year_of_passing=rng.randrange(1990, 2025),
+                )
+
+        applicant_ids = array('q')
+        for batch in self.batches(applicants()):
+            with transaction.atomic():
+                Applicant.objects.bulk_create(batch)
+                if index:
+                    applicant_search.refresh(batch, batch_size=self.batch_size)
+            applicant_ids.extend(applicant.pk for applicant in batch)
+        self.step('applicants', len(applicant_ids), started)
+        return applicant_ids
+
+    def plan_applications(self, total, job_statuses):
+        """Number of applications per job index, drawn over the jobs that were ever open."""
+        if not total:
+            return Counter()
+        open_jobs = [n for n, job_status in enumerate(job_statuses) if job_status in OPEN_STATUSES]
+        if not open_jobs:
+            raise CommandError('--applications needs --jobs with at least one published job')
+        return Counter(self.rng.choices(open_jobs, k=total))
+
+    def generate_applications(self, per_job, job_ids, applicant_ids):
+        """Create applications and their ApplicationCounter rows; returns the number created."""
+        if not per_job:
+            return 0
+        # (job, applicant) is unique, so a job has at most one application
+        # per applicant.
+        overflow = max(per_job.values()) - len(applicant_ids)
+        if overflow > 0:
+            raise CommandError(f'Not enough applicants: raise --applicants by at least {overflow}')
+        started = time.monotonic()
+        rng = self.rng
+        statuses, weights = list(APPLICATION_STATUS_WEIGHTS), list(APPLICATION_STATUS_WEIGHTS.values())
+
+        columns = (
+            'job', 'applicant', 'applicant_name', 'applicant_email', 'applicant_phone', 'status',
+            'applied_date', 'created_at', 'updated_at', 'submission_email_sent',
+            'interview_email_sent', 'rejection_email_sent', 'selection_email_sent',
+        )
+        now = connection.ops.adapt_datetimefield_value(timezone.now())
+
+        def applications():
+            for n in sorted(per_job):
+                job_id = job_ids[n]
+                picked = rng.sample(range(len(applicant_ids)), per_job[n])
+                for index, status in zip(picked, rng.choices(statuses, weights, k=len(picked))):
+                    name, email, phone = self.applicant_fields(index)
+                    yield (
+                        job_id, applicant_ids[index], name, email, phone, status,
+                        now, now, now, False, False, False, False,
+                    )
+
+        created = 0
+        counts = Counter()
+        for batch in self.batches(applications()):
+            for row in batch:
+                counts[(row[0], row[5])] += 1
+            # Applications arrive in job order: every job but the last one
+            # of the batch is complete, so its counters can be written now.
+            last_job = batch[-1][0]
+            done = {key: counts.pop(key) for key in [key for key in counts if key[0] != last_job]}
+            with transaction.atomic():
+                self.insert_rows(Application, columns, batch)
+                self.write_application_counters(done)
+            created += len(batch)
+        self.write_application_counters(counts)
+        self.step('applications', created, started)
+        return created
+
+    def write_application_counters(self, counts):
+        ApplicationCounter.objects.bulk_create(
+            [ApplicationCounter(job_id=job_id, status=status, count=n) for (job_id, status), n in counts.items()],
+            batch_size=self.batch_size,
+        )
+
+    def generate_activity_logs(self, total, job_ids):
+        """Job create/update/approve entries by the synthetic staff, oldest first."""
+        if not total:
+            return 0
+        if not job_ids:
+            raise CommandError('--activity-logs needs --jobs')
+        started = time.monotonic()
+        rng = self.rng
+        content_type_id = ContentType.objects.get_for_model(Job).pk
+        user_ids = list(
+            User.objects.filter(username__startswith=f'{self.prefix.lower()}_')
+            .order_by('pk').values_list('pk', flat=True)
+        )
+        now = timezone.now()
+        offsets = sorted((rng.randrange(180 * 24 * 3600) for _ in range(total)), reverse=True)
+
+        def entries():
+            for offset in offsets:
+                action = rng.choice(('create', 'update', 'update', 'approve'))
+                job_id = job_ids[rng.randrange(len(job_ids))]
+                yield ActivityLog(
+                    user_id=rng.choice(user_ids) if user_ids else None,
+                    action=action,
+                    description=f'{action.title()} job {job_id}',
+                    content_type_id=content_type_id,
+                    object_id=job_id,
+                    ip_address=f'10.0.{rng.randrange(256)}.{rng.randrange(256)}',
+                    user_agent='create_sample_data',
+                    created_at=now - timedelta(seconds=offset),
+                )
+
+        created = 0
+        for batch in self.batches(entries()):
+            with transaction.atomic():
+                ActivityLog.objects.bulk_create(batch)
+            created += len(batch)
+        self.step('activity logs', created, started)
+        return created
+
+    def insert_rows(self, model, columns, rows):
+        """INSERT value tuples for ``columns`` of ``model`` in multi-row statements."""
+        quote = connection.ops.quote_name
+        table = quote(model._meta.db_table)
+        names = ', '.join(quote(model._meta.get_field(column).column) for column in columns)
+        per_statement = 1000
+        if connection.features.max_query_params:
+            per_statement = min(per_statement, connection.features.max_query_params // len(columns))
+        placeholder = f'({", ".join(["%s"] * len(columns))})'
+        with connection.cursor() as cursor:
+            for start in range(0, len(rows), per_statement):
+                chunk = rows[start:start + per_statement]
+                cursor.execute(
+                    f'INSERT INTO {table} ({names}) VALUES {", ".join([placeholder] * len(chunk))}',
+                    [value for row in chunk for value in row],
+                )
@@ -0,0 +1,87 @@
+"""
+Management command to bulk import job postings.
+Run with: python manage.py import_jobs jobs.csv --user hod1 [--dry-run] [--batch-size 200]
+
+Rows are CSV (with a header) or JSON lines with the columns job_title,
+job_description, institution_code, college_code, department_code,
+job_type, experience_required, qualification, salary_range, last_date and
+priority. Jobs are created as drafts by --user, within that user's scope.
+Invalid rows are reported and skipped.
+"""
+from django.core.management.base import BaseCommand, CommandError
+from admin_panel import job_import
+from admin_panel.models import User
+import logging
+import time
+
+logger = logging.getLogger('admin_panel')
+
+
+class Command(BaseCommand):
+    help = 'Import job postings from a CSV or JSON lines file'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='CSV or JSON lines file')
+        parser.add_argument(
+            '--user',
+            required=True,
+            help='Username the jobs are created by (their role scope applies)',
+        )
+        parser.add_argument(
+            '--format',
+            choices=job_import.FORMATS,
+            help='File format (default: from the file extension)',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=job_import.BATCH_SIZE,
+            help=f'Rows validated and inserted per transaction (default: {job_import.BATCH_SIZE})',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Validate only; create nothing',
+        )
+
+    def handle(self, *args, **options):
+        if options['batch_size'] < 1:
+            raise CommandError('--batch-size must be at least 1')
+        file_format = options['format'] or job_import.detect_format(options['path'])
+        if file_format is None:
+            raise CommandError('Cannot tell the file format from its name; pass --format')
+        try:
+            user = User.objects.get(username=options['user'])
+        except User.DoesNotExist:
+            raise CommandError(f'User {options["user"]!r} does not exist')
+
+        started = time.monotonic()
+        try:
+            with open(options['path'], encoding='utf-8-sig', newline='') as handle:
+                result = job_import.import_jobs(
+                    job_import.read_rows(handle, file_format),
+                    user,
+                    batch_size=options['batch_size'],
+                    dry_run=options['dry_run'],
+                    ip_address='0.0.0.0',
+                    user_agent='import_jobs_command',
+                )
+        except (OSError, ValueError) as exc:
+            raise CommandError(str(exc))
+
+        for error in result['errors']:
+            messages = '; '.join(
+                f'{field}: {" ".join(str(message) for message in field_messages)}'
+                for field, field_messages in error['errors'].items()
+            )
+            self.stderr.write(f'Row {error["row"]}: {messages}')
+
+        elapsed = time.monotonic() - started
+        verb = 'Would create' if options['dry_run'] else 'Created'
+        summary = (
+            f'{verb} {result["created"]} of {result["rows"]} jobs, '
+            f'{len(result["errors"])} rows rejected ({elapsed:.2f}s)'
+        )
+        if not options['dry_run']:
+            logger.info(f'Imported jobs from {options["path"]} as {user.username}: {summary}')
+        self.stdout.write(self.style.SUCCESS(summary))
@@ -0,0 +1,31 @@
+"""
+Management command to (re)build the applicant search index.
+Run with: python manage.py rebuild_applicant_search [--batch-size 1000]
+"""
+from django.core.management.base import BaseCommand
+from admin_panel import applicant_search
+import logging
+import time
+
+logger = logging.getLogger('admin_panel')
+
+
+class Command(BaseCommand):
+    help = 'Rebuild ApplicantSearchEntry/ApplicantTrigram for every applicant'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Applicants indexed per transaction (default: 1000)',
+        )
+
+    def handle(self, *args, **options):
+        started = time.monotonic()
+        total = applicant_search.rebuild(batch_size=options['batch_size'])
+        elapsed = time.monotonic() - started
+        logger.info(f'Rebuilt applicant search index for {total} applicants ({elapsed:.2f}s)')
+        self.stdout.write(
+            self.style.SUCCESS(f'Indexed {total} applicants ({elapsed:.2f}s)')
+        )
@@ -0,0 +1,46 @@
+"""
+Management command to rebuild or verify the materialized counters.
+Run with: python manage.py rebuild_counters [--check]
+"""
+from django.core.management.base import BaseCommand, CommandError
+from admin_panel import counters
+import logging
+
+logger = logging.getLogger('admin_panel')
+
+
+class Command(BaseCommand):
+    help = 'Rebuild ApplicationCounter/JobCounter from source rows, or check them for drift'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--check',
+            action='store_true',
+            help='Only report drift; exit with an error if any is found',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Rows per bulk insert when rebuilding (default: 1000)',
+        )
+
+    def handle(self, *args, **options):
+        drift = counters.find_drift()
+        for table, key, expected, stored in drift:
+            self.stdout.write(f'{table} {key}: expected {expected}, stored {stored}')
+
+        if options['check']:
+            if drift:
+                raise CommandError(f'{len(drift)} counter(s) drifted')
+            self.stdout.write(self.style.SUCCESS('Counters are consistent'))
+            return
+
+        application_rows, job_rows = counters.rebuild(batch_size=options['batch_size'])
+        logger.info(f'Rebuilt counters: {application_rows} application rows, {job_rows} job rows')
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'Rebuilt {application_rows} application counters and {job_rows} job counters '
+                f'({len(drift)} had drifted)'
+            )
+        )
@@ -0,0 +1,40 @@
+"""
+Management command to copy the SQLite primary database onto its replicas.
+Run with: python manage.py sync_sqlite_replicas
+
+For trying read-replica routing locally (DB_REPLICAS=replica.sqlite3).
+SQLite has no replication, so a replica only changes when this command
+copies the primary onto it; in between it behaves like a lagging replica.
+"""
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, connections
+from admin_panel.db_router import replicas
+import logging
+import sqlite3
+
+logger = logging.getLogger('admin_panel')
+
+
+class Command(BaseCommand):
+    help = 'Copy the SQLite primary database onto the configured SQLite replicas'
+
+    def handle(self, *args, **options):
+        aliases = replicas()
+        if not aliases:
+            raise CommandError('No replicas configured (set DB_REPLICAS)')
+        primary = connections[DEFAULT_DB_ALIAS]
+        if primary.vendor != 'sqlite':
+            raise CommandError('Only SQLite replicas can be synced; real replicas use database replication')
+
+        primary.ensure_connection()
+        for alias in aliases:
+            connections[alias].close()
+            target = sqlite3.connect(connections[alias].settings_dict['NAME'])
+            try:
+                primary.connection.backup(target)
+            finally:
+                target.close()
+            self.stdout.write(f'{alias}: {connections[alias].settings_dict["NAME"]}')
+
+        logger.info(f'Synced {len(aliases)} SQLite replica(s) from the primary')
+        self.stdout.write(self.style.SUCCESS(f'Synced {len(aliases)} replica(s)'))
@@ -0,0 +1,239 @@
+"""
+Per-request instrumentation.
+
+``RequestMetricsMiddleware`` (``admin_panel.middleware``) starts a
+``RequestTimings`` for every request. It is installed as an
+``execute_wrapper`` on every database connection, so it counts the queries
+of the request and their total time, and ``SerializerTimingMixin`` adds the
+time spent producing ``serializer.data`` (without the queries it
+triggers, which are already in the database time). Whatever is left of the
+request's duration is view time.
+
+The middleware reports these in a ``Server-Timing`` header and records
+them in in-process histograms, served in the Prometheus text format at
+``/api/_metrics``. The histograms are per process: with several workers,
+scrape each one (or aggregate in Prometheus).
+"""
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseForbidden
+from drf_spectacular.utils import extend_schema
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.permissions import AllowAny
+
+DEFAULTS = {
+    'ENABLED': True,
+    'SERVER_TIMING': True,
+    'SLOW_REQUEST_MS': 1000,
+    'ALLOWED_IPS': [],
+}
+
+# Seconds; Prometheus convention.
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100, 250)
+
+_current = ContextVar('admin_panel_request_timings', default=None)
+
+
+def config():
+    return {**DEFAULTS, **getattr(settings, 'REQUEST_METRICS', {})}
+
+
+class RequestTimings:
+    """Query count and DB/serializer seconds of one request."""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.queries = 0
+        self.db = 0.0
+        self.serializer = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries += 1
+            self.db += time.perf_counter() - started
+
+    def total(self):
+        return time.perf_counter() - self.started
+
+    def view(self, total):
+        return max(total - self.db - self.serializer, 0.0)
+
+
+@contextmanager
+def track():
+    """Make a new ``RequestTimings`` current for the enclosed block."""
+    timings = RequestTimings()
+    token = _current.set(timings)
+    try:
+        yield timings
+    finally:
+        _current.reset(token)
+
+
+@contextmanager
+def serializer_time():
+    """Add the enclosed block to the current request's serializer time."""
+    timings = _current.get()
+    if timings is None:
+        yield
+        return
+    started = time.perf_counter()
+    db = timings.db
+    try:
+        yield
+    finally:
+        timings.serializer += (time.perf_counter() - started) - (timings.db - db)
+
+
+class _Metric:
+    def __init__(self, name, documentation, labelnames):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self._lock = threading.Lock()
+        self._values = {}
+
+    def _labels(self, key):
+        pairs = zip(self.labelnames, key)
+        return ','.join('{}="{}"'.format(name, _escape(value)) for name, value in pairs)
+
+    def reset(self):
+        with self._lock:
+            self._values.clear()
+
+
+class Counter(_Metric):
+    type = 'counter'
+
+    def inc(self, labels, amount=1):
+        key = tuple(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def samples(self):
+        with self._lock:
+            values = sorted(self._values.items())
+        for key, value in values:
+            yield f'{self.name}{{{self._labels(key)}}} {_number(value)}'
+
+
+class Histogram(_Metric):
+    type = 'histogram'
+
+    def __init__(self, name, documentation, labelnames, buckets):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(buckets)
+
+    def observe(self, labels, value):
+        key = tuple(labels)
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is None:
+                entry = self._values[key] = [[0] * len(self.buckets), 0.0, 0]
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    entry[0][index] += 1
+                    break
+            entry[1] += value
+            entry[2] += 1
+
+    def samples(self):
+        with self._lock:
+            values = sorted((key, [list(e[0]), e[1], e[2]]) for key, e in self._values.items())
+        for key, (counts, total, count) in values:
+            labels = self._labels(key)
+            cumulative = 0
+            for bound, bucket in zip(self.buckets, counts):
+                cumulative += bucket
+                yield f'{self.name}_bucket{{{labels},le="{_number(bound)}"}} {cumulative}'
+            yield f'{self.name}_bucket{{{labels},le="+Inf"}} {count}'
+            yield f'{self.name}_sum{{{labels}}} {_number(total)}'
+            yield f'{self.name}_count{{{labels}}} {count}'
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _number(value):
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+LABELS = ('view', 'method')
+
+REQUESTS = Counter(
+    'facultyplus_http_requests_total', 'Requests by view, method and status.',
+    LABELS + ('status',),
+)
+REQUEST_DURATION = Histogram(
+    'facultyplus_http_request_duration_seconds', 'Time to produce the response.',
+    LABELS, DURATION_BUCKETS,
+)
+DB_QUERIES = Histogram(
+    'facultyplus_http_request_db_queries', 'Database queries per request.',
+    LABELS, QUERY_BUCKETS,
+)
+DB_DURATION = Histogram(
+    'facultyplus_http_request_db_duration_seconds', 'Database time per request.',
+    LABELS, DURATION_BUCKETS,
+)
+SERIALIZER_DURATION = Histogram(
+    'facultyplus_http_request_serializer_duration_seconds',
+    'Serializer time per request, without its queries.',
+    LABELS, DURATION_BUCKETS,
+)
+VIEW_DURATION = Histogram(
+    'facultyplus_http_request_view_duration_seconds',
+    'Request time outside the database and serializers.',
+    LABELS, DURATION_BUCKETS,
+)
+
+REGISTRY = (REQUESTS, REQUEST_DURATION, DB_QUERIES, DB_DURATION, SERIALIZER_DURATION, VIEW_DURATION)
+
+
+def record(view, method, status, timings, total):
+    labels = (view, method)
+    REQUESTS.inc(labels + (str(status),))
+    REQUEST_DURATION.observe(labels, total)
+    DB_QUERIES.observe(labels, timings.queries)
+    DB_DURATION.observe(labels, timings.db)
+    SERIALIZER_DURATION.observe(labels, timings.serializer)
+    VIEW_DURATION.observe(labels, timings.view(total))
+
+
+def render():
+    """All metrics in the Prometheus text exposition format."""
+    lines = []
+    for metric in REGISTRY:
+        lines.append(f'# HELP {metric.name} {metric.documentation}')
+        lines.append(f'# TYPE {metric.name} {metric.type}')
+        lines.extend(metric.samples())
+    return '\n'.join(lines) + '\n'
+
+
+@extend_schema(exclude=True)
+@api_view(['GET'])
+@permission_classes([AllowAny])
+def metrics_view(request):
+    """
+    Prometheus scrape endpoint for super admins (scrape with a super
+    admin's ``Authorization: Token <key>``). ``REQUEST_METRICS['ALLOWED_IPS']``
+    also opens it to direct peers (not X-Forwarded-For). It is empty by
+    default: behind a reverse proxy on the same host every request arrives
+    from 127.0.0.1.
+    """
+    user = request.user
+    allowed = request.META.get('REMOTE_ADDR') in config()['ALLOWED_IPS'] or (
+        user.is_authenticated and user.role == 'super_admin'
+    )
+    if not allowed:
+        return HttpResponseForbidden()
+    return HttpResponse(render(), content_type='text/plain; version=0.0.4; charset=utf-8')
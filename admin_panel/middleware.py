@@ -0,0 +1,80 @@
+"""
+Request middleware.
+"""
+import logging
+from contextlib import ExitStack
+
+from django.db import connections
+from rest_framework.permissions import SAFE_METHODS
+
+from admin_panel import db_router, metrics
+
+logger = logging.getLogger('admin_panel')
+
+
+class RequestMetricsMiddleware:
+    """
+    Time every request (see ``admin_panel.metrics``).
+
+    Adds ``Server-Timing: db;dur=..;desc="N queries", serializer;dur=..,
+    view;dur=.., total;dur=..`` (milliseconds) to the response, records the
+    ``/api/_metrics`` histograms under the URL name of the view, and logs a
+    warning for requests slower than ``REQUEST_METRICS['SLOW_REQUEST_MS']``.
+    Streaming responses are timed up to the first byte.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        config = metrics.config()
+        if not config['ENABLED']:
+            return self.get_response(request)
+
+        with metrics.track() as timings, ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(timings))
+            response = self.get_response(request)
+        total = timings.total()
+
+        match = request.resolver_match
+        view = (match.view_name or match.url_name or 'unnamed') if match else 'unmatched'
+        metrics.record(view, request.method, response.status_code, timings, total)
+
+        if config['SERVER_TIMING']:
+            response['Server-Timing'] = ', '.join([
+                f'db;dur={timings.db * 1000:.1f};desc="{timings.queries} queries"',
+                f'serializer;dur={timings.serializer * 1000:.1f}',
+                f'view;dur={timings.view(total) * 1000:.1f}',
+                f'total;dur={total * 1000:.1f}',
+            ])
+
+        if total * 1000 >= config['SLOW_REQUEST_MS']:
+            logger.warning(
+                f'Slow request: {request.method} {request.get_full_path()} -> {response.status_code} '
+                f'in {total * 1000:.0f}ms ({timings.queries} queries, db {timings.db * 1000:.0f}ms, '
+                f'serializer {timings.serializer * 1000:.0f}ms, user {getattr(request, "user", None)})'
+            )
+        return response
+
+
+class ReplicaPinMiddleware:
+    """
+    After an unsafe request (POST, PUT, PATCH, DELETE) by a signed-in user,
+    read that user's requests from the primary for
+    ``DATABASE_REPLICA_PIN_SECONDS``, so they see their own changes while the
+    replicas catch up (see ``admin_panel.db_router``). Does nothing without
+    replicas.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        response = self.get_response(request)
+        if request.method not in SAFE_METHODS and db_router.replicas():
+            # DRF sets request.user to the token-authenticated user as well.
+            user = getattr(request, 'user', None)
+            if user is not None and user.is_authenticated:
+                db_router.pin_to_primary(user.pk)
+        return response
@@ -0,0 +1,76 @@
+# Generated by Django 4.2 on 2026-10-18 01:23
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def populate_counters(apps, schema_editor):
+    Application = apps.get_model('admin_panel', 'Application')
+    ApplicationCounter = apps.get_model('admin_panel', 'ApplicationCounter')
+    Job = apps.get_model('admin_panel', 'Job')
+    JobCounter = apps.get_model('admin_panel', 'JobCounter')
+
+    ApplicationCounter.objects.bulk_create([
+        ApplicationCounter(job_id=row['job_id'], status=row['status'], count=row['n'])
+        for row in Application.objects.order_by().values('job_id', 'status').annotate(n=models.Count('id'))
+    ], batch_size=1000)
+    JobCounter.objects.bulk_create([
+        JobCounter(
+            institution_id=row['institution_id'], college_id=row['college_id'],
+            department_id=row['department_id'], job_status=row['job_status'], count=row['n'],
+        )
+        for row in Job.objects.order_by().values(
+            'institution_id', 'college_id', 'department_id', 'job_status'
+        ).annotate(n=models.Count('id'))
+    ], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('admin_panel', '0002_user_current_location_user_date_of_birth_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='JobCounter',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('job_status', models.CharField(max_length=30)),
+                ('count', models.IntegerField(default=0)),
+                ('college', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='job_counters', to='admin_panel.college')),
+                ('department', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='job_counters', to='admin_panel.department')),
+                ('institution', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='job_counters', to='admin_panel.institution')),
+            ],
+            options={
+                'verbose_name': 'Job Counter',
+                'verbose_name_plural': 'Job Counters',
+            },
+        ),
+        migrations.CreateModel(
+            name='ApplicationCounter',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.CharField(max_length=30)),
+                ('count', models.IntegerField(default=0)),
+                ('job', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='application_counters', to='admin_panel.job')),
+            ],
+            options={
+                'verbose_name': 'Application Counter',
+                'verbose_name_plural': 'Application Counters',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='jobcounter',
+            index=models.Index(fields=['college', 'department', 'job_status'], name='admin_panel_college_84e2e4_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='jobcounter',
+            index=models.Index(fields=['institution', 'job_status'], name='admin_panel_institu_a1df2b_idx'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='applicationcounter',
+            unique_together={('job', 'status')},
+        ),
+        migrations.RunPython(populate_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,133 @@
+# Generated by Django 4.2 on 2026-10-18 01:30
+
+from django.db import migrations, models
+
+
+TABLE = 'admin_panel_activitylog'
+PARTITIONS_AHEAD = 2
+
+
+def _month_start(year, month):
+    year, month = year + (month - 1) // 12, (month - 1) % 12 + 1
+    return f'{year:04d}-{month:02d}-01 00:00:00+00'
+
+
+def partition_activity_log(apps, schema_editor):
+    """
+    Rebuild admin_panel_activitylog as a table partitioned by month of
+    created_at (PostgreSQL only; other backends keep the plain table).
+
+    The primary key becomes (id, created_at), as PostgreSQL requires the
+    partition key in every unique index; ids still come from one sequence.
+    """
+    connection = schema_editor.connection
+    if connection.vendor != 'postgresql':
+        return
+    quote = connection.ops.quote_name
+    legacy = f'{TABLE}_unpartitioned'
+
+    with connection.cursor() as cursor:
+        cursor.execute('SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass(%s)', [TABLE])
+        if cursor.fetchone():
+            return
+
+        cursor.execute(f'LOCK TABLE {quote(TABLE)} IN ACCESS EXCLUSIVE MODE')
+        cursor.execute(
+            'SELECT indexdef FROM pg_indexes WHERE schemaname = current_schema() '
+            'AND tablename = %s AND indexname <> %s', [TABLE, f'{TABLE}_pkey']
+        )
+        index_definitions = [row[0] for row in cursor.fetchall()]
+        cursor.execute(
+            "SELECT conname, pg_get_constraintdef(oid) FROM pg_constraint "
+            "WHERE conrelid = to_regclass(%s) AND contype = 'f'", [TABLE]
+        )
+        foreign_keys = cursor.fetchall()
+        cursor.execute("SELECT pg_get_serial_sequence(%s, 'id')", [TABLE])
+        sequence = cursor.fetchone()[0]
+        cursor.execute(
+            f'SELECT GREATEST((SELECT last_value FROM {sequence}), '
+            f'(SELECT COALESCE(MAX(id), 0) FROM {quote(TABLE)}))'
+        )
+        last_id = cursor.fetchone()[0]
+        cursor.execute(
+            f"SELECT EXTRACT(YEAR FROM d)::int, EXTRACT(MONTH FROM d)::int FROM "
+            f"(SELECT COALESCE(MIN(created_at), now()) AT TIME ZONE 'UTC' AS d FROM {quote(TABLE)}) t"
+        )
+        first_year, first_month = cursor.fetchone()
+        cursor.execute(
+            "SELECT EXTRACT(YEAR FROM d)::int, EXTRACT(MONTH FROM d)::int "
+            "FROM (SELECT now() AT TIME ZONE 'UTC' AS d) t"
+        )
+        this_year, this_month = cursor.fetchone()
+
+        # Free the names (sequence, constraints, indexes) held by the old table.
+        cursor.execute(f'ALTER TABLE {quote(TABLE)} RENAME TO {quote(legacy)}')
+        cursor.execute(
+            "SELECT attidentity FROM pg_attribute WHERE attrelid = to_regclass(%s) AND attname = 'id'",
+            [legacy]
+        )
+        if cursor.fetchone()[0]:
+            cursor.execute(f'ALTER TABLE {quote(legacy)} ALTER COLUMN id DROP IDENTITY')
+        else:
+            cursor.execute(f'ALTER TABLE {quote(legacy)} ALTER COLUMN id DROP DEFAULT')
+            cursor.execute(f'DROP SEQUENCE {sequence}')
+
+        cursor.execute(
+            f'CREATE TABLE {quote(TABLE)} (LIKE {quote(legacy)} INCLUDING DEFAULTS INCLUDING CONSTRAINTS) '
+            f'PARTITION BY RANGE (created_at)'
+        )
+        cursor.execute(f'CREATE SEQUENCE {quote(TABLE + "_id_seq")} OWNED BY {quote(TABLE)}.id')
+        cursor.execute(
+            f"ALTER TABLE {quote(TABLE)} ALTER COLUMN id SET DEFAULT nextval('{TABLE}_id_seq')"
+        )
+        cursor.execute('SELECT setval(%s, %s, %s)', [f'{TABLE}_id_seq', max(last_id, 1), last_id > 0])
+
+        cursor.execute(f'CREATE TABLE {quote(TABLE + "_default")} PARTITION OF {quote(TABLE)} DEFAULT')
+        months = (this_year - first_year) * 12 + this_month - first_month + PARTITIONS_AHEAD + 1
+        for offset in range(months):
+            start = _month_start(first_year, first_month + offset)
+            end = _month_start(first_year, first_month + offset + 1)
+            cursor.execute(
+                f"CREATE TABLE {quote(TABLE + '_p' + start[:4] + start[5:7])} PARTITION OF {quote(TABLE)} "
+                f"FOR VALUES FROM ('{start}') TO ('{end}')"
+            )
+
+        cursor.execute(f'INSERT INTO {quote(TABLE)} SELECT * FROM {quote(legacy)}')
+        cursor.execute(f'DROP TABLE {quote(legacy)}')
+
+        cursor.execute(
+            f'ALTER TABLE {quote(TABLE)} ADD CONSTRAINT {quote(TABLE + "_pkey")} PRIMARY KEY (id, created_at)'
+        )
+        for definition in index_definitions:
+            cursor.execute(definition)
+        for name, definition in foreign_keys:
+            cursor.execute(f'ALTER TABLE {quote(TABLE)} ADD CONSTRAINT {quote(name)} {definition}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('admin_panel', '0004_activitylog_created_at_default'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ActivityLogArchive',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('month', models.DateField(db_index=True)),
+                ('path', models.CharField(max_length=500)),
+                ('row_count', models.PositiveIntegerField(default=0)),
+                ('sha256', models.CharField(max_length=64)),
+                ('archived_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'verbose_name': 'Activity Log Archive',
+                'verbose_name_plural': 'Activity Log Archives',
+                'ordering': ['-month', '-archived_at'],
+            },
+        ),
+        # Not reversible in place; the partitioned table stays compatible
+        # with the model if this migration is unapplied.
+        migrations.RunPython(partition_activity_log, migrations.RunPython.noop),
+    ]
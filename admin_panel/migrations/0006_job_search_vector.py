@@ -0,0 +1,40 @@
+from django.db import migrations
+
+
+SEARCH_VECTOR = """
+    setweight(to_tsvector('english', coalesce(job_title, '')), 'A') ||
+    setweight(to_tsvector('english', coalesce(qualification, '')), 'B') ||
+    setweight(to_tsvector('english', coalesce(job_description, '')), 'C')
+"""
+
+
+def add_search_vector(apps, schema_editor):
+    # PostgreSQL only; the SQLite FTS5 index is installed by
+    # admin_panel.search after migrate.
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(
+        f'ALTER TABLE admin_panel_job ADD COLUMN IF NOT EXISTS search_vector tsvector '
+        f'GENERATED ALWAYS AS ({SEARCH_VECTOR}) STORED'
+    )
+    schema_editor.execute(
+        'CREATE INDEX IF NOT EXISTS admin_panel_job_search_vector_idx '
+        'ON admin_panel_job USING GIN (search_vector)'
+    )
+
+
+def remove_search_vector(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('ALTER TABLE admin_panel_job DROP COLUMN IF EXISTS search_vector')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('admin_panel', '0005_activitylog_partitions'),
+    ]
+
+    operations = [
+        migrations.RunPython(add_search_vector, remove_search_vector),
+    ]
@@ -0,0 +1,49 @@
+# Generated by Django 4.2 on 2026-10-18 01:35
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('admin_panel', '0006_job_search_vector'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ApplicantTrigram',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('trigram', models.CharField(max_length=3)),
+                ('field', models.CharField(choices=[('n', 'Name'), ('e', 'Email')], max_length=1)),
+                ('applicant', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='admin_panel.applicant')),
+            ],
+            options={
+                'verbose_name': 'Applicant Trigram',
+                'verbose_name_plural': 'Applicant Trigrams',
+            },
+        ),
+        migrations.CreateModel(
+            name='ApplicantSearchEntry',
+            fields=[
+                ('applicant', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='search_entry', serialize=False, to='admin_panel.applicant')),
+                ('name', models.CharField(max_length=511)),
+                ('email', models.CharField(db_index=True, max_length=254)),
+                ('phone', models.CharField(db_index=True, max_length=20)),
+                ('name_trigrams', models.PositiveIntegerField(default=0)),
+                ('email_trigrams', models.PositiveIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('user', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Applicant Search Entry',
+                'verbose_name_plural': 'Applicant Search Entries',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='applicanttrigram',
+            index=models.Index(fields=['trigram', 'field', 'applicant'], name='admin_panel_trigram_74e8ec_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2 on 2026-10-18 01:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('admin_panel', '0007_applicant_search'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='activitylog',
+            name='action',
+            field=models.CharField(choices=[('create', 'Created'), ('update', 'Updated'), ('delete', 'Deleted'), ('archive', 'Archived'), ('approve', 'Approved'), ('reject', 'Rejected'), ('login', 'Login'), ('logout', 'Logout'), ('apply', 'Applied'), ('status_change', 'Status Changed'), ('selection', 'Selection'), ('export', 'Exported')], max_length=50),
+        ),
+    ]
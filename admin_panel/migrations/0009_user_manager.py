@@ -0,0 +1,20 @@
+# Generated by Django 4.2 on 2026-10-18 02:34
+
+import admin_panel.models.user
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('admin_panel', '0008_activitylog_export_action'),
+    ]
+
+    operations = [
+        migrations.AlterModelManagers(
+            name='user',
+            managers=[
+                ('objects', admin_panel.models.user.UserManager()),
+            ],
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2 on 2026-10-18 02:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('admin_panel', '0010_keyset_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='applicationcounter',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+    ]
@@ -8,7 +8,9 @@ from .applicant import Applicant
 from .education import Education
 from .experience import Experience
 from .application import Application
-from .activity_log import ActivityLog
+from .activity_log import ActivityLog, ActivityLogArchive
+from .counters import ApplicationCounter, JobCounter
+from .applicant_search import ApplicantSearchEntry, ApplicantTrigram
 
 __all__ = [
     'User',
@@ -22,4 +24,9 @@ __all__ = [
     'Experience',
     'Application',
     'ActivityLog',
+    'ActivityLogArchive',
+    'ApplicationCounter',
+    'JobCounter',
+    'ApplicantSearchEntry',
+    'ApplicantTrigram',
 ]
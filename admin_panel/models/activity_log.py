@@ -1,4 +1,5 @@
 from django.db import models
+from django.utils import timezone
 from django.contrib.contenttypes.models import ContentType
 from django.contrib.contenttypes.fields import GenericForeignKey
 
@@ -16,6 +17,7 @@ class ActivityLog(models.Model):
         ('apply', 'Applied'),
         ('status_change', 'Status Changed'),
         ('selection', 'Selection'),
+        ('export', 'Exported'),
     ]
     
     user = models.ForeignKey('User', on_delete=models.SET_NULL, null=True, related_name='activity_logs')
@@ -30,7 +32,8 @@ class ActivityLog(models.Model):
     ip_address = models.CharField(max_length=50, blank=True, null=True)
     user_agent = models.TextField(blank=True, null=True)
     
-    created_at = models.DateTimeField(auto_now_add=True)
+    # Set when the entry is built, not when a buffered batch is flushed.
+    created_at = models.DateTimeField(default=timezone.now, editable=False)
     
     class Meta:
         ordering = ['-created_at']
@@ -38,9 +41,27 @@ class ActivityLog(models.Model):
         verbose_name_plural = 'Activity Logs'
         indexes = [
             models.Index(fields=['user', 'action']),
-            models.Index(fields=['created_at']),
+            # Date ranges and keyset pagination (see admin_panel.pagination)
+            models.Index(fields=['created_at', 'id']),
             models.Index(fields=['content_type', 'object_id']),
         ]
     
     def __str__(self):
         return f"{self.user.username} - {self.get_action_display()} - {self.created_at}"
+
+
+class ActivityLogArchive(models.Model):
+    """A month of ActivityLog rows moved out to a compressed archive file."""
+    month = models.DateField(db_index=True)
+    path = models.CharField(max_length=500)
+    row_count = models.PositiveIntegerField(default=0)
+    sha256 = models.CharField(max_length=64)
+    archived_at = models.DateTimeField(auto_now_add=True)
+    
+    class Meta:
+        ordering = ['-month', '-archived_at']
+        verbose_name = 'Activity Log Archive'
+        verbose_name_plural = 'Activity Log Archives'
+    
+    def __str__(self):
+        return f"{self.month:%Y-%m} ({self.row_count} rows) - {self.path}"
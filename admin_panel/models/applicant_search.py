@@ -0,0 +1,43 @@
+from django.db import models
+
+
+class ApplicantSearchEntry(models.Model):
+    """Normalized name, email and phone of an applicant (see admin_panel.applicant_search)."""
+    applicant = models.OneToOneField('Applicant', on_delete=models.CASCADE, primary_key=True, related_name='search_entry')
+    # User account with the same email, whose name is indexed too
+    user = models.ForeignKey('User', on_delete=models.SET_NULL, null=True, blank=True, related_name='+')
+    name = models.CharField(max_length=511)
+    email = models.CharField(max_length=254, db_index=True)
+    phone = models.CharField(max_length=20, db_index=True)
+    name_trigrams = models.PositiveIntegerField(default=0)
+    email_trigrams = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = 'Applicant Search Entry'
+        verbose_name_plural = 'Applicant Search Entries'
+
+    def __str__(self):
+        return f"{self.name} <{self.email}> {self.phone}"
+
+
+class ApplicantTrigram(models.Model):
+    """One trigram of an applicant's indexed name or email."""
+    FIELD_CHOICES = [
+        ('n', 'Name'),
+        ('e', 'Email'),
+    ]
+
+    trigram = models.CharField(max_length=3)
+    field = models.CharField(max_length=1, choices=FIELD_CHOICES)
+    applicant = models.ForeignKey('Applicant', on_delete=models.CASCADE, related_name='+')
+
+    class Meta:
+        verbose_name = 'Applicant Trigram'
+        verbose_name_plural = 'Applicant Trigrams'
+        indexes = [
+            models.Index(fields=['trigram', 'field', 'applicant']),
+        ]
+
+    def __str__(self):
+        return f"{self.trigram!r} ({self.field}) - Applicant {self.applicant_id}"
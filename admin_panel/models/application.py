@@ -1,4 +1,4 @@
-from django.db import models
+from django.db import models, transaction
 from django.utils import timezone
 
 
@@ -48,11 +48,33 @@ class Application(models.Model):
             models.Index(fields=['job', 'status']),
             models.Index(fields=['applicant', 'status']),
             models.Index(fields=['status', 'applied_date']),
+            # Keyset pagination (see admin_panel.pagination)
+            models.Index(fields=['applied_date', 'id']),
         ]
     
     def __str__(self):
         return f"{self.applicant_name} - {self.job.job_title}"
     
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        from admin_panel import counters
+        instance = super().from_db(db, field_names, values)
+        counters.remember(instance, counters.APPLICATION_KEY)
+        return instance
+    
+    def refresh_from_db(self, *args, **kwargs):
+        from admin_panel import counters
+        super().refresh_from_db(*args, **kwargs)
+        counters.remember(self, counters.APPLICATION_KEY)
+    
+    def save(self, *args, **kwargs):
+        """Save and move the row between ApplicationCounter buckets atomically."""
+        from admin_panel import counters
+        with transaction.atomic():
+            previous = counters.previous_key(self, counters.APPLICATION_KEY)
+            super().save(*args, **kwargs)
+            counters.sync_saved(self, counters.APPLICATION_KEY, previous, kwargs.get('update_fields'))
+    
     def update_status(self, new_status, changed_by=None, remarks=''):
         """Update application status and log the change"""
         if new_status not in dict(self.APPLICATION_STATUS_CHOICES):
@@ -0,0 +1,38 @@
+from django.db import models
+
+
+class ApplicationCounter(models.Model):
+    """Denormalized number of applications per job and status."""
+    job = models.ForeignKey('Job', on_delete=models.CASCADE, related_name='application_counters')
+    status = models.CharField(max_length=30)
+    count = models.IntegerField(default=0)
+    # Last adjustment; part of the job response cache validators.
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        unique_together = ('job', 'status')
+        verbose_name = 'Application Counter'
+        verbose_name_plural = 'Application Counters'
+
+    def __str__(self):
+        return f"Job {self.job_id} - {self.status}: {self.count}"
+
+
+class JobCounter(models.Model):
+    """Denormalized number of jobs per college/department and status."""
+    institution = models.ForeignKey('Institution', on_delete=models.CASCADE, related_name='job_counters')
+    college = models.ForeignKey('College', on_delete=models.CASCADE, related_name='job_counters')
+    department = models.ForeignKey('Department', on_delete=models.CASCADE, null=True, blank=True, related_name='job_counters')
+    job_status = models.CharField(max_length=30)
+    count = models.IntegerField(default=0)
+
+    class Meta:
+        verbose_name = 'Job Counter'
+        verbose_name_plural = 'Job Counters'
+        indexes = [
+            models.Index(fields=['college', 'department', 'job_status']),
+            models.Index(fields=['institution', 'job_status']),
+        ]
+
+    def __str__(self):
+        return f"College {self.college_id} / Department {self.department_id} - {self.job_status}: {self.count}"
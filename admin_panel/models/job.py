@@ -1,7 +1,29 @@
-from django.db import models
+from django.db import models, transaction
 from django.utils import timezone
 
 
+class JobQuerySet(models.QuerySet):
+    """
+    Bulk writes that bypass save() and its signals still bump the ``jobs``
+    response cache namespace (see admin_panel.response_cache).
+    """
+    
+    def update(self, **kwargs):
+        from admin_panel.response_cache import invalidate
+        invalidate('jobs')
+        return super().update(**kwargs)
+    
+    def bulk_update(self, objs, fields, batch_size=None):
+        from admin_panel.response_cache import invalidate
+        invalidate('jobs')
+        return super().bulk_update(objs, fields, batch_size=batch_size)
+    
+    def bulk_create(self, objs, *args, **kwargs):
+        from admin_panel.response_cache import invalidate
+        invalidate('jobs')
+        return super().bulk_create(objs, *args, **kwargs)
+
+
 class Job(models.Model):
     JOB_TYPE_CHOICES = [
         ('full_time', 'Full Time'),
@@ -56,6 +78,8 @@ class Job(models.Model):
     published_at = models.DateTimeField(null=True, blank=True)
     closed_at = models.DateTimeField(null=True, blank=True)
     
+    objects = JobQuerySet.as_manager()
+    
     class Meta:
         ordering = ['-created_at']
         verbose_name = 'Job'
@@ -63,11 +87,33 @@ class Job(models.Model):
         indexes = [
             models.Index(fields=['job_status', 'last_date']),
             models.Index(fields=['institution', 'college']),
+            # Keyset pagination (see admin_panel.pagination)
+            models.Index(fields=['created_at', 'id']),
         ]
     
     def __str__(self):
         return self.job_title
     
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        from admin_panel import counters
+        instance = super().from_db(db, field_names, values)
+        counters.remember(instance, counters.JOB_KEY)
+        return instance
+    
+    def refresh_from_db(self, *args, **kwargs):
+        from admin_panel import counters
+        super().refresh_from_db(*args, **kwargs)
+        counters.remember(self, counters.JOB_KEY)
+    
+    def save(self, *args, **kwargs):
+        """Save and move the row between JobCounter buckets atomically."""
+        from admin_panel import counters
+        with transaction.atomic():
+            previous = counters.previous_key(self, counters.JOB_KEY)
+            super().save(*args, **kwargs)
+            counters.sync_saved(self, counters.JOB_KEY, previous, kwargs.get('update_fields'))
+    
     def is_deadline_passed(self):
         """Check if job deadline has passed"""
         return timezone.now().date() > self.last_date
@@ -1,8 +1,32 @@
 from django.db import models
-from django.contrib.auth.models import AbstractUser
+from django.contrib.auth.models import AbstractUser, UserManager as BaseUserManager
 from rest_framework.authtoken.models import Token
 
 
+class UserQuerySet(models.QuerySet):
+    """
+    Bulk writes that bypass save() still retire the scope version (and the
+    JWT claims) of the users whose role, institution, status or active flag
+    they change (see admin_panel.scope).
+    """
+    
+    def update(self, **kwargs):
+        from admin_panel import scope
+        if scope.versioned(kwargs):
+            scope.invalidate(list(self.values_list('pk', flat=True)))
+        return super().update(**kwargs)
+    
+    def bulk_update(self, objs, fields, batch_size=None):
+        from admin_panel import scope
+        if scope.versioned(fields):
+            scope.invalidate([obj.pk for obj in objs])
+        return super().bulk_update(objs, fields, batch_size=batch_size)
+
+
+class UserManager(BaseUserManager.from_queryset(UserQuerySet)):
+    pass
+
+
 class User(AbstractUser):
     ROLE_CHOICES = [
         ('super_admin', 'Super Admin'),
@@ -62,6 +86,8 @@ class User(AbstractUser):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
+    objects = UserManager()
+    
     class Meta:
         ordering = ['-created_at']
         verbose_name = 'User'
@@ -79,3 +105,21 @@ class User(AbstractUser):
         # Auto-create token on user creation
         if not hasattr(self, 'auth_token'):
             Token.objects.get_or_create(user=self)
+    
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        from admin_panel import scope
+        instance = super().from_db(db, field_names, values)
+        scope.remember(instance)
+        return instance
+    
+    def refresh_from_db(self, using=None, fields=None):
+        from admin_panel import scope
+        # Users built from JWT claims (admin_panel.authentication) hold a few
+        # fields only: the first deferred read loads all the others at once.
+        if getattr(self, '_from_claims', False) and fields is not None:
+            deferred = self.get_deferred_fields()
+            if set(fields) <= deferred:
+                fields = list(deferred)
+        super().refresh_from_db(using=using, fields=fields)
+        scope.remember(self)
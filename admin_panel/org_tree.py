@@ -0,0 +1,174 @@
+"""
+Cached organization tree: institution -> colleges -> departments, with job
+counts on every node.
+
+A tree is assembled from two cache entries per institution, each behind its
+own namespace version (see ``admin_panel.response_cache``):
+
+``org_tree:<id>``
+    The structure (institution, colleges, departments). Bumped when one of
+    them is saved or deleted.
+``org_tree_counts:<id>``
+    Jobs per (college, department, status), read from ``JobCounter``.
+    Bumped by ``counters.job_counts_changed``, so job saves, deletes,
+    auto-close and set-based updates all refresh it without touching the
+    structure.
+
+Only the stale part is rebuilt (two queries for the structure, one for the
+counts); a request that finds both cached runs no query.
+
+Both entries hold every count. ``get_tree`` narrows them for the caller:
+nodes outside the colleges and departments it is given only show their
+published jobs.
+"""
+from collections import defaultdict
+
+from django.db.models import Sum
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from admin_panel import response_cache
+from admin_panel.counters import job_counts_changed
+from admin_panel.db_router import use_primary
+from admin_panel.models import College, Department, Institution, JobCounter
+
+KEY = 'admin_panel:org_tree:{part}:{institution_id}:{version}'
+
+
+def _cached(part, namespace, institution_id, load):
+    options = response_cache.config()
+    if not options['ENABLED']:
+        return load(institution_id)
+    key = KEY.format(
+        part=part,
+        institution_id=institution_id,
+        version=response_cache.namespace_version(f'{namespace}:{institution_id}'),
+    )
+    cache = response_cache.get_cache()
+    value = cache.get(key)
+    if value is None:
+        with use_primary():
+            value = load(institution_id)
+        if value is not None:
+            cache.set(key, value, options['TIMEOUT'])
+    return value
+
+
+def load_structure(institution_id):
+    """Institution, colleges and departments as plain dicts, or None."""
+    institution = (
+        Institution.objects.filter(pk=institution_id)
+        .values('id', 'institution_name', 'institution_code', 'status')
+        .first()
+    )
+    if institution is None:
+        return None
+    colleges = {
+        college['id']: {**college, 'departments': []}
+        for college in College.objects.filter(institution_id=institution_id)
+        .order_by('college_name', 'pk')
+        .values('id', 'college_name', 'college_code', 'status')
+    }
+    departments = (
+        Department.objects.filter(institution_id=institution_id)
+        .order_by('department_name', 'pk')
+        .values('id', 'college_id', 'department_name', 'department_code', 'status')
+    )
+    for department in departments:
+        college = colleges.get(department.pop('college_id'))
+        if college is not None:
+            college['departments'].append(department)
+    return {**institution, 'colleges': list(colleges.values())}
+
+
+def load_counts(institution_id):
+    """``{(college_id, department_id): {job_status: count}}`` (as a list)."""
+    rows = (
+        JobCounter.objects.filter(institution_id=institution_id, count__gt=0)
+        .order_by()
+        .values('college_id', 'department_id', 'job_status')
+        .annotate(total=Sum('count'))
+    )
+    return [(row['college_id'], row['department_id'], row['job_status'], row['total']) for row in rows]
+
+
+def _counts(counts, visible):
+    if visible:
+        return dict(counts)
+    return {'published': counts['published']} if counts.get('published') else {}
+
+
+def _node(fields, counts, visible=True):
+    return {**fields, 'total_jobs': counts.get('published', 0), 'job_counts': _counts(counts, visible)}
+
+
+def get_tree(institution_id, college_ids=None, department_ids=None):
+    """
+    The institution's tree with job counts, or None if it doesn't exist.
+
+    Unless both ID sets are None (all counts), per-status counts are only
+    given for ``college_ids`` (with their departments) and
+    ``department_ids``; other nodes, and the institution, show published
+    jobs only.
+    """
+    everything = college_ids is None and department_ids is None
+    college_ids = college_ids or ()
+    department_ids = department_ids or ()
+    structure = _cached('structure', 'org_tree', institution_id, load_structure)
+    if structure is None:
+        return None
+    counts = _cached('counts', 'org_tree_counts', institution_id, load_counts)
+
+    by_department = defaultdict(lambda: defaultdict(int))
+    by_college = defaultdict(lambda: defaultdict(int))
+    unassigned = defaultdict(lambda: defaultdict(int))
+    totals = defaultdict(int)
+    for college_id, department_id, job_status, total in counts:
+        by_college[college_id][job_status] += total
+        totals[job_status] += total
+        if department_id is None:
+            unassigned[college_id][job_status] += total
+        else:
+            by_department[department_id][job_status] += total
+
+    colleges = []
+    for college in structure['colleges']:
+        fields = {key: value for key, value in college.items() if key != 'departments'}
+        college_visible = everything or college['id'] in college_ids
+        node = _node(fields, by_college[college['id']], college_visible)
+        node['unassigned_job_counts'] = _counts(unassigned[college['id']], college_visible)
+        node['departments'] = [
+            _node(
+                department, by_department[department['id']],
+                college_visible or department['id'] in department_ids,
+            )
+            for department in college['departments']
+        ]
+        colleges.append(node)
+
+    fields = {key: value for key, value in structure.items() if key != 'colleges'}
+    return {**_node(fields, totals, everything), 'colleges': colleges}
+
+
+def invalidate(institution_id):
+    response_cache.invalidate(f'org_tree:{institution_id}')
+
+
+@receiver(post_save, sender=College)
+@receiver(post_delete, sender=College)
+@receiver(post_save, sender=Department)
+@receiver(post_delete, sender=Department)
+def _structure_changed(sender, instance, **kwargs):
+    invalidate(instance.institution_id)
+
+
+@receiver(post_save, sender=Institution)
+@receiver(post_delete, sender=Institution)
+def _institution_changed(sender, instance, **kwargs):
+    invalidate(instance.pk)
+
+
+@receiver(job_counts_changed)
+def _counts_changed(sender, institution_ids, **kwargs):
+    for institution_id in institution_ids:
+        response_cache.invalidate(f'org_tree_counts:{institution_id}')
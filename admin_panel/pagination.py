@@ -0,0 +1,156 @@
+"""
+Pagination for the API.
+
+``DefaultPagination`` behaves like DRF's ``PageNumberPagination`` unless
+the client opts into something cheaper for the request:
+
+- ``?count=false`` keeps page numbers but skips the ``COUNT(*)`` query;
+- ``?pagination=cursor`` (or any ``?cursor=``) switches to keyset paging on
+  views that declare ``cursor_ordering``, e.g. ``('-created_at', '-id')``.
+  Each page is a range scan of the matching composite index instead of an
+  OFFSET scan. The cursor only encodes those columns, so a request whose
+  results are ordered otherwise (``?ordering=``, a search ranking) is
+  rejected rather than silently re-ordered.
+"""
+import base64
+import binascii
+import json
+from collections import OrderedDict
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db.models import Q
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class DefaultPagination(PageNumberPagination):
+    mode_query_param = 'pagination'
+    cursor_query_param = 'cursor'
+    count_query_param = 'count'
+    invalid_cursor_message = 'Invalid cursor'
+    cursor_ordering_message = 'Cursor pagination only supports the default ordering ({ordering})'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.mode = 'page'
+        page_size = self.get_page_size(request)
+        if not page_size:
+            return None
+
+        ordering = getattr(view, 'cursor_ordering', None)
+        params = request.query_params
+        if ordering and (params.get(self.cursor_query_param) or params.get(self.mode_query_param) == 'cursor'):
+            self.mode = 'cursor'
+            self._check_keyset_ordering(queryset, ordering)
+            return self._paginate_keyset(queryset, page_size, ordering)
+
+        if params.get(self.count_query_param, '').lower() in ('false', '0', 'no'):
+            self.mode = 'uncounted'
+            return self._paginate_uncounted(queryset, page_size)
+
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        if self.mode == 'page':
+            return super().get_paginated_response(data)
+        return Response(OrderedDict([
+            ('next', self._next_link),
+            ('previous', self._previous_link),
+            ('results', data),
+        ]))
+
+    # -- page numbers without COUNT(*) -------------------------------------
+
+    def _paginate_uncounted(self, queryset, page_size):
+        try:
+            page_number = int(self.request.query_params.get(self.page_query_param, 1))
+        except ValueError:
+            page_number = 0
+        if page_number < 1:
+            raise NotFound(self.invalid_page_message.format(page_number=page_number, message=''))
+
+        offset = (page_number - 1) * page_size
+        rows = list(queryset[offset:offset + page_size + 1])
+        url = self.request.build_absolute_uri()
+        self._next_link = (
+            replace_query_param(url, self.page_query_param, page_number + 1)
+            if len(rows) > page_size else None
+        )
+        if page_number == 1:
+            self._previous_link = None
+        elif page_number == 2:
+            self._previous_link = remove_query_param(url, self.page_query_param)
+        else:
+            self._previous_link = replace_query_param(url, self.page_query_param, page_number - 1)
+        return rows[:page_size]
+
+    # -- keyset (cursor) paging ---------------------------------------------
+
+    def _encode_cursor(self, value, pk, reverse):
+        payload = json.dumps({'v': value.isoformat() if hasattr(value, 'isoformat') else value,
+                              'pk': pk, 'r': reverse})
+        return base64.urlsafe_b64encode(payload.encode()).decode()
+
+    def _decode_cursor(self, token, field):
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(token.encode()))
+            value = field.to_python(payload['v'])
+            position = value, int(payload['pk']), bool(payload['r'])
+        except (binascii.Error, ValueError, TypeError, KeyError, DjangoValidationError):
+            raise NotFound(self.invalid_cursor_message)
+        # The keyset columns are never NULL.
+        if value is None:
+            raise NotFound(self.invalid_cursor_message)
+        return position
+
+    def _check_keyset_ordering(self, queryset, ordering):
+        current = tuple(queryset.query.order_by)
+        if current != tuple(ordering[:len(current)]):
+            raise ValidationError({'error': self.cursor_ordering_message.format(ordering=', '.join(ordering))})
+
+    def _paginate_keyset(self, queryset, page_size, ordering):
+        key, pk_key = ordering
+        key_name, pk_name = key.lstrip('-'), pk_key.lstrip('-')
+        descending = key.startswith('-')
+        field = queryset.model._meta.get_field(key_name)
+
+        token = self.request.query_params.get(self.cursor_query_param)
+        position = self._decode_cursor(token, field) if token else None
+        reverse = bool(position and position[2])
+
+        if position:
+            value, pk, _ = position
+            op = 'lt' if descending != reverse else 'gt'
+            queryset = queryset.filter(
+                Q(**{f'{key_name}__{op}': value}) | Q(**{key_name: value, f'{pk_name}__{op}': pk})
+            )
+
+        order = ordering
+        if reverse:
+            order = [name[1:] if name.startswith('-') else f'-{name}' for name in ordering]
+        rows = list(queryset.order_by(*order)[:page_size + 1])
+        has_more = len(rows) > page_size
+        rows = rows[:page_size]
+        if reverse:
+            rows.reverse()
+
+        has_next = has_more if not reverse else True
+        has_previous = position is not None if not reverse else has_more
+
+        url = remove_query_param(self.request.build_absolute_uri(), self.page_query_param)
+        self._next_link = self._previous_link = None
+        if rows and has_next:
+            last = rows[-1]
+            self._next_link = replace_query_param(
+                url, self.cursor_query_param,
+                self._encode_cursor(getattr(last, key_name), getattr(last, pk_name), False)
+            )
+        if rows and has_previous:
+            first = rows[0]
+            self._previous_link = replace_query_param(
+                url, self.cursor_query_param,
+                self._encode_cursor(getattr(first, key_name), getattr(first, pk_name), True)
+            )
+        return rows
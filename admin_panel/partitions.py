@@ -0,0 +1,310 @@
+"""
+Monthly partitions of the ActivityLog table, retention and archiving.
+
+On PostgreSQL ``admin_panel_activitylog`` is declaratively partitioned by
+``RANGE (created_at)`` (migration 0005): one partition per calendar month
+(UTC) named ``admin_panel_activitylog_pYYYYMM`` plus a ``_default`` catch-all.
+Each insert only touches the indexes of its month, queries with a
+``created_at`` range are pruned to the months they overlap, and retiring a
+month is a ``DETACH``/``DROP`` instead of a large ``DELETE``.
+
+Other backends keep the single table and treat a month as a range over the
+``created_at`` index, so the same retention code works there; archiving
+then deletes the month's rows in chunks.
+
+Archived months are written to gzip-compressed JSONL (one row per line) and
+recorded in ``ActivityLogArchive``. Run ``python manage.py
+archive_activity_logs`` periodically to create upcoming partitions and
+apply the retention policy.
+"""
+import gzip
+import hashlib
+import json
+import logging
+import os
+from datetime import date, datetime, timezone as dt_timezone
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connections, router, transaction
+from django.db.models.functions import TruncMonth
+from django.utils import timezone
+
+from admin_panel.models import ActivityLog, ActivityLogArchive
+
+logger = logging.getLogger(__name__)
+
+DEFAULTS = {
+    'RETAIN_MONTHS': 12,
+    'PARTITIONS_AHEAD': 2,
+    'ARCHIVE_DIR': os.path.join(settings.BASE_DIR, 'archives', 'activity_log'),
+    'BATCH_SIZE': 5000,
+}
+
+# Columns written to archive files, in table order.
+ARCHIVE_FIELDS = (
+    'id', 'user_id', 'action', 'description', 'content_type_id', 'object_id',
+    'ip_address', 'user_agent', 'created_at',
+)
+
+TABLE = ActivityLog._meta.db_table
+
+
+def config():
+    return {**DEFAULTS, **getattr(settings, 'ACTIVITY_LOG_RETENTION', {})}
+
+
+# ---------------------------------------------------------------------------
+# Months
+# ---------------------------------------------------------------------------
+
+def month_of(value):
+    """First day of the (UTC) month containing ``value``."""
+    if isinstance(value, datetime):
+        if timezone.is_aware(value):
+            value = value.astimezone(dt_timezone.utc)
+        value = value.date()
+    return value.replace(day=1)
+
+
+def add_months(month, n):
+    index = month.year * 12 + month.month - 1 + n
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def month_bounds(month):
+    """``[start, end)`` datetimes of ``month`` in UTC."""
+    start = datetime(month.year, month.month, 1, tzinfo=dt_timezone.utc)
+    end_month = add_months(month, 1)
+    return start, datetime(end_month.year, end_month.month, 1, tzinfo=dt_timezone.utc)
+
+
+def _is_month_start(value):
+    if isinstance(value, datetime):
+        if timezone.is_naive(value):
+            value = value.replace(tzinfo=dt_timezone.utc)
+        return value == month_bounds(month_of(value))[0]
+    return value.day == 1
+
+
+def months_between(first, last):
+    month = month_of(first)
+    last = month_of(last)
+    while month <= last:
+        yield month
+        month = add_months(month, 1)
+
+
+def partition_name(month):
+    return f'{TABLE}_p{month:%Y%m}'
+
+
+# ---------------------------------------------------------------------------
+# PostgreSQL partitions
+# ---------------------------------------------------------------------------
+
+def _connection():
+    return connections[router.db_for_write(ActivityLog)]
+
+
+def is_partitioned(connection=None):
+    connection = connection or _connection()
+    if connection.vendor != 'postgresql':
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute(
+            'SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass(%s)', [TABLE]
+        )
+        return cursor.fetchone() is not None
+
+
+def partitions(connection=None):
+    """Months that currently have their own partition (PostgreSQL only)."""
+    connection = connection or _connection()
+    if not is_partitioned(connection):
+        return []
+    with connection.cursor() as cursor:
+        cursor.execute(
+            'SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid '
+            'WHERE i.inhparent = to_regclass(%s)', [TABLE]
+        )
+        names = [row[0] for row in cursor.fetchall()]
+    prefix = f'{TABLE}_p'
+    return sorted(
+        date(int(name[-6:-2]), int(name[-2:]), 1)
+        for name in names
+        if name.startswith(prefix) and name[len(prefix):].isdigit()
+    )
+
+
+def _create_partition(cursor, connection, month):
+    quote = connection.ops.quote_name
+    start, end = month_bounds(month)
+    table, partition, default = quote(TABLE), quote(partition_name(month)), quote(f'{TABLE}_default')
+    bounds = f"FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+    # Rows of this month that already landed in the default partition have
+    # to move, otherwise ATTACH fails its constraint check.
+    cursor.execute(
+        f'CREATE TABLE {partition} (LIKE {table} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)'
+    )
+    cursor.execute(
+        f'WITH moved AS (DELETE FROM {default} WHERE created_at >= %s AND created_at < %s '
+        f'RETURNING *) INSERT INTO {partition} SELECT * FROM moved', [start, end]
+    )
+    cursor.execute(f'ALTER TABLE {table} ATTACH PARTITION {partition} FOR VALUES {bounds}')
+
+
+def ensure_partitions(months_ahead=None, connection=None):
+    """Create partitions up to ``months_ahead`` months from now; returns the new months."""
+    connection = connection or _connection()
+    if not is_partitioned(connection):
+        return []
+    if months_ahead is None:
+        months_ahead = config()['PARTITIONS_AHEAD']
+    existing = set(partitions(connection))
+    current = month_of(timezone.now())
+    created = []
+    with transaction.atomic(using=connection.alias), connection.cursor() as cursor:
+        for month in months_between(current, add_months(current, months_ahead)):
+            if month not in existing:
+                _create_partition(cursor, connection, month)
+                created.append(month)
+    return created
+
+
+# ---------------------------------------------------------------------------
+# Retention and archiving
+# ---------------------------------------------------------------------------
+
+def expired_months(retain_months=None, connection=None):
+    """Months older than the retention window that still have rows or a partition."""
+    connection = connection or _connection()
+    if retain_months is None:
+        retain_months = config()['RETAIN_MONTHS']
+    cutoff = add_months(month_of(timezone.now()), -retain_months)
+    cutoff_start, _ = month_bounds(cutoff)
+
+    months = {month for month in partitions(connection) if month < cutoff}
+    with_rows = ActivityLog.objects.using(connection.alias).filter(
+        created_at__lt=cutoff_start
+    ).annotate(
+        month=TruncMonth('created_at', tzinfo=dt_timezone.utc)
+    ).order_by().values_list('month', flat=True).distinct()
+    months.update(month_of(month) for month in with_rows)
+    return sorted(months)
+
+
+def _archive_path(directory, month):
+    path = os.path.join(directory, f'activity_log_{month:%Y_%m}.jsonl.gz')
+    if os.path.exists(path):
+        # Late rows of an already archived month go to a second file.
+        path = os.path.join(
+            directory, f'activity_log_{month:%Y_%m}-{timezone.now():%Y%m%dT%H%M%S}.jsonl.gz'
+        )
+    return path
+
+
+def _write_archive(rows, path):
+    """Write ``rows`` (dicts) to ``path``; returns (count, sha256, last id)."""
+    digest = hashlib.sha256()
+    count, last_id = 0, None
+    partial = f'{path}.partial'
+    with gzip.open(partial, 'wt', encoding='utf-8') as handle:
+        for row in rows:
+            line = json.dumps(row, cls=DjangoJSONEncoder, ensure_ascii=False) + '\n'
+            handle.write(line)
+            count += 1
+            last_id = max(row['id'], last_id or 0)
+    with open(partial, 'rb') as handle:
+        for chunk in iter(lambda: handle.read(1 << 20), b''):
+            digest.update(chunk)
+    os.replace(partial, path)
+    return count, digest.hexdigest(), last_id
+
+
+def _month_rows(connection, month, batch_size):
+    start, end = month_bounds(month)
+    return ActivityLog.objects.using(connection.alias).filter(
+        created_at__gte=start, created_at__lt=end
+    ).order_by('created_at', 'id').values(*ARCHIVE_FIELDS).iterator(chunk_size=batch_size)
+
+
+def _drop_partition(connection, month, exported):
+    quote = connection.ops.quote_name
+    partition = quote(partition_name(month))
+    with transaction.atomic(using=connection.alias), connection.cursor() as cursor:
+        cursor.execute(f'ALTER TABLE {quote(TABLE)} DETACH PARTITION {partition}')
+        cursor.execute(f'SELECT count(*) FROM {partition}')
+        remaining = cursor.fetchone()[0]
+        if remaining != exported:
+            # Rolls back the DETACH; the month is retried on the next run.
+            raise RuntimeError(
+                f'{partition_name(month)} has {remaining} rows but {exported} were archived'
+            )
+        cursor.execute(f'DROP TABLE {partition}')
+
+
+def _delete_rows(connection, month, last_id, batch_size):
+    start, end = month_bounds(month)
+    rows = ActivityLog.objects.using(connection.alias).filter(
+        created_at__gte=start, created_at__lt=end, id__lte=last_id
+    )
+    deleted = 0
+    while True:
+        ids = list(rows.values_list('id', flat=True)[:batch_size])
+        if not ids:
+            return deleted
+        with transaction.atomic(using=connection.alias):
+            deleted += ActivityLog.objects.using(connection.alias).filter(id__in=ids).delete()[0]
+
+
+def archive_month(month, directory=None, batch_size=None, connection=None):
+    """
+    Export ``month`` to a gzip JSONL file, remove it from the live table and
+    record it in ``ActivityLogArchive``.
+    """
+    connection = connection or _connection()
+    options = config()
+    directory = directory or options['ARCHIVE_DIR']
+    batch_size = batch_size or options['BATCH_SIZE']
+    month = month_of(month)
+    os.makedirs(directory, exist_ok=True)
+
+    has_partition = month in partitions(connection)
+    path = _archive_path(directory, month)
+    count, sha256, last_id = _write_archive(_month_rows(connection, month, batch_size), path)
+
+    try:
+        if has_partition:
+            _drop_partition(connection, month, count)
+        elif count:
+            # Only rows that were exported; later arrivals keep higher IDs.
+            _delete_rows(connection, month, last_id, batch_size)
+    except Exception:
+        os.remove(path)
+        raise
+
+    if not count:
+        os.remove(path)
+        return None
+    archive = ActivityLogArchive.objects.using(connection.alias).create(
+        month=month, path=path, row_count=count, sha256=sha256,
+    )
+    logger.info('Archived %s activity log rows of %s to %s', count, f'{month:%Y-%m}', path)
+    return archive
+
+
+def archived_months(start=None, end=None):
+    """``YYYY-MM`` labels of archived months overlapping ``[start, end)``."""
+    archives = ActivityLogArchive.objects.all()
+    if start is not None:
+        archives = archives.filter(month__gte=month_of(start))
+    if end is not None:
+        last = month_of(end)
+        # end is exclusive: a range ending where a month starts excludes it.
+        if _is_month_start(end):
+            archives = archives.filter(month__lt=last)
+        else:
+            archives = archives.filter(month__lte=last)
+    months = archives.order_by('month').values_list('month', flat=True).distinct()
+    return [f'{month:%Y-%m}' for month in months]
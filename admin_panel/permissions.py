@@ -1,48 +1,47 @@
 from rest_framework import permissions
-from django.contrib.contenttypes.models import ContentType
-from admin_panel.models import User, Institution, College, Department, Job
+from admin_panel.policy import STAFF_ROLES, get_request_policy
 
 
 class IsSuperAdmin(permissions.BasePermission):
     """Only Super Admin can access"""
     def has_permission(self, request, view):
-        return request.user and request.user.is_authenticated and request.user.role == 'super_admin'
+        return get_request_policy(request).has_role('super_admin')
 
 
 class IsInstitutionAdmin(permissions.BasePermission):
     """Only Institution Admin can access"""
     def has_permission(self, request, view):
-        return request.user and request.user.is_authenticated and request.user.role == 'institution_admin'
+        return get_request_policy(request).has_role('institution_admin')
 
 
 class IsHR(permissions.BasePermission):
     """Only HR can access"""
     def has_permission(self, request, view):
-        return request.user and request.user.is_authenticated and request.user.role == 'hr'
+        return get_request_policy(request).has_role('hr')
 
 
 class IsHOD(permissions.BasePermission):
     """Only HOD can access"""
     def has_permission(self, request, view):
-        return request.user and request.user.is_authenticated and request.user.role == 'hod'
+        return get_request_policy(request).has_role('hod')
 
 
 class IsApplicant(permissions.BasePermission):
     """Only Applicants can access"""
     def has_permission(self, request, view):
-        return request.user and request.user.is_authenticated and request.user.role == 'applicant'
+        return get_request_policy(request).has_role('applicant')
 
 
 class IsSuperAdminOrInstitutionAdmin(permissions.BasePermission):
     """Super Admin or Institution Admin can access"""
     def has_permission(self, request, view):
-        return request.user and request.user.is_authenticated and request.user.role in ['super_admin', 'institution_admin']
+        return get_request_policy(request).has_role('super_admin', 'institution_admin')
 
 
 class IsHROrHOD(permissions.BasePermission):
     """HR or HOD can access"""
     def has_permission(self, request, view):
-        return request.user and request.user.is_authenticated and request.user.role in ['hr', 'hod']
+        return get_request_policy(request).has_role('hr', 'hod')
 
 
 class CanAccessInstitution(permissions.BasePermission):
@@ -51,16 +50,12 @@ class CanAccessInstitution(permissions.BasePermission):
     Institution Admin: Can access only their institution
     """
     def has_permission(self, request, view):
-        if not request.user or not request.user.is_authenticated:
-            return False
-        return request.user.role in ['super_admin', 'institution_admin', 'hr', 'hod']
+        return get_request_policy(request).has_role(*STAFF_ROLES)
     
     def has_object_permission(self, request, view, obj):
-        if request.user.role == 'super_admin':
-            return True
-        if request.user.role in ['institution_admin', 'hr', 'hod']:
-            return request.user.institution == obj if hasattr(obj, 'institution') else request.user.institution_id == obj.id
-        return False
+        # The object's institution, or the object itself if it is one
+        institution_id = obj.institution_id if hasattr(obj, 'institution_id') else obj.pk
+        return get_request_policy(request).can_access_institution(institution_id)
 
 
 class CanAccessCollege(permissions.BasePermission):
@@ -70,18 +65,10 @@ class CanAccessCollege(permissions.BasePermission):
     HR/HOD: Can access assigned colleges
     """
     def has_permission(self, request, view):
-        if not request.user or not request.user.is_authenticated:
-            return False
-        return request.user.role in ['super_admin', 'institution_admin', 'hr', 'hod']
+        return get_request_policy(request).has_role(*STAFF_ROLES)
     
     def has_object_permission(self, request, view, obj):
-        if request.user.role == 'super_admin':
-            return True
-        if request.user.role == 'institution_admin':
-            return request.user.institution == obj.institution
-        if request.user.role in ['hr', 'hod']:
-            return request.user.assigned_colleges.filter(id=obj.id).exists()
-        return False
+        return get_request_policy(request).can_access_college(obj.pk, getattr(obj, 'institution_id', None))
 
 
 class CanAccessDepartment(permissions.BasePermission):
@@ -91,19 +78,12 @@ class CanAccessDepartment(permissions.BasePermission):
     HR/HOD: Can access assigned departments
     """
     def has_permission(self, request, view):
-        if not request.user or not request.user.is_authenticated:
-            return False
-        return request.user.role in ['super_admin', 'institution_admin', 'hr', 'hod']
+        return get_request_policy(request).has_role(*STAFF_ROLES)
     
     def has_object_permission(self, request, view, obj):
-        if request.user.role == 'super_admin':
-            return True
-        if request.user.role == 'institution_admin':
-            return request.user.institution == obj.institution
-        if request.user.role in ['hr', 'hod']:
-            return request.user.assigned_departments.filter(id=obj.id).exists() or \
-                   request.user.assigned_colleges.filter(id=obj.college_id).exists()
-        return False
+        return get_request_policy(request).can_access_department(
+            obj.pk, getattr(obj, 'college_id', None), getattr(obj, 'institution_id', None)
+        )
 
 
 class CanCreateOrApproveJob(permissions.BasePermission):
@@ -114,25 +94,13 @@ class CanCreateOrApproveJob(permissions.BasePermission):
     Super Admin: Can do anything
     """
     def has_permission(self, request, view):
-        if not request.user or not request.user.is_authenticated:
-            return False
-        return request.user.role in ['super_admin', 'institution_admin', 'hr', 'hod']
+        return get_request_policy(request).has_role(*STAFF_ROLES)
     
     def has_object_permission(self, request, view, obj):
-        if request.user.role == 'super_admin':
-            return True
-        if request.user.role == 'institution_admin':
-            return request.user.institution == obj.institution
-        if request.user.role == 'hr':
-            # HR can manage jobs in assigned colleges/departments
-            if obj.department and request.user.assigned_departments.filter(id=obj.department_id).exists():
-                return True
-            if request.user.assigned_colleges.filter(id=obj.college_id).exists():
-                return True
-        if request.user.role == 'hod':
-            # HOD can manage jobs they created
-            return request.user == obj.created_by
-        return False
+        return get_request_policy(request).can_manage_job(
+            getattr(obj, 'institution_id', None), getattr(obj, 'college_id', None),
+            getattr(obj, 'department_id', None), getattr(obj, 'created_by_id', None)
+        )
 
 
 class CanManageApplications(permissions.BasePermission):
@@ -142,17 +110,14 @@ class CanManageApplications(permissions.BasePermission):
     Super Admin: Can manage any application
     """
     def has_permission(self, request, view):
-        if not request.user or not request.user.is_authenticated:
-            return False
-        return request.user.role in ['super_admin', 'institution_admin', 'hr']
+        return get_request_policy(request).has_role('super_admin', 'institution_admin', 'hr')
     
     def has_object_permission(self, request, view, obj):
-        if request.user.role == 'super_admin':
+        policy = get_request_policy(request)
+        if policy.has_role('super_admin'):
             return True
-        if request.user.role == 'institution_admin':
-            return request.user.institution == obj.job.institution
-        if request.user.role == 'hr':
-            return request.user == obj.job.created_by or \
-                   request.user.assigned_departments.filter(id=obj.job.department_id).exists() or \
-                   request.user.assigned_colleges.filter(id=obj.job.college_id).exists()
-        return False
+        # ApplicationViewSet selects the job with the application
+        job = obj.job
+        return policy.can_manage_application(
+            obj.job_id, job.institution_id, job.college_id, job.department_id
+        )
@@ -0,0 +1,144 @@
+"""
+Per-request permission grants.
+
+``get_request_policy(request)`` compiles the caller's grants once per
+request: role, institution ID, the college/department IDs of their role
+scope (``admin_panel.scope``) and, loaded on first use, the IDs of the jobs
+they created. The rules then compare plain integer IDs of the object
+(``institution_id``, ``college_id``, ...) with those sets.
+
+Each permission class in ``admin_panel.permissions`` applies its own rule,
+whatever the type of the object it is asked about. ``filter_jobs`` and
+``filter_applications`` apply the same rules to a whole queryset as one SQL
+condition.
+"""
+from django.db.models import Q
+
+from admin_panel.models import Job
+from admin_panel.scope import get_request_scope, get_user_scope
+
+STAFF_ROLES = ('super_admin', 'institution_admin', 'hr', 'hod')
+
+
+class Policy:
+    """Compiled grants of one user; ``role`` is None for anonymous users."""
+    __slots__ = ('user_id', 'role', 'institution_id', 'college_ids', 'department_ids', '_created_job_ids')
+
+    def __init__(self, user_id, role, institution_id=None, college_ids=(), department_ids=()):
+        self.user_id = user_id
+        self.role = role
+        self.institution_id = institution_id
+        self.college_ids = frozenset(college_ids)
+        self.department_ids = frozenset(department_ids)
+        self._created_job_ids = None
+
+    @classmethod
+    def for_user(cls, user, scope=None):
+        if not user or not user.is_authenticated:
+            return cls(None, None)
+        if user.role in ('hr', 'hod'):
+            scope = scope or get_user_scope(user)
+            return cls(user.pk, user.role, user.institution_id, scope.college_ids, scope.department_ids)
+        return cls(user.pk, user.role, user.institution_id)
+
+    def __repr__(self):
+        return f'Policy(user={self.user_id}, role={self.role}, institution={self.institution_id})'
+
+    def has_role(self, *roles):
+        return self.role in roles
+
+    @property
+    def created_job_ids(self):
+        """IDs of the jobs this user created (one query, on first use)."""
+        if self._created_job_ids is None:
+            self._created_job_ids = frozenset(
+                Job.objects.filter(created_by_id=self.user_id).values_list('pk', flat=True)
+                if self.user_id is not None else ()
+            )
+        return self._created_job_ids
+
+    # Rules, on plain IDs.
+
+    def can_access_institution(self, institution_id):
+        if self.role == 'super_admin':
+            return True
+        return self.role in STAFF_ROLES and self.institution_id == institution_id
+
+    def can_access_college(self, college_id, institution_id):
+        if self.role == 'super_admin':
+            return True
+        if self.role == 'institution_admin':
+            return self.institution_id == institution_id
+        if self.role in ('hr', 'hod'):
+            return college_id in self.college_ids
+        return False
+
+    def can_access_department(self, department_id, college_id, institution_id):
+        if self.role == 'super_admin':
+            return True
+        if self.role == 'institution_admin':
+            return self.institution_id == institution_id
+        if self.role in ('hr', 'hod'):
+            return department_id in self.department_ids or college_id in self.college_ids
+        return False
+
+    def can_manage_job(self, institution_id, college_id, department_id, created_by_id):
+        if self.role == 'super_admin':
+            return True
+        if self.role == 'institution_admin':
+            return self.institution_id == institution_id
+        if self.role == 'hr':
+            return (department_id is not None and department_id in self.department_ids) \
+                or college_id in self.college_ids
+        if self.role == 'hod':
+            return self.user_id == created_by_id
+        return False
+
+    def can_manage_application(self, job_id, institution_id, college_id, department_id):
+        """IDs are those of the application's job."""
+        if self.role == 'super_admin':
+            return True
+        if self.role == 'institution_admin':
+            return self.institution_id == institution_id
+        if self.role == 'hr':
+            return department_id in self.department_ids or college_id in self.college_ids \
+                or job_id in self.created_job_ids
+        return False
+
+    # The same rules as queryset filters.
+
+    def _job_q(self, prefix=''):
+        if self.role == 'super_admin':
+            return Q()
+        if self.role == 'institution_admin':
+            return Q(**{f'{prefix}institution_id': self.institution_id})
+        if self.role == 'hr':
+            return Q(**{f'{prefix}college_id__in': self.college_ids}) \
+                | Q(**{f'{prefix}department_id__in': self.department_ids})
+        if self.role == 'hod':
+            return Q(**{f'{prefix}created_by_id': self.user_id})
+        return Q(pk__in=())
+
+    def filter_jobs(self, queryset):
+        """Jobs of ``queryset`` that ``can_manage_job`` allows."""
+        return queryset.filter(self._job_q())
+
+    def filter_applications(self, queryset):
+        """Applications of ``queryset`` that ``can_manage_application`` allows."""
+        if self.role in ('super_admin', 'institution_admin'):
+            return queryset.filter(self._job_q('job__'))
+        if self.role == 'hr':
+            return queryset.filter(self._job_q('job__') | Q(job__created_by_id=self.user_id))
+        return queryset.none()
+
+
+def get_request_policy(request):
+    """Policy of ``request.user``, compiled once per request."""
+    target = getattr(request, '_request', request)
+    policy = getattr(target, '_policy', None)
+    if policy is None or policy.user_id != request.user.pk:
+        user = request.user
+        scope = get_request_scope(request) if user.is_authenticated and user.role in ('hr', 'hod') else None
+        policy = Policy.for_user(user, scope)
+        target._policy = policy
+    return policy
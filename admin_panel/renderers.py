@@ -0,0 +1,80 @@
+"""
+Renderers for file exports.
+
+Besides DRF's ``render`` (used for error responses and small payloads),
+each renderer has ``stream(columns, rows)``: a generator of encoded chunks
+for ``StreamingHttpResponse``. Export views feed it a ``values()``
+iterator, so memory use does not grow with the number of rows.
+"""
+import csv
+import io
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+from rest_framework.renderers import BaseRenderer
+
+ROWS_PER_CHUNK = 500
+
+
+def _columns(data):
+    if isinstance(data, dict):
+        data = [data]
+    return data, list(dict.fromkeys(key for row in data for key in row))
+
+
+class CSVRenderer(BaseRenderer):
+    media_type = 'text/csv'
+    format = 'csv'
+    charset = 'utf-8'
+    # Text starting with these is evaluated as a formula by spreadsheets
+    formula_prefixes = ('=', '+', '-', '@', '\t', '\r')
+
+    def clean(self, value):
+        if value is None:
+            return ''
+        if hasattr(value, 'isoformat'):
+            return value.isoformat()
+        if isinstance(value, str) and value.startswith(self.formula_prefixes):
+            return "'" + value
+        return value
+
+    def stream(self, columns, rows, rows_per_chunk=ROWS_PER_CHUNK):
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(columns)
+        for count, row in enumerate(rows, 1):
+            writer.writerow([self.clean(row.get(column)) for column in columns])
+            if count % rows_per_chunk == 0:
+                yield buffer.getvalue().encode(self.charset)
+                buffer.seek(0)
+                buffer.truncate()
+        if buffer.tell():
+            yield buffer.getvalue().encode(self.charset)
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        rows, columns = _columns(data)
+        return b''.join(self.stream(columns, rows))
+
+
+class JSONLinesRenderer(BaseRenderer):
+    media_type = 'application/x-ndjson'
+    format = 'jsonl'
+    charset = 'utf-8'
+
+    def stream(self, columns, rows, rows_per_chunk=ROWS_PER_CHUNK):
+        lines = []
+        for row in rows:
+            lines.append(json.dumps({column: row.get(column) for column in columns}, cls=DjangoJSONEncoder))
+            if len(lines) == rows_per_chunk:
+                yield ('\n'.join(lines) + '\n').encode(self.charset)
+                lines = []
+        if lines:
+            yield ('\n'.join(lines) + '\n').encode(self.charset)
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        rows, columns = _columns(data)
+        return b''.join(self.stream(columns, rows))
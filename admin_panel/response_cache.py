@@ -0,0 +1,82 @@
+"""
+Versioned response cache for read-heavy endpoints.
+
+Cached responses live in the cache alias ``settings.RESPONSE_CACHE['ALIAS']``
+under keys that embed a namespace version, e.g.
+``admin_panel:response:jobs:<version>:<scope>:<url hash>``. Changing a row
+that the namespace depends on bumps the version once the transaction
+commits. Every older entry becomes unreachable and simply expires, so no key
+scan or delete pattern is needed and every backend works (local memory,
+file, Redis).
+
+``jobs`` is bumped when a Job, College, Department or Institution is saved or
+deleted, by Job's ``QuerySet.update``, ``bulk_update`` and ``bulk_create``,
+and whenever the application counters change (``admin_panel.counters``).
+Code that changes colleges, departments or institutions in bulk calls
+``invalidate('jobs')`` itself.
+
+See ``ResponseCacheMixin`` in ``admin_panel.viewsets.mixins`` for the view
+side (scope keys, ETag / Last-Modified, 304 responses).
+"""
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from admin_panel.models import College, Department, Institution, Job
+
+DEFAULTS = {
+    'ENABLED': True,
+    'ALIAS': 'default',
+    'TIMEOUT': 300,
+}
+
+VERSION_KEY = 'admin_panel:response_version:{}'
+KEY = 'admin_panel:response:{namespace}:{version}:{scope}:{digest}'
+
+
+def config():
+    return {**DEFAULTS, **getattr(settings, 'RESPONSE_CACHE', {})}
+
+
+def get_cache():
+    return caches[config()['ALIAS']]
+
+
+def namespace_version(namespace):
+    cache = get_cache()
+    key = VERSION_KEY.format(namespace)
+    version = cache.get(key)
+    if version is None:
+        # Seed from the clock so a flushed cache never reuses old versions.
+        cache.add(key, time.time_ns(), timeout=None)
+        version = cache.get(key)
+    return version
+
+
+def invalidate(namespace):
+    """Bump ``namespace``'s version once the current transaction commits."""
+    def bump():
+        cache = get_cache()
+        key = VERSION_KEY.format(namespace)
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, time.time_ns(), timeout=None)
+
+    transaction.on_commit(bump)
+
+
+@receiver(post_save, sender=Job)
+@receiver(post_delete, sender=Job)
+@receiver(post_save, sender=College)
+@receiver(post_delete, sender=College)
+@receiver(post_save, sender=Department)
+@receiver(post_delete, sender=Department)
+@receiver(post_save, sender=Institution)
+@receiver(post_delete, sender=Institution)
+def _job_data_changed(sender, **kwargs):
+    invalidate('jobs')
@@ -0,0 +1,217 @@
+"""
+Cached role scope (assigned college/department IDs) for HR and HOD users.
+
+Scopes are resolved in three layers:
+
+1. request-local: memoized on the request for the rest of that request;
+2. process-wide LRU: keyed by user ID and tagged with a scope version;
+3. database: two small queries on the M2M through tables.
+
+The scope version lives in Django's default cache. Workers only see each
+other's invalidations when that cache is shared between processes (redis,
+or file on a single host). With the per-process locmem default, which
+``admin_panel.checks`` warns about, layer 2 is skipped and every request
+loads its scope from the database. The version is bumped on commit whenever
+``assigned_colleges``/``assigned_departments`` or an ``HRAssignment`` of the
+user changes, and when the user's role, institution, status or active flag
+is saved with a new value, which also retires the JWT claims issued for the
+old version (``admin_panel.authentication``).
+"""
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from admin_panel.checks import cache_is_shared
+from admin_panel.db_router import use_primary
+from admin_panel.models import HRAssignment, User
+
+VERSION_KEY = 'admin_panel:scope_version:{}'
+
+# User fields carried by (or checked for) JWT claims.
+VERSIONED_FIELDS = ('role', 'institution_id', 'status', 'is_active')
+
+
+class UserScope:
+    """Immutable set of IDs a user is assigned to."""
+    __slots__ = ('user_id', 'version', 'college_ids', 'department_ids')
+
+    def __init__(self, user_id, version, college_ids, department_ids):
+        self.user_id = user_id
+        self.version = version
+        self.college_ids = frozenset(college_ids)
+        self.department_ids = frozenset(department_ids)
+
+    def __repr__(self):
+        return (
+            f'UserScope(user={self.user_id}, colleges={sorted(self.college_ids)}, '
+            f'departments={sorted(self.department_ids)})'
+        )
+
+
+class _LRU:
+    def __init__(self):
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        max_size = getattr(settings, 'SCOPE_CACHE_SIZE', 2048)
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > max_size:
+                self._data.popitem(last=False)
+
+    def discard(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
+_local_cache = _LRU()
+
+
+def scope_version(user_id):
+    """Current scope version of a user, initialising it on first use."""
+    key = VERSION_KEY.format(user_id)
+    version = cache.get(key)
+    if version is None:
+        # Seed from the clock so a cache flush can never resurrect an old
+        # version that is still held in some process-local LRU.
+        cache.add(key, time.time_ns(), timeout=None)
+        version = cache.get(key)
+    return version
+
+
+def _load(user_id, version):
+    # Cached under ``version``: never from a replica that may lag behind it.
+    with use_primary():
+        college_ids = User.assigned_colleges.through.objects.filter(
+            user_id=user_id
+        ).values_list('college_id', flat=True)
+        department_ids = User.assigned_departments.through.objects.filter(
+            user_id=user_id
+        ).values_list('department_id', flat=True)
+        return UserScope(user_id, version, college_ids, department_ids)
+
+
+def get_user_scope(user):
+    """Scope of ``user`` from the process LRU, loading it if stale."""
+    version = scope_version(user.pk)
+    if not cache_is_shared():
+        # Another worker's bump would never reach this process.
+        return _load(user.pk, version)
+    scope = _local_cache.get(user.pk)
+    if scope is None or scope.version != version:
+        scope = _load(user.pk, version)
+        _local_cache.set(user.pk, scope)
+    return scope
+
+
+def get_request_scope(request):
+    """Scope of ``request.user``, memoized on the request."""
+    target = getattr(request, '_request', request)
+    scope = getattr(target, '_user_scope', None)
+    if scope is None or scope.user_id != request.user.pk:
+        scope = get_user_scope(request.user)
+        target._user_scope = scope
+    return scope
+
+
+def invalidate(user_ids):
+    """Drop cached scopes of ``user_ids`` once the current transaction commits."""
+    user_ids = [user_id for user_id in user_ids if user_id is not None]
+    if not user_ids:
+        return
+
+    def bump():
+        for user_id in user_ids:
+            key = VERSION_KEY.format(user_id)
+            try:
+                cache.incr(key)
+            except ValueError:
+                cache.set(key, time.time_ns(), timeout=None)
+            _local_cache.discard(user_id)
+
+    transaction.on_commit(bump)
+
+
+def _assignment_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    if reverse:
+        # instance is a College/Department; affected users are in pk_set,
+        # except for clear, where they must be read before the rows go.
+        if action == 'pre_clear':
+            field = 'college' if sender is User.assigned_colleges.through else 'department'
+            invalidate(sender.objects.filter(**{field: instance}).values_list('user_id', flat=True))
+        elif action in ('post_add', 'post_remove'):
+            invalidate(pk_set or ())
+    elif action in ('post_add', 'post_remove', 'post_clear'):
+        invalidate([instance.pk])
+
+
+m2m_changed.connect(_assignment_changed, sender=User.assigned_colleges.through)
+m2m_changed.connect(_assignment_changed, sender=User.assigned_departments.through)
+
+
+@receiver(post_save, sender=HRAssignment)
+@receiver(post_delete, sender=HRAssignment)
+def _hr_assignment_changed(sender, instance, **kwargs):
+    invalidate([instance.hr_user_id])
+
+
+def versioned(fields):
+    """Whether saving ``fields`` (names or attnames) can change a scope version."""
+    return any(
+        field in VERSIONED_FIELDS or field == 'institution' for field in fields
+    )
+
+
+@receiver(post_delete, sender=User)
+def _user_deleted(sender, instance, **kwargs):
+    invalidate([instance.pk])
+
+
+def remember(user):
+    """Record the versioned fields of a freshly loaded user (if loaded)."""
+    deferred = user.get_deferred_fields()
+    if any(field in deferred for field in VERSIONED_FIELDS):
+        user.__dict__.pop('_scope_fields', None)
+    else:
+        user._scope_fields = {field: getattr(user, field) for field in VERSIONED_FIELDS}
+
+
+@receiver(pre_save, sender=User)
+def _user_changed(sender, instance, raw=False, update_fields=None, **kwargs):
+    if raw or instance._state.adding or instance.pk is None:
+        return
+    fields = VERSIONED_FIELDS
+    if update_fields is not None:
+        fields = [
+            field for field in fields
+            if field in update_fields or field == 'institution_id' and 'institution' in update_fields
+        ]
+        if not fields:
+            return
+    stored = instance.__dict__.get('_scope_fields')
+    if stored is None:
+        with use_primary():
+            stored = User.objects.filter(pk=instance.pk).values(*fields).first()
+    if stored is None or any(stored[field] != getattr(instance, field) for field in fields):
+        invalidate([instance.pk])
+    if '_scope_fields' in instance.__dict__:
+        instance._scope_fields.update({field: getattr(instance, field) for field in fields})
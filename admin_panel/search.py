@@ -0,0 +1,216 @@
+"""
+Full-text search for jobs.
+
+``settings.SEARCH_BACKEND`` selects how ``?search=`` is answered:
+
+``auto`` (default)
+    Full-text search on the database in use, if its index is installed;
+    otherwise the ``icontains`` search of DRF's ``SearchFilter``.
+``postgresql``
+    ``admin_panel_job.search_vector``, a generated ``tsvector`` column with a
+    GIN index (migration 0006), ranked with ``ts_rank``. Job title weighs
+    more than qualification, which weighs more than the description.
+``sqlite``
+    An FTS5 table ``admin_panel_job_fts`` over the same columns, kept in step
+    by triggers and ranked with ``bm25``. It is (re)installed after every
+    ``migrate`` because SQLite drops triggers when it rebuilds a table.
+``basic``
+    Always ``icontains``.
+
+Both indexes are maintained by the database itself, so ``Job.save``,
+``QuerySet.update`` and ``bulk_create`` all keep them current.
+"""
+import logging
+import re
+
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.db import connections
+from django.db.models import BooleanField, FloatField
+from django.db.models.expressions import RawSQL
+from django.db.models.signals import post_migrate
+from django.dispatch import receiver
+from rest_framework.filters import SearchFilter
+
+from admin_panel.models import Job
+
+logger = logging.getLogger(__name__)
+
+JOB_TABLE = Job._meta.db_table
+FTS_TABLE = f'{JOB_TABLE}_fts'
+# Indexed columns, most important first.
+SEARCH_COLUMNS = ('job_title', 'qualification', 'job_description')
+
+_available = {}
+
+
+def _backend_name(connection):
+    name = getattr(settings, 'SEARCH_BACKEND', 'auto')
+    if name == 'auto':
+        name = connection.vendor
+    if name not in BACKENDS:
+        return 'basic'
+    if name != connection.vendor:
+        raise ValueError(f'SEARCH_BACKEND {name!r} does not match the {connection.vendor} database')
+    if connection.alias not in _available:
+        _available[connection.alias] = BACKENDS[name].is_installed(connection)
+    return name if _available[connection.alias] else 'basic'
+
+
+@receiver(setting_changed)
+def _reset(setting, **kwargs):
+    if setting in ('SEARCH_BACKEND', 'DATABASES'):
+        _available.clear()
+
+
+# ---------------------------------------------------------------------------
+# PostgreSQL
+# ---------------------------------------------------------------------------
+
+class PostgresJobSearch:
+    """``tsvector`` column + GIN index, queried with ``websearch_to_tsquery``."""
+
+    @staticmethod
+    def is_installed(connection):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                'SELECT 1 FROM information_schema.columns '
+                "WHERE table_name = %s AND column_name = 'search_vector'", [JOB_TABLE]
+            )
+            return cursor.fetchone() is not None
+
+    @staticmethod
+    def search(queryset, terms):
+        column = f'{connections[queryset.db].ops.quote_name(JOB_TABLE)}.search_vector'
+        query = "websearch_to_tsquery('english', %s)"
+        return queryset.filter(
+            RawSQL(f'{column} @@ {query}', [terms], output_field=BooleanField())
+        ).annotate(
+            search_rank=RawSQL(f'ts_rank({column}, {query})', [terms], output_field=FloatField())
+        )
+
+
+# ---------------------------------------------------------------------------
+# SQLite
+# ---------------------------------------------------------------------------
+
+class SQLiteJobSearch:
+    """External-content FTS5 table over ``admin_panel_job``, ranked with bm25."""
+    # bm25 column weights, in SEARCH_COLUMNS order.
+    weights = (10.0, 4.0, 1.0)
+
+    @staticmethod
+    def is_installed(connection):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT count(*) FROM sqlite_master WHERE name = %s OR "
+                "(type = 'trigger' AND tbl_name = %s AND name LIKE %s)",
+                [FTS_TABLE, JOB_TABLE, f'{FTS_TABLE}_%'],
+            )
+            return cursor.fetchone()[0] == 4
+
+    @staticmethod
+    def install(connection):
+        """Create the FTS table and triggers if missing, then rebuild it."""
+        columns = ', '.join(SEARCH_COLUMNS)
+        new = ', '.join(f'new.{column}' for column in SEARCH_COLUMNS)
+        old = ', '.join(f'old.{column}' for column in SEARCH_COLUMNS)
+        delete = (
+            f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, {columns}) VALUES ('delete', old.id, {old});"
+        )
+        insert = f'INSERT INTO {FTS_TABLE}(rowid, {columns}) VALUES (new.id, {new});'
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5({columns}, '
+                f"content='{JOB_TABLE}', content_rowid='id', tokenize='porter unicode61')"
+            )
+            cursor.execute(
+                f'CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_insert AFTER INSERT ON {JOB_TABLE} '
+                f'BEGIN {insert} END'
+            )
+            cursor.execute(
+                f'CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_delete AFTER DELETE ON {JOB_TABLE} '
+                f'BEGIN {delete} END'
+            )
+            cursor.execute(
+                f'CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_update AFTER UPDATE OF {columns} '
+                f'ON {JOB_TABLE} BEGIN {delete} {insert} END'
+            )
+            cursor.execute(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')")
+
+    @staticmethod
+    def match_expression(terms):
+        """Quote each word so user input can't break FTS5 query syntax."""
+        words = re.findall(r'\w+', terms)
+        return ' '.join(f'"{word}"*' for word in words)
+
+    @classmethod
+    def search(cls, queryset, terms):
+        match = cls.match_expression(terms)
+        if not match:
+            return queryset.none()
+        job_id = f'{connections[queryset.db].ops.quote_name(JOB_TABLE)}.id'
+        weights = ', '.join(str(weight) for weight in cls.weights)
+        return queryset.filter(
+            RawSQL(
+                f'{job_id} IN (SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s)',
+                [match], output_field=BooleanField(),
+            )
+        ).annotate(
+            # bm25 is lower for better matches
+            search_rank=RawSQL(
+                f'(SELECT -bm25({FTS_TABLE}, {weights}) FROM {FTS_TABLE} '
+                f'WHERE {FTS_TABLE} MATCH %s AND rowid = {job_id})',
+                [match], output_field=FloatField(),
+            )
+        )
+
+
+BACKENDS = {
+    'postgresql': PostgresJobSearch,
+    'sqlite': SQLiteJobSearch,
+}
+
+
+@receiver(post_migrate)
+def _install_sqlite_index(sender, using='default', **kwargs):
+    if sender.name != 'admin_panel':
+        return
+    connection = connections[using]
+    _available.pop(using, None)
+    if connection.vendor == 'sqlite' and not SQLiteJobSearch.is_installed(connection):
+        try:
+            SQLiteJobSearch.install(connection)
+        except Exception:
+            # e.g. SQLite built without FTS5; search falls back to icontains
+            logger.warning('Could not install the SQLite job search index', exc_info=True)
+
+
+# ---------------------------------------------------------------------------
+# Filter backend
+# ---------------------------------------------------------------------------
+
+def search_jobs(queryset, terms):
+    """Filter ``queryset`` to jobs matching ``terms``, best matches first."""
+    connection = connections[queryset.db]
+    name = _backend_name(connection)
+    if name == 'basic':
+        return None
+    return BACKENDS[name].search(queryset, terms).order_by('-search_rank', '-created_at')
+
+
+class JobSearchFilter(SearchFilter):
+    """
+    ``?search=`` through the configured full-text backend; falls back to
+    ``SearchFilter`` (``icontains`` over ``search_fields``) when none is
+    available. An explicit ``?ordering=`` still wins over rank.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        terms = ' '.join(self.get_search_terms(request))
+        if not terms:
+            return queryset
+        results = search_jobs(queryset, terms)
+        if results is None:
+            return super().filter_queryset(request, queryset, view)
+        return results
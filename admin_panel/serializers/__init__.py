@@ -1,5 +1,5 @@
 from .user import (
-    UserListSerializer, UserDetailSerializer, UserCreateUpdateSerializer,
+    UserListSerializer, UserSummarySerializer, UserDetailSerializer, UserCreateUpdateSerializer,
     UserProfileSerializer, ChangePasswordSerializer
 )
 from .institution import InstitutionSerializer
@@ -7,7 +7,7 @@ from .college import CollegeSerializer
 from .department import DepartmentSerializer
 from .job import (
     JobListSerializer, JobDetailSerializer, JobCreateUpdateSerializer,
-    JobApprovalSerializer, JobSelectionSerializer
+    JobImportSerializer, JobApprovalSerializer, JobSelectionSerializer
 )
 from .hr_assignment import HRAssignmentSerializer
 from .education import EducationSerializer
@@ -18,12 +18,13 @@ from .applicant import (
 )
 from .application import (
     ApplicationListSerializer, ApplicationDetailSerializer, ApplicationCreateSerializer,
-    ApplicationStatusUpdateSerializer
+    ApplicationStatusUpdateSerializer, ApplicationBulkStatusSerializer
 )
 from .activity_log import ActivityLogSerializer
 
 __all__ = [
     'UserListSerializer',
+    'UserSummarySerializer',
     'UserDetailSerializer',
     'UserCreateUpdateSerializer',
     'UserProfileSerializer',
@@ -34,6 +35,7 @@ __all__ = [
     'JobListSerializer',
     'JobDetailSerializer',
     'JobCreateUpdateSerializer',
+    'JobImportSerializer',
     'JobApprovalSerializer',
     'JobSelectionSerializer',
     'HRAssignmentSerializer',
@@ -48,5 +50,6 @@ __all__ = [
     'ApplicationDetailSerializer',
     'ApplicationCreateSerializer',
     'ApplicationStatusUpdateSerializer',
+    'ApplicationBulkStatusSerializer',
     'ActivityLogSerializer',
 ]
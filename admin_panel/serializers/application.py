@@ -65,3 +65,21 @@ class ApplicationStatusUpdateSerializer(serializers.ModelSerializer):
         model = Application
         fields = ['id', 'status', 'status_display', 'remarks']
         read_only_fields = ['id', 'status_display']
+
+
+class ApplicationBulkStatusSerializer(serializers.Serializer):
+    """Input for moving many applications to one status."""
+    ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1), allow_empty=False, max_length=1000
+    )
+    status = serializers.ChoiceField(choices=Application.APPLICATION_STATUS_CHOICES)
+    remarks = serializers.CharField(required=False, allow_blank=True, default='')
+    
+    def validate_status(self, value):
+        if value == 'selected':
+            # Selection also closes the job; it stays a single-application action.
+            raise serializers.ValidationError('Use mark_selected to select an applicant.')
+        return value
+    
+    def validate_ids(self, value):
+        return list(dict.fromkeys(value))
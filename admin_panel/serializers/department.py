@@ -1,4 +1,5 @@
 from rest_framework import serializers
+from admin_panel.counters import job_total
 from admin_panel.models import Department
 
 
@@ -13,4 +14,8 @@ class DepartmentSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'created_at', 'updated_at']
     
     def get_total_jobs(self, obj):
-        return obj.jobs.filter(job_status='open').count()
+        # Published jobs; annotated by the viewset, else read from JobCounter.
+        count = getattr(obj, 'published_job_count', None)
+        if count is None:
+            count = job_total(department_id=obj.id)
+        return count
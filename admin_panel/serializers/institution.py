@@ -1,4 +1,5 @@
 from rest_framework import serializers
+from admin_panel.counters import job_total
 from admin_panel.models import Institution
 
 
@@ -21,4 +22,8 @@ class InstitutionSerializer(serializers.ModelSerializer):
         return obj.departments.filter(status='active').count()
     
     def get_total_jobs(self, obj):
-        return obj.jobs.filter(job_status='open').count()
+        # Published jobs; annotated by the viewset, else read from JobCounter.
+        count = getattr(obj, 'published_job_count', None)
+        if count is None:
+            count = job_total(institution_id=obj.id)
+        return count
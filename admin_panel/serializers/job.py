@@ -3,6 +3,7 @@ Job serializers for job posting management.
 """
 from rest_framework import serializers
 from admin_panel.models import Job, Application
+from admin_panel.counters import application_total
 
 
 class JobListSerializer(serializers.ModelSerializer):
@@ -27,7 +28,11 @@ class JobListSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'created_at', 'updated_at', 'approved_by', 'published_at', 'closed_at']
     
     def get_total_applications(self, obj):
-        return obj.applications.count()
+        # JobViewSet annotates the count; fall back to the counter table.
+        count = getattr(obj, 'application_count', None)
+        if count is None:
+            count = application_total(obj.id)
+        return count
     
     def get_is_deadline_passed(self, obj):
         return obj.is_deadline_passed()
@@ -64,7 +69,11 @@ class JobDetailSerializer(serializers.ModelSerializer):
         ]
     
     def get_total_applications(self, obj):
-        return obj.applications.count()
+        # JobViewSet annotates the count; fall back to the counter table.
+        count = getattr(obj, 'application_count', None)
+        if count is None:
+            count = application_total(obj.id)
+        return count
     
     def get_is_deadline_passed(self, obj):
         return obj.is_deadline_passed()
@@ -82,6 +91,56 @@ class JobCreateUpdateSerializer(serializers.ModelSerializer):
         ]
 
 
+class JobImportSerializer(JobCreateUpdateSerializer):
+    """
+    One row of a bulk job import. Institution, college and department are
+    given by code and resolved through the preloaded maps in
+    ``context['lookups']`` (see ``admin_panel.job_import``), so validating a
+    row runs no query.
+    """
+    institution_code = serializers.CharField(required=False, allow_blank=True)
+    college_code = serializers.CharField()
+    department_code = serializers.CharField(required=False, allow_blank=True)
+    
+    class Meta(JobCreateUpdateSerializer.Meta):
+        fields = [
+            'job_title', 'job_description', 'institution_code', 'college_code',
+            'department_code', 'job_type', 'experience_required', 'qualification',
+            'salary_range', 'last_date', 'priority'
+        ]
+    
+    def validate(self, attrs):
+        lookups = self.context['lookups']
+        institution_code = attrs.pop('institution_code', '')
+        college_code = attrs.pop('college_code')
+        department_code = attrs.pop('department_code', '')
+        
+        if institution_code:
+            institution = lookups.institution(institution_code)
+            if institution is None:
+                raise serializers.ValidationError({'institution_code': f'Unknown institution "{institution_code}".'})
+        else:
+            institution = lookups.default_institution
+            if institution is None:
+                raise serializers.ValidationError({'institution_code': 'This field is required.'})
+        
+        college = lookups.college(institution.pk, college_code)
+        if college is None:
+            raise serializers.ValidationError(
+                {'college_code': f'Unknown college "{college_code}" in {institution.institution_code}.'}
+            )
+        department = None
+        if department_code:
+            department = lookups.department(college.pk, department_code)
+            if department is None:
+                raise serializers.ValidationError(
+                    {'department_code': f'Unknown department "{department_code}" in {college.college_code}.'}
+                )
+        
+        attrs.update(institution=institution, college=college, department=department)
+        return attrs
+
+
 class JobApprovalSerializer(serializers.ModelSerializer):
     """Serializer for job approval action."""
     
@@ -25,6 +25,18 @@ class UserListSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'last_login', 'date_joined']
 
 
+class UserSummarySerializer(serializers.ModelSerializer):
+    """Compact user payload (no related lookups), returned at login."""
+    
+    class Meta:
+        model = User
+        fields = [
+            'id', 'username', 'email', 'first_name', 'last_name',
+            'role', 'institution', 'status'
+        ]
+        read_only_fields = fields
+
+
 class UserDetailSerializer(serializers.ModelSerializer):
     """Serializer for user details with nested relationships and applicant fields."""
     institution_name = serializers.CharField(source='institution.name', read_only=True)
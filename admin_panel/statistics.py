@@ -0,0 +1,59 @@
+"""
+Aggregated application statistics.
+
+Every status bucket is computed with conditional aggregation so a whole
+breakdown costs a single query, whatever the grouping.
+"""
+from django.db.models import Count, Q
+from django.db.models.functions import TruncDate
+from admin_panel.models import Application
+
+
+# group_by value -> (key column, label column)
+GROUP_BY_FIELDS = {
+    'job': ('job_id', 'job__job_title'),
+    'college': ('job__college_id', 'job__college__college_name'),
+    'department': ('job__department_id', 'job__department__department_name'),
+    'institution': ('job__institution_id', 'job__institution__institution_name'),
+    'day': ('day', None),
+}
+
+
+def _status_aggregates():
+    aggregates = {'total_applications': Count('id')}
+    for status, _ in Application.APPLICATION_STATUS_CHOICES:
+        aggregates[status] = Count('id', filter=Q(status=status))
+    return aggregates
+
+
+def application_statistics(queryset, group_by=None):
+    """
+    Return application counts per status for ``queryset``.
+
+    Without ``group_by`` a single dict of totals is returned. Otherwise a
+    list with one dict per group is returned, each carrying the group key,
+    a label where one exists, and the same counters.
+    """
+    queryset = queryset.order_by()
+    aggregates = _status_aggregates()
+
+    if group_by is None:
+        return queryset.aggregate(**aggregates)
+
+    if group_by not in GROUP_BY_FIELDS:
+        raise ValueError(f'Invalid group_by: {group_by}')
+
+    key, label = GROUP_BY_FIELDS[group_by]
+    if group_by == 'day':
+        queryset = queryset.annotate(day=TruncDate('applied_date'))
+    columns = [key] + ([label] if label else [])
+
+    rows = queryset.values(*columns).annotate(**aggregates).order_by(key)
+    results = []
+    for row in rows:
+        entry = {group_by: row.pop(key)}
+        if label:
+            entry['name'] = row.pop(label)
+        entry.update(row)
+        results.append(entry)
+    return results
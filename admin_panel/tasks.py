@@ -0,0 +1,11 @@
+"""
+Celery tasks for admin_panel.
+"""
+from celery import shared_task
+
+
+@shared_task(name='admin_panel.write_activity_logs', ignore_result=True)
+def write_activity_logs(rows):
+    """Insert a batch of ActivityLog rows serialized by admin_panel.audit."""
+    from admin_panel.audit import insert_rows
+    insert_rows(rows)
@@ -6,12 +6,19 @@ from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from django_filters.rest_framework import DjangoFilterBackend
+from django.http import StreamingHttpResponse
+from admin_panel import audit_export
+from admin_panel.audit import log_activity
 from admin_panel.models import ActivityLog
+from admin_panel.filters import ActivityLogFilter
+from admin_panel.partitions import archived_months
 from admin_panel.serializers import ActivityLogSerializer
 from admin_panel.permissions import IsSuperAdmin
+from admin_panel.renderers import CSVRenderer, JSONLinesRenderer
+from admin_panel.viewsets.mixins import QueryPlannerMixin, ReplicaReadMixin, SerializerTimingMixin
 
 
-class ActivityLogViewSet(viewsets.ReadOnlyModelViewSet):
+class ActivityLogViewSet(QueryPlannerMixin, SerializerTimingMixin, ReplicaReadMixin, viewsets.ReadOnlyModelViewSet):
     """
     ViewSet for viewing activity logs.
     Only Super Admin can view all activity logs.
@@ -20,9 +27,35 @@ class ActivityLogViewSet(viewsets.ReadOnlyModelViewSet):
     serializer_class = ActivityLogSerializer
     permission_classes = [IsAuthenticated, IsSuperAdmin]
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
-    filterset_fields = ['user', 'action', 'created_at']
+    filterset_class = ActivityLogFilter
     search_fields = ['user__username', 'user__email', 'action']
     ordering_fields = ['created_at', 'action']
+    # Keyset order for ?pagination=cursor (see admin_panel.pagination)
+    cursor_ordering = ('-created_at', '-id')
+    
+    def list(self, request, *args, **kwargs):
+        """
+        List activity logs. Filter with created_at (one day) or
+        created_at_after/created_at_before to read only the months in range;
+        months in that range that were moved to archive files are listed in
+        X-Archived-Months.
+        """
+        response = super().list(request, *args, **kwargs)
+        filterset = ActivityLogFilter(request.query_params, queryset=ActivityLog.objects.none())
+        start, end = filterset.created_range() if filterset.is_valid() else (None, None)
+        months = archived_months(start, end)
+        if months:
+            response['X-Archived-Months'] = ','.join(months)
+        return response
+    
+    def get_client_ip(self):
+        """Get client IP address from request."""
+        x_forwarded_for = self.request.META.get('HTTP_X_FORWARDED_FOR')
+        if x_forwarded_for:
+            ip = x_forwarded_for.split(',')[0]
+        else:
+            ip = self.request.META.get('REMOTE_ADDR')
+        return ip
     
     @action(detail=False, methods=['get'])
     def my_activities(self, request):
@@ -52,3 +85,47 @@ class ActivityLogViewSet(viewsets.ReadOnlyModelViewSet):
             return self.get_paginated_response(serializer.data)
         serializer = self.get_serializer(activities, many=True)
         return Response(serializer.data)
+    
+    @action(detail=False, methods=['get'], renderer_classes=[JSONLinesRenderer, CSVRenderer])
+    def export(self, request):
+        """
+        Stream activity logs in created_at order (?format=jsonl|csv).
+        since/until take ISO dates or datetimes; gzip=true compresses the
+        download.
+        """
+        try:
+            since = audit_export.parse_bound(request.query_params.get('since'))
+            until = audit_export.parse_bound(request.query_params.get('until'))
+        except ValueError as exc:
+            return Response({'error': str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+        if since and until and since >= until:
+            return Response(
+                {'error': 'since must be before until'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        compress = request.query_params.get('gzip', '').lower() in ('1', 'true', 'yes')
+        renderer = request.accepted_renderer
+        filename = f'activity-logs.{renderer.format}'
+        if compress:
+            filename += '.gz'
+            content_type = 'application/gzip'
+        else:
+            content_type = f'{renderer.media_type}; charset={renderer.charset}'
+        response = StreamingHttpResponse(
+            # Bound now: the body streams after the replica routing has ended.
+            audit_export.stream(
+                renderer, since, until, compress=compress, using=self.read_alias(ActivityLog)
+            ),
+            content_type=content_type
+        )
+        response['Content-Disposition'] = f'attachment; filename="{filename}"'
+        
+        log_activity(
+            user=request.user,
+            action='export',
+            description=f'Exported activity logs {since or "start"} to {until or "now"} ({renderer.format})',
+            ip_address=self.get_client_ip(),
+            user_agent=request.META.get('HTTP_USER_AGENT', '')
+        )
+        return response
@@ -9,9 +9,10 @@ from admin_panel.serializers import (
     ApplicantListSerializer, ApplicantDetailSerializer, ApplicantCreateSerializer
 )
 from admin_panel.filters import ApplicantFilter
+from admin_panel.viewsets.mixins import QueryPlannerMixin, SerializerTimingMixin
 
 
-class ApplicantViewSet(viewsets.ModelViewSet):
+class ApplicantViewSet(QueryPlannerMixin, SerializerTimingMixin, viewsets.ModelViewSet):
     queryset = Applicant.objects.all()
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
     filterset_class = ApplicantFilter
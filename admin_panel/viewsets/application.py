@@ -6,17 +6,26 @@ from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated, IsAuthenticatedOrReadOnly
 from django_filters.rest_framework import DjangoFilterBackend
+from django.db import transaction
+from django.db.models import Case, FloatField, Value, When
 from django.utils import timezone
-from admin_panel.models import Application, ActivityLog
-from django.contrib.contenttypes.models import ContentType
+from collections import Counter
+from admin_panel.models import Application
+from admin_panel import applicant_search
+from admin_panel.audit import log_activity, log_activities
+from admin_panel.counters import adjust_application_counts
 from admin_panel.serializers import (
     ApplicationListSerializer, ApplicationDetailSerializer, ApplicationCreateSerializer,
-    ApplicationStatusUpdateSerializer
+    ApplicationStatusUpdateSerializer, ApplicationBulkStatusSerializer
 )
 from admin_panel.permissions import IsHR, IsHOD, CanManageApplications
+from admin_panel.policy import get_request_policy
+from admin_panel.scope import get_request_scope
+from admin_panel.statistics import application_statistics, GROUP_BY_FIELDS
+from admin_panel.viewsets.mixins import QueryPlannerMixin, ReplicaReadMixin, SerializerTimingMixin
 
 
-class ApplicationViewSet(viewsets.ModelViewSet):
+class ApplicationViewSet(QueryPlannerMixin, SerializerTimingMixin, ReplicaReadMixin, viewsets.ModelViewSet):
     """
     ViewSet for job application management with role-based permissions.
     - Applicant: Can create and view their own applications
@@ -26,8 +35,10 @@ class ApplicationViewSet(viewsets.ModelViewSet):
     queryset = Application.objects.all().order_by('-applied_date')
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
     filterset_fields = ['job', 'status', 'applied_date']
-    search_fields = ['applicant__user__email', 'applicant__user__first_name', 'job__job_title']
+    search_fields = ['applicant__email', 'applicant__full_name', 'job__job_title']
     ordering_fields = ['applied_date', 'status', 'status_changed_at']
+    # Keyset order for ?pagination=cursor (see admin_panel.pagination)
+    cursor_ordering = ('-applied_date', '-id')
     
     def get_serializer_class(self):
         if self.action == 'retrieve':
@@ -42,6 +53,9 @@ class ApplicationViewSet(viewsets.ModelViewSet):
         if self.action == 'create':
             permission_classes = [IsAuthenticated]
         elif self.action in ['update_status', 'mark_under_review', 'move_to_interview', 'mark_shortlisted', 'mark_selected', 'mark_rejected']:
+            permission_classes = [IsAuthenticated, IsHR, CanManageApplications]
+        elif self.action == 'bulk_status':
+            # Checked per application by the policy's batch filter
             permission_classes = [IsAuthenticated, IsHR]
         elif self.action in ['update', 'partial_update', 'destroy']:
             permission_classes = [IsAuthenticated]
@@ -53,6 +67,9 @@ class ApplicationViewSet(viewsets.ModelViewSet):
         """Filter applications based on user role."""
         user = self.request.user
         queryset = Application.objects.all().order_by('-applied_date')
+        if getattr(self, 'detail', False):
+            # Object permissions (CanManageApplications) read the job
+            queryset = queryset.select_related('job')
         
         if user.is_authenticated:
             if user.role == 'super_admin':
@@ -61,28 +78,25 @@ class ApplicationViewSet(viewsets.ModelViewSet):
                 return queryset.filter(job__institution=user.institution)
             elif user.role == 'hr':
                 # HR sees applications for jobs in their colleges
-                return queryset.filter(job__college__in=user.assigned_colleges.all())
+                return queryset.filter(job__college_id__in=get_request_scope(self.request).college_ids)
             elif user.role == 'hod':
                 # HOD sees applications for jobs in their departments
-                return queryset.filter(job__department__in=user.assigned_departments.all())
+                return queryset.filter(job__department_id__in=get_request_scope(self.request).department_ids)
             elif user.role == 'applicant':
-                # Applicants see only their own applications
-                from admin_panel.models import Applicant
-                try:
-                    applicant = Applicant.objects.get(user=user)
-                    return queryset.filter(applicant=applicant)
-                except Applicant.DoesNotExist:
+                # Applicants see only their own applications: the Applicant
+                # profile is the one with the user's email (as in applicant_search)
+                if not user.email:
                     return queryset.none()
+                return queryset.filter(applicant__email__iexact=user.email)
         return queryset.none()
     
     def perform_create(self, serializer):
         """Create an application."""
         application = serializer.save()
-        ActivityLog.objects.create(
+        log_activity(
             user=self.request.user,
             action='apply',
-            content_type=ContentType.objects.get_for_model(Application),
-            object_id=application.id,
+            obj=application,
             description=f'Applied for job: {application.job.job_title}',
             ip_address=self.get_client_ip(),
             user_agent=self.request.META.get('HTTP_USER_AGENT', '')
@@ -97,7 +111,7 @@ class ApplicationViewSet(viewsets.ModelViewSet):
             ip = self.request.META.get('REMOTE_ADDR')
         return ip
     
-    @action(detail=True, methods=['post'], permission_classes=[IsAuthenticated, IsHR])
+    @action(detail=True, methods=['post'], permission_classes=[IsAuthenticated, IsHR, CanManageApplications])
     def update_status(self, request, pk=None):
         """Update application status with remarks."""
         application = self.get_object()
@@ -114,11 +128,10 @@ class ApplicationViewSet(viewsets.ModelViewSet):
                 application.remarks = remarks
             application.save()
             
-            ActivityLog.objects.create(
+            log_activity(
                 user=request.user,
                 action='status_change',
-                content_type=ContentType.objects.get_for_model(Application),
-                object_id=application.id,
+                obj=application,
                 description=f'Changed application status to {new_status}',
                 ip_address=self.get_client_ip(),
                 user_agent=request.META.get('HTTP_USER_AGENT', '')
@@ -127,7 +140,7 @@ class ApplicationViewSet(viewsets.ModelViewSet):
             return Response(self.get_serializer(application).data)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
     
-    @action(detail=True, methods=['post'], permission_classes=[IsAuthenticated, IsHR])
+    @action(detail=True, methods=['post'], permission_classes=[IsAuthenticated, IsHR, CanManageApplications])
     def mark_under_review(self, request, pk=None):
         """Mark application as under review."""
         application = self.get_object()
@@ -136,11 +149,10 @@ class ApplicationViewSet(viewsets.ModelViewSet):
         application.status_changed_at = timezone.now()
         application.save()
         
-        ActivityLog.objects.create(
+        log_activity(
             user=request.user,
             action='status_change',
-            content_type=ContentType.objects.get_for_model(Application),
-            object_id=application.id,
+            obj=application,
             description='Marked application as under review',
             ip_address=self.get_client_ip(),
             user_agent=request.META.get('HTTP_USER_AGENT', '')
@@ -148,7 +160,7 @@ class ApplicationViewSet(viewsets.ModelViewSet):
         
         return Response(self.get_serializer(application).data)
     
-    @action(detail=True, methods=['post'], permission_classes=[IsAuthenticated, IsHR])
+    @action(detail=True, methods=['post'], permission_classes=[IsAuthenticated, IsHR, CanManageApplications])
     def move_to_interview(self, request, pk=None):
         """Move application to interview stage."""
         application = self.get_object()
@@ -157,11 +169,10 @@ class ApplicationViewSet(viewsets.ModelViewSet):
         application.status_changed_at = timezone.now()
         application.save()
         
-        ActivityLog.objects.create(
+        log_activity(
             user=request.user,
             action='status_change',
-            content_type=ContentType.objects.get_for_model(Application),
-            object_id=application.id,
+            obj=application,
             description='Moved application to interview stage',
             ip_address=self.get_client_ip(),
             user_agent=request.META.get('HTTP_USER_AGENT', '')
@@ -169,7 +180,7 @@ class ApplicationViewSet(viewsets.ModelViewSet):
         
         return Response(self.get_serializer(application).data)
     
-    @action(detail=True, methods=['post'], permission_classes=[IsAuthenticated, IsHR])
+    @action(detail=True, methods=['post'], permission_classes=[IsAuthenticated, IsHR, CanManageApplications])
     def mark_shortlisted(self, request, pk=None):
         """Mark application as shortlisted."""
         application = self.get_object()
@@ -178,11 +189,10 @@ class ApplicationViewSet(viewsets.ModelViewSet):
         application.status_changed_at = timezone.now()
         application.save()
         
-        ActivityLog.objects.create(
+        log_activity(
             user=request.user,
             action='status_change',
-            content_type=ContentType.objects.get_for_model(Application),
-            object_id=application.id,
+            obj=application,
             description='Marked application as shortlisted',
             ip_address=self.get_client_ip(),
             user_agent=request.META.get('HTTP_USER_AGENT', '')
@@ -190,7 +200,7 @@ class ApplicationViewSet(viewsets.ModelViewSet):
         
         return Response(self.get_serializer(application).data)
     
-    @action(detail=True, methods=['post'], permission_classes=[IsAuthenticated, IsHR])
+    @action(detail=True, methods=['post'], permission_classes=[IsAuthenticated, IsHR, CanManageApplications])
     def mark_selected(self, request, pk=None):
         """Mark application as selected."""
         application = self.get_object()
@@ -206,11 +216,10 @@ class ApplicationViewSet(viewsets.ModelViewSet):
         application.job.closed_at = timezone.now()
         application.job.save()
         
-        ActivityLog.objects.create(
+        log_activity(
             user=request.user,
             action='status_change',
-            content_type=ContentType.objects.get_for_model(Application),
-            object_id=application.id,
+            obj=application,
             description='Marked application as selected',
             ip_address=self.get_client_ip(),
             user_agent=request.META.get('HTTP_USER_AGENT', '')
@@ -218,7 +227,7 @@ class ApplicationViewSet(viewsets.ModelViewSet):
         
         return Response(self.get_serializer(application).data)
     
-    @action(detail=True, methods=['post'], permission_classes=[IsAuthenticated, IsHR])
+    @action(detail=True, methods=['post'], permission_classes=[IsAuthenticated, IsHR, CanManageApplications])
     def mark_rejected(self, request, pk=None):
         """Mark application as rejected."""
         application = self.get_object()
@@ -232,11 +241,10 @@ class ApplicationViewSet(viewsets.ModelViewSet):
             application.remarks = remarks
         application.save()
         
-        ActivityLog.objects.create(
+        log_activity(
             user=request.user,
             action='status_change',
-            content_type=ContentType.objects.get_for_model(Application),
-            object_id=application.id,
+            obj=application,
             description=f'Marked application as rejected. Remarks: {remarks}',
             ip_address=self.get_client_ip(),
             user_agent=request.META.get('HTTP_USER_AGENT', '')
@@ -244,6 +252,86 @@ class ApplicationViewSet(viewsets.ModelViewSet):
         
         return Response(self.get_serializer(application).data)
     
+    @action(detail=False, methods=['post'], permission_classes=[IsAuthenticated, IsHR])
+    def bulk_status(self, request):
+        """
+        Move many applications to one status.
+        Body: {"ids": [...], "status": "...", "remarks": "..."}
+        
+        Applications outside the caller's scope are reported as not_found;
+        those already in the target status as unchanged.
+        """
+        serializer = ApplicationBulkStatusSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        
+        ids = serializer.validated_data['ids']
+        new_status = serializer.validated_data['status']
+        remarks = serializer.validated_data['remarks']
+        now = timezone.now()
+        
+        with transaction.atomic():
+            scoped = get_request_policy(request).filter_applications(
+                self.get_queryset()
+            ).filter(id__in=ids).order_by()
+            current = {
+                pk: (job_id, old_status)
+                for pk, job_id, old_status in scoped.select_for_update(of=('self',)).values_list(
+                    'id', 'job_id', 'status'
+                )
+            }
+            changed = [pk for pk, (job_id, old_status) in current.items() if old_status != new_status]
+            
+            if changed:
+                updates = {
+                    'status': new_status,
+                    'status_changed_by': request.user,
+                    'status_changed_at': now,
+                    'updated_at': now,
+                }
+                if remarks:
+                    updates['remarks'] = remarks
+                scoped.filter(id__in=changed).update(**updates)
+                
+                counts = Counter()
+                for pk in changed:
+                    job_id, old_status = current[pk]
+                    counts[(job_id, old_status)] -= 1
+                    counts[(job_id, new_status)] += 1
+                adjust_application_counts(counts)
+                
+                description = f'Changed application status to {new_status}'
+                if remarks:
+                    description += f'. Remarks: {remarks}'
+                log_activities(
+                    'status_change',
+                    Application,
+                    changed,
+                    description=description,
+                    user=request.user,
+                    ip_address=self.get_client_ip(),
+                    user_agent=request.META.get('HTTP_USER_AGENT', ''),
+                )
+        
+        changed = set(changed)
+        results = []
+        for pk in ids:
+            if pk not in current:
+                result = 'not_found'
+            elif pk in changed:
+                result = 'updated'
+            else:
+                result = 'unchanged'
+            results.append({'id': pk, 'result': result})
+        
+        return Response({
+            'status': new_status,
+            'updated': len(changed),
+            'unchanged': len(current) - len(changed),
+            'not_found': len(ids) - len(current),
+            'results': results,
+        })
+    
     @action(detail=False, methods=['get'])
     def by_job(self, request):
         """Get all applications for a job."""
@@ -266,38 +354,71 @@ class ApplicationViewSet(viewsets.ModelViewSet):
     def my_applications(self, request):
         """Get current user's applications (Applicant)."""
         from admin_panel.models import Applicant
-        try:
-            applicant = Applicant.objects.get(user=request.user)
-            applications = Application.objects.filter(applicant=applicant).order_by('-applied_date')
-            page = self.paginate_queryset(applications)
-            if page is not None:
-                serializer = self.get_serializer(page, many=True)
-                return self.get_paginated_response(serializer.data)
-            serializer = self.get_serializer(applications, many=True)
-            return Response(serializer.data)
-        except Applicant.DoesNotExist:
+        email = request.user.email
+        if not email or not Applicant.objects.filter(email__iexact=email).exists():
             return Response(
                 {'error': 'Applicant profile not found'},
                 status=status.HTTP_404_NOT_FOUND
             )
-        if applicant_id:
-            applications = Application.objects.filter(applicant_id=applicant_id)
-            serializer = ApplicationListSerializer(applications, many=True)
-            return Response(serializer.data)
-        return Response({'error': 'Applicant ID required'}, status=status.HTTP_400_BAD_REQUEST)
+        applications = Application.objects.filter(applicant__email__iexact=email).order_by('-applied_date')
+        page = self.paginate_queryset(applications)
+        if page is not None:
+            serializer = self.get_serializer(page, many=True)
+            return self.get_paginated_response(serializer.data)
+        serializer = self.get_serializer(applications, many=True)
+        return Response(serializer.data)
+    
+    @action(detail=False, methods=['get'])
+    def search(self, request):
+        """
+        Find applications by applicant name (typo-tolerant), email or phone
+        prefix: ?q=<text>. Other list filters (job, status, ...) still apply.
+        Results carry a match_score between 0 and 1, best first.
+        """
+        text = request.query_params.get('q', '').strip()
+        if not text:
+            return Response(
+                {'error': 'q parameter is required'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        scores = applicant_search.search(text)
+        applications = self.filter_queryset(self.get_queryset()).filter(
+            applicant_id__in=scores
+        ).annotate(
+            match_score=Case(
+                *[When(applicant_id=applicant_id, then=Value(score)) for applicant_id, score in scores.items()],
+                default=Value(0.0),
+                output_field=FloatField(),
+            )
+        ).order_by('-match_score', '-applied_date')
+        
+        page = self.paginate_queryset(applications)
+        rows = page if page is not None else applications
+        data = self.get_serializer(rows, many=True).data
+        for item, application in zip(data, rows):
+            item['match_score'] = round(application.match_score, 3)
+        if page is not None:
+            return self.get_paginated_response(data)
+        return Response(data)
     
     @action(detail=False, methods=['get'])
     def statistics(self, request):
-        total = Application.objects.count()
-        submitted = Application.objects.filter(status='submitted').count()
-        shortlisted = Application.objects.filter(status='shortlisted').count()
-        rejected = Application.objects.filter(status='rejected').count()
-        accepted = Application.objects.filter(status='accepted').count()
+        """
+        Application counts per status within the caller's scope.
+        Optional ?group_by=job|college|department|institution|day.
+        """
+        group_by = request.query_params.get('group_by')
+        if group_by and group_by not in GROUP_BY_FIELDS:
+            return Response(
+                {'error': f"group_by must be one of: {', '.join(GROUP_BY_FIELDS)}"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
         
+        queryset = self.filter_queryset(self.get_queryset())
+        if not group_by:
+            return Response(application_statistics(queryset))
         return Response({
-            'total_applications': total,
-            'submitted': submitted,
-            'shortlisted': shortlisted,
-            'rejected': rejected,
-            'accepted': accepted,
+            'group_by': group_by,
+            'results': application_statistics(queryset, group_by=group_by),
         })
@@ -5,12 +5,14 @@ from rest_framework.filters import SearchFilter, OrderingFilter
 from django_filters.rest_framework import DjangoFilterBackend
 
 from admin_panel.models import College
+from admin_panel.counters import job_count_subquery
 from admin_panel.serializers import CollegeSerializer
 from admin_panel.filters import CollegeFilter
+from admin_panel.viewsets.mixins import QueryPlannerMixin, ReplicaReadMixin, SerializerTimingMixin
 
 
-class CollegeViewSet(viewsets.ModelViewSet):
-    queryset = College.objects.all()
+class CollegeViewSet(QueryPlannerMixin, SerializerTimingMixin, ReplicaReadMixin, viewsets.ModelViewSet):
+    queryset = College.objects.annotate(published_job_count=job_count_subquery('college'))
     serializer_class = CollegeSerializer
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
     filterset_class = CollegeFilter
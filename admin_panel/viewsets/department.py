@@ -5,12 +5,14 @@ from rest_framework.filters import SearchFilter, OrderingFilter
 from django_filters.rest_framework import DjangoFilterBackend
 
 from admin_panel.models import Department
+from admin_panel.counters import job_count_subquery
 from admin_panel.serializers import DepartmentSerializer
 from admin_panel.filters import DepartmentFilter
+from admin_panel.viewsets.mixins import QueryPlannerMixin, ReplicaReadMixin, SerializerTimingMixin
 
 
-class DepartmentViewSet(viewsets.ModelViewSet):
-    queryset = Department.objects.all()
+class DepartmentViewSet(QueryPlannerMixin, SerializerTimingMixin, ReplicaReadMixin, viewsets.ModelViewSet):
+    queryset = Department.objects.annotate(published_job_count=job_count_subquery('department'))
     serializer_class = DepartmentSerializer
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
     filterset_class = DepartmentFilter
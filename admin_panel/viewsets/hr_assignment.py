@@ -7,9 +7,10 @@ from django_filters.rest_framework import DjangoFilterBackend
 from admin_panel.models import HRAssignment
 from admin_panel.serializers import HRAssignmentSerializer
 from admin_panel.filters import HRAssignmentFilter
+from admin_panel.viewsets.mixins import QueryPlannerMixin, SerializerTimingMixin
 
 
-class HRAssignmentViewSet(viewsets.ModelViewSet):
+class HRAssignmentViewSet(QueryPlannerMixin, SerializerTimingMixin, viewsets.ModelViewSet):
     queryset = HRAssignment.objects.all()
     serializer_class = HRAssignmentSerializer
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
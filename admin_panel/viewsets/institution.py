@@ -3,14 +3,19 @@ from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.filters import SearchFilter, OrderingFilter
 from django_filters.rest_framework import DjangoFilterBackend
+from django.http import Http404
 
+from admin_panel import org_tree
 from admin_panel.models import Institution
+from admin_panel.counters import job_count_subquery
 from admin_panel.serializers import InstitutionSerializer
 from admin_panel.filters import InstitutionFilter
+from admin_panel.scope import get_request_scope
+from admin_panel.viewsets.mixins import QueryPlannerMixin, ReplicaReadMixin, SerializerTimingMixin
 
 
-class InstitutionViewSet(viewsets.ModelViewSet):
-    queryset = Institution.objects.all()
+class InstitutionViewSet(QueryPlannerMixin, SerializerTimingMixin, ReplicaReadMixin, viewsets.ModelViewSet):
+    queryset = Institution.objects.annotate(published_job_count=job_count_subquery('institution'))
     serializer_class = InstitutionSerializer
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
     filterset_class = InstitutionFilter
@@ -41,3 +46,31 @@ class InstitutionViewSet(viewsets.ModelViewSet):
         jobs = institution.jobs.all()
         serializer = JobSerializer(jobs, many=True)
         return Response(serializer.data)
+    
+    @action(detail=True, methods=['get'])
+    def tree(self, request, pk=None):
+        """
+        Colleges and departments of the institution with job counts (cached).
+        Counts per job status are limited to what the caller manages: the
+        whole institution for super admins and its institution admins, the
+        assigned colleges for HR and departments for HODs. Everything else
+        shows published jobs only.
+        """
+        try:
+            institution_id = int(pk)
+        except (TypeError, ValueError):
+            raise Http404
+        user = request.user
+        role = user.role if user.is_authenticated else None
+        if role == 'super_admin' or (role == 'institution_admin' and user.institution_id == institution_id):
+            tree = org_tree.get_tree(institution_id)
+        else:
+            college_ids = department_ids = ()
+            if role == 'hr':
+                college_ids = get_request_scope(request).college_ids
+            elif role == 'hod':
+                department_ids = get_request_scope(request).department_ids
+            tree = org_tree.get_tree(institution_id, college_ids, department_ids)
+        if tree is None:
+            raise Http404
+        return Response(tree)
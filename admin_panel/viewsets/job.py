@@ -6,8 +6,19 @@ from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated, IsAuthenticatedOrReadOnly
 from django_filters.rest_framework import DjangoFilterBackend
-from admin_panel.models import Job, ActivityLog
-from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
+from django.db.models import F
+from django.http import StreamingHttpResponse
+import io
+from itertools import islice
+from admin_panel import job_import
+from admin_panel.models import Application, Job
+from admin_panel.audit import log_activity
+from admin_panel.counters import application_count_subquery, application_stamp
+from admin_panel.renderers import CSVRenderer, JSONLinesRenderer
+from admin_panel.policy import get_request_policy
+from admin_panel.scope import get_request_scope
+from admin_panel.search import JobSearchFilter
 from admin_panel.serializers import (
     JobListSerializer, JobDetailSerializer, JobCreateUpdateSerializer,
     JobApprovalSerializer, JobSelectionSerializer, ApplicationListSerializer
@@ -15,9 +26,14 @@ from admin_panel.serializers import (
 from admin_panel.permissions import (
     IsSuperAdmin, IsHOD, IsHR, CanCreateOrApproveJob, CanAccessDepartment
 )
+from admin_panel.viewsets.mixins import (
+    QueryPlannerMixin, ReplicaReadMixin, ResponseCacheMixin, SerializerTimingMixin
+)
 
 
-class JobViewSet(viewsets.ModelViewSet):
+class JobViewSet(
+    QueryPlannerMixin, ResponseCacheMixin, SerializerTimingMixin, ReplicaReadMixin, viewsets.ModelViewSet
+):
     """
     ViewSet for job management with role-based access control.
     - HOD: Can create jobs (draft), view owned jobs
@@ -26,10 +42,29 @@ class JobViewSet(viewsets.ModelViewSet):
     - Public: Can view published jobs (read-only)
     """
     queryset = Job.objects.all().order_by('-created_at')
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
+    filter_backends = [DjangoFilterBackend, JobSearchFilter, filters.OrderingFilter]
     filterset_fields = ['job_status', 'institution', 'college', 'department', 'priority']
+    # Used when no full-text index is available (see admin_panel.search)
     search_fields = ['job_title', 'job_description', 'qualification']
     ordering_fields = ['created_at', 'last_date', 'priority', 'job_status']
+    # Keyset order for ?pagination=cursor (see admin_panel.pagination)
+    cursor_ordering = ('-created_at', '-id')
+    # list, retrieve and published_jobs are served from the response cache
+    cache_namespace = 'jobs'
+    
+    # Columns of applications/export: Application fields, then applicant profile
+    export_fields = (
+        'id', 'applicant_id', 'applicant_name', 'applicant_email', 'applicant_phone',
+        'status', 'applied_date', 'status_changed_at', 'resume_url', 'remarks',
+    )
+    export_profile_fields = {
+        'current_location': F('applicant__current_location'),
+        'qualification': F('applicant__education_qualification'),
+        'specialization': F('applicant__education_specialization'),
+        'designation': F('applicant__experience_designation'),
+        'organization': F('applicant__experience_organization_name'),
+    }
+    export_chunk_size = 2000
     
     def get_serializer_class(self):
         if self.action == 'list':
@@ -56,13 +91,13 @@ class JobViewSet(viewsets.ModelViewSet):
             permission_classes = [IsAuthenticated]
         elif self.action in ['update', 'partial_update', 'destroy']:
             # Only job creator or admin can edit/delete
-            permission_classes = [IsAuthenticated]
+            permission_classes = [IsAuthenticated, CanCreateOrApproveJob]
         elif self.action == 'approve_job':
             # Only HR or Super Admin can approve
-            permission_classes = [IsAuthenticated, IsHR]
+            permission_classes = [IsAuthenticated, IsHR, CanCreateOrApproveJob]
         elif self.action == 'mark_selected':
             # Only HR or admin can mark selected
-            permission_classes = [IsAuthenticated, IsHR]
+            permission_classes = [IsAuthenticated, IsHR, CanCreateOrApproveJob]
         elif self.action in ['applications', 'view_applicants']:
             # HOD and HR can view applications for their jobs
             permission_classes = [IsAuthenticated]
@@ -73,7 +108,9 @@ class JobViewSet(viewsets.ModelViewSet):
     def get_queryset(self):
         """Filter jobs based on user role."""
         user = self.request.user
-        queryset = Job.objects.all().order_by('-created_at')
+        queryset = Job.objects.annotate(
+            application_count=application_count_subquery()
+        ).order_by('-created_at')
         
         if user.is_authenticated:
             # Super Admin sees all
@@ -84,10 +121,10 @@ class JobViewSet(viewsets.ModelViewSet):
                 return queryset.filter(institution=user.institution)
             # HR sees jobs in their assigned colleges
             elif user.role == 'hr':
-                return queryset.filter(college__in=user.assigned_colleges.all())
+                return queryset.filter(college_id__in=get_request_scope(self.request).college_ids)
             # HOD sees jobs in their assigned departments
             elif user.role == 'hod':
-                return queryset.filter(department__in=user.assigned_departments.all())
+                return queryset.filter(department_id__in=get_request_scope(self.request).department_ids)
             # Applicants see published jobs only
             elif user.role == 'applicant':
                 return queryset.filter(job_status='published')
@@ -95,6 +132,25 @@ class JobViewSet(viewsets.ModelViewSet):
             # Unauthenticated users see published jobs only
             return queryset.filter(job_status='published')
     
+    def cache_state(self, queryset):
+        # total_applications is read from the application counters.
+        return application_stamp(queryset)
+    
+    def cache_scope(self, request):
+        """Callers who see the same jobs (see get_queryset) share cache entries."""
+        user = request.user
+        if not user.is_authenticated or user.role == 'applicant':
+            return 'public'
+        if user.role == 'super_admin':
+            return 'all'
+        if user.role == 'institution_admin':
+            return f'institution:{user.institution_id}'
+        if user.role in ('hr', 'hod'):
+            scope = get_request_scope(request)
+            ids = scope.college_ids if user.role == 'hr' else scope.department_ids
+            return f"{user.role}:{','.join(map(str, sorted(ids)))}"
+        return super().cache_scope(request)
+    
     def perform_create(self, serializer):
         """Create a job with HOD as creator."""
         institution = self.request.user.institution
@@ -118,11 +174,10 @@ class JobViewSet(viewsets.ModelViewSet):
             institution=institution
         )
         # Log activity
-        ActivityLog.objects.create(
+        log_activity(
             user=self.request.user,
             action='create',
-            content_type=ContentType.objects.get_for_model(Job),
-            object_id=job.id,
+            obj=job,
             description=f'Created job: {job.job_title}',
             ip_address=self.get_client_ip(),
             user_agent=self.request.META.get('HTTP_USER_AGENT', '')
@@ -131,11 +186,10 @@ class JobViewSet(viewsets.ModelViewSet):
     def perform_update(self, serializer):
         """Update job."""
         job = serializer.save()
-        ActivityLog.objects.create(
+        log_activity(
             user=self.request.user,
             action='update',
-            content_type=ContentType.objects.get_for_model(Job),
-            object_id=job.id,
+            obj=job,
             description=f'Updated job: {job.job_title}',
             ip_address=self.get_client_ip(),
             user_agent=self.request.META.get('HTTP_USER_AGENT', '')
@@ -150,7 +204,7 @@ class JobViewSet(viewsets.ModelViewSet):
             ip = self.request.META.get('REMOTE_ADDR')
         return ip
     
-    @action(detail=True, methods=['post'], permission_classes=[IsAuthenticated, IsHR])
+    @action(detail=True, methods=['post'], permission_classes=[IsAuthenticated, IsHR, CanCreateOrApproveJob])
     def approve_job(self, request, pk=None):
         """Approve and publish a job (HR only)."""
         job = self.get_object()
@@ -166,11 +220,10 @@ class JobViewSet(viewsets.ModelViewSet):
         job.published_at = timezone.now()
         job.save()
         
-        ActivityLog.objects.create(
+        log_activity(
             user=request.user,
             action='approve',
-            content_type=ContentType.objects.get_for_model(Job),
-            object_id=job.id,
+            obj=job,
             description=f'Approved and published job: {job.job_title}',
             ip_address=self.get_client_ip(),
             user_agent=request.META.get('HTTP_USER_AGENT', '')
@@ -179,7 +232,7 @@ class JobViewSet(viewsets.ModelViewSet):
         serializer = self.get_serializer(job)
         return Response(serializer.data)
     
-    @action(detail=True, methods=['post'], permission_classes=[IsAuthenticated, IsHR])
+    @action(detail=True, methods=['post'], permission_classes=[IsAuthenticated, IsHR, CanCreateOrApproveJob])
     def mark_selected(self, request, pk=None):
         """Mark an applicant as selected for a job (HR only)."""
         job = self.get_object()
@@ -196,11 +249,10 @@ class JobViewSet(viewsets.ModelViewSet):
         job.closed_at = timezone.now()
         job.save()
         
-        ActivityLog.objects.create(
+        log_activity(
             user=request.user,
             action='update',
-            content_type=ContentType.objects.get_for_model(Job),
-            object_id=job.id,
+            obj=job,
             description=f'Marked applicant as selected for job: {job.job_title}',
             ip_address=self.get_client_ip(),
             user_agent=request.META.get('HTTP_USER_AGENT', '')
@@ -213,7 +265,9 @@ class JobViewSet(viewsets.ModelViewSet):
     def applications(self, request, pk=None):
         """Get all applications for a job."""
         job = self.get_object()
-        applications = job.applications.all().order_by('-applied_date')
+        applications = self.plan_queryset(
+            job.applications.all().order_by('-applied_date'), ApplicationListSerializer
+        )
         page = self.paginate_queryset(applications)
         if page is not None:
             serializer = ApplicationListSerializer(page, many=True)
@@ -221,16 +275,116 @@ class JobViewSet(viewsets.ModelViewSet):
         serializer = ApplicationListSerializer(applications, many=True)
         return Response(serializer.data)
     
+    @action(detail=True, methods=['get'], url_path='applications/export',
+            renderer_classes=[CSVRenderer, JSONLinesRenderer])
+    def export_applications(self, request, pk=None):
+        """Stream every application of a job as CSV or JSON lines (?format=csv|jsonl)."""
+        if request.user.role == 'applicant':
+            return Response(
+                {'error': 'Applicants cannot export applications'},
+                status=status.HTTP_403_FORBIDDEN
+            )
+        job = self.get_object()
+        # Bound now: the body streams after the replica routing has ended.
+        applications = Application.objects.using(self.read_alias(Application)).filter(
+            job=job
+        ).order_by('applied_date', 'id')
+        application_status = request.query_params.get('status')
+        if application_status:
+            applications = applications.filter(status=application_status)
+        
+        rows = self.export_rows(applications)
+        columns = [*self.export_fields, *self.export_profile_fields]
+        renderer = request.accepted_renderer
+        response = StreamingHttpResponse(
+            renderer.stream(columns, rows),
+            content_type=f'{renderer.media_type}; charset={renderer.charset}'
+        )
+        response['Content-Disposition'] = (
+            f'attachment; filename="job-{job.pk}-applications.{renderer.format}"'
+        )
+        log_activity(
+            user=request.user,
+            action='export',
+            obj=job,
+            description=f'Exported applications ({renderer.format}): {job.job_title}',
+            ip_address=self.get_client_ip(),
+            user_agent=request.META.get('HTTP_USER_AGENT', '')
+        )
+        return response
+    
+    def export_rows(self, applications):
+        """
+        Plain dicts straight from a chunked cursor: no model instances and no
+        serializer, so memory stays flat however many rows there are. The
+        transaction lets PostgreSQL use a plain server-side cursor instead of
+        a WITH HOLD one, which would materialize the whole result.
+        """
+        with transaction.atomic(using=applications.db):
+            yield from applications.values(
+                *self.export_fields, **self.export_profile_fields
+            ).iterator(chunk_size=self.export_chunk_size)
+    
+    @action(detail=False, methods=['post'], url_path='import')
+    def import_jobs(self, request):
+        """
+        Create draft jobs from an uploaded CSV or JSON-lines file.
+        Form fields: file, file_format (csv|jsonl, default from the file
+        name), dry_run (validate only).
+        """
+        if request.user.role == 'applicant':
+            return Response(
+                {'error': 'Applicants cannot import jobs'},
+                status=status.HTTP_403_FORBIDDEN
+            )
+        upload = request.FILES.get('file')
+        if upload is None:
+            return Response(
+                {'error': 'file is required'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        file_format = request.data.get('file_format') or job_import.detect_format(upload.name)
+        if file_format not in job_import.FORMATS:
+            return Response(
+                {'error': 'file_format must be csv or jsonl'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        lines = io.TextIOWrapper(upload.file, encoding='utf-8-sig', newline='')
+        try:
+            rows = list(islice(job_import.read_rows(lines, file_format), job_import.MAX_ROWS + 1))
+        except ValueError as exc:
+            return Response({'error': str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+        if len(rows) > job_import.MAX_ROWS:
+            return Response(
+                {'error': f'At most {job_import.MAX_ROWS} rows can be imported at once; '
+                          f'use the import_jobs command for larger files'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        result = job_import.import_jobs(
+            rows,
+            request.user,
+            dry_run=str(request.data.get('dry_run', '')).lower() in ('1', 'true', 'yes'),
+            ip_address=self.get_client_ip(),
+            user_agent=request.META.get('HTTP_USER_AGENT', ''),
+        )
+        return Response(result)
+    
     @action(detail=False, methods=['get'])
     def published_jobs(self, request):
         """Get all published jobs."""
         jobs = self.get_queryset().filter(job_status='published')
-        page = self.paginate_queryset(jobs)
-        if page is not None:
-            serializer = self.get_serializer(page, many=True)
-            return self.get_paginated_response(serializer.data)
-        serializer = self.get_serializer(jobs, many=True)
-        return Response(serializer.data)
+        
+        def build():
+            page = self.paginate_queryset(jobs)
+            if page is not None:
+                serializer = self.get_serializer(page, many=True)
+                return self.get_paginated_response(serializer.data)
+            serializer = self.get_serializer(jobs, many=True)
+            return Response(serializer.data)
+        
+        return self.cached_response(request, build, jobs)
     
     @action(detail=False, methods=['get'])
     def pending_approval(self, request):
@@ -240,7 +394,9 @@ class JobViewSet(viewsets.ModelViewSet):
                 {'error': 'Only HR can view pending approvals'},
                 status=status.HTTP_403_FORBIDDEN
             )
-        jobs = self.get_queryset().filter(job_status='pending_approval')
+        jobs = get_request_policy(request).filter_jobs(
+            self.get_queryset().filter(job_status='pending_approval')
+        )
         page = self.paginate_queryset(jobs)
         if page is not None:
             serializer = self.get_serializer(page, many=True)
@@ -0,0 +1,347 @@
+"""
+Shared ViewSet mixins.
+"""
+import hashlib
+import logging
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist
+from django.db import connections, router
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.http import http_date
+from rest_framework import permissions, serializers
+from rest_framework.response import Response
+
+from admin_panel import db_router, metrics, response_cache
+
+logger = logging.getLogger(__name__)
+
+# Plans are derived from class definitions only, so they are computed once
+# per (serializer, model) pair and reused for the life of the process.
+_plan_cache = {}
+
+# serializer class -> subclass whose ``data`` is timed
+_timed_classes = {}
+
+
+def _walk_source(model, attrs):
+    """
+    Follow dotted source attributes across model relations.
+
+    Returns the list of relation names that can be joined and a flag telling
+    whether a many-valued relation was crossed (which requires a prefetch).
+    Walking stops at the first attribute that is not a relation field, e.g.
+    a method such as ``get_full_name`` or a plain column.
+    """
+    path = []
+    many = False
+    for attr in attrs:
+        try:
+            field = model._meta.get_field(attr)
+        except FieldDoesNotExist:
+            break
+        if not field.is_relation or field.related_model is None:
+            break
+        path.append(attr)
+        if field.many_to_many or field.one_to_many:
+            many = True
+        model = field.related_model
+    return path, many, model
+
+
+def _collect(serializer, model, prefix, select, prefetch):
+    for field in serializer.fields.values():
+        if field.write_only or field.source == '*':
+            continue
+
+        if isinstance(field, serializers.ListSerializer):
+            path, _, related_model = _walk_source(model, field.source_attrs)
+            if path:
+                lookup = '__'.join(prefix + path)
+                prefetch.add(lookup)
+                child = field.child
+                if isinstance(child, serializers.ModelSerializer):
+                    # Nested selects ride along with the prefetch lookup.
+                    nested_select, nested_prefetch = set(), set()
+                    _collect(child, related_model, [], nested_select, nested_prefetch)
+                    prefetch.update(f'{lookup}__{p}' for p in nested_select | nested_prefetch)
+            continue
+
+        if isinstance(field, serializers.ManyRelatedField):
+            path, _, _ = _walk_source(model, field.source_attrs)
+            if path:
+                prefetch.add('__'.join(prefix + path))
+            continue
+
+        path, many, related_model = _walk_source(model, field.source_attrs)
+        if not path:
+            continue
+
+        if isinstance(field, serializers.PrimaryKeyRelatedField) and len(path) == 1 \
+                and len(field.source_attrs) == 1:
+            # Rendered from the local ``<name>_id`` column, no join needed.
+            continue
+
+        lookup = '__'.join(prefix + path)
+        if many:
+            prefetch.add(lookup)
+        else:
+            select.add(lookup)
+
+        if isinstance(field, serializers.ModelSerializer) and not many:
+            _collect(field, related_model, prefix + path, select, prefetch)
+
+
+def plan_relations(serializer_class, model):
+    """
+    Return ``(select_related, prefetch_related)`` lookups needed to render
+    ``serializer_class`` for instances of ``model`` without N+1 queries.
+    """
+    key = (serializer_class, model)
+    if key not in _plan_cache:
+        select, prefetch = set(), set()
+        _collect(serializer_class(), model, [], select, prefetch)
+        _plan_cache[key] = (tuple(sorted(select)), tuple(sorted(prefetch)))
+    return _plan_cache[key]
+
+
+class _QueryCounter:
+    """``execute_wrapper`` hook that counts queries run on a connection."""
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+class QueryPlannerMixin:
+    """
+    Apply ``select_related``/``prefetch_related`` based on the serializer.
+
+    The joins are read from the dotted ``source`` paths and nested
+    serializers of the serializer returned by ``get_serializer_class()``.
+    Relations the introspection cannot see (for example those touched by
+    ``__str__`` or ``SerializerMethodField``) can be listed in
+    ``planner_select_related`` / ``planner_prefetch_related``.
+
+    With ``QUERY_PLANNER_DEBUG = True`` every response carries an
+    ``X-Query-Count`` header and the count is logged.
+    """
+    planner_select_related = ()
+    planner_prefetch_related = ()
+
+    def plan_queryset(self, queryset, serializer_class=None):
+        """Apply the relation plan for ``serializer_class`` to ``queryset``."""
+        serializer_class = serializer_class or self.get_serializer_class()
+        meta = getattr(serializer_class, 'Meta', None)
+        if getattr(meta, 'model', None) is not queryset.model:
+            return queryset
+
+        select, prefetch = plan_relations(serializer_class, queryset.model)
+        select = set(select) | set(self.planner_select_related)
+        prefetch = set(prefetch) | set(self.planner_prefetch_related)
+        if select:
+            queryset = queryset.select_related(*sorted(select))
+        if prefetch:
+            queryset = queryset.prefetch_related(*sorted(prefetch))
+        return queryset
+
+    def filter_queryset(self, queryset):
+        return self.plan_queryset(super().filter_queryset(queryset))
+
+    def paginate_queryset(self, queryset):
+        # Custom list actions paginate get_queryset() directly.
+        if hasattr(queryset, 'model'):
+            queryset = self.plan_queryset(queryset)
+        return super().paginate_queryset(queryset)
+
+    def dispatch(self, request, *args, **kwargs):
+        if not getattr(settings, 'QUERY_PLANNER_DEBUG', False):
+            return super().dispatch(request, *args, **kwargs)
+
+        counter = _QueryCounter()
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(counter))
+            response = super().dispatch(request, *args, **kwargs)
+
+        response['X-Query-Count'] = str(counter.count)
+        logger.info(
+            '%s %s ran %d queries', request.method, request.path, counter.count
+        )
+        return response
+
+
+def _timed_class(serializer_class):
+    timed = _timed_classes.get(serializer_class)
+    if timed is None:
+        def data(self):
+            with metrics.serializer_time():
+                return super(timed, self).data
+
+        timed = type(serializer_class.__name__, (serializer_class,), {
+            '__module__': serializer_class.__module__,
+            '__qualname__': serializer_class.__qualname__,
+            'data': property(data),
+        })
+        _timed_classes[serializer_class] = timed
+    return timed
+
+
+class SerializerTimingMixin:
+    """
+    Count the time spent in ``serializer.data`` of serializers from
+    ``get_serializer()`` as serializer time of the request
+    (``admin_panel.metrics``). Serializers built directly in custom actions
+    are counted as view time.
+    """
+
+    def get_serializer(self, *args, **kwargs):
+        serializer = super().get_serializer(*args, **kwargs)
+        # Schema generation introspects the class; leave it untouched there.
+        if not getattr(self, 'swagger_fake_view', False):
+            serializer.__class__ = _timed_class(type(serializer))
+        return serializer
+
+
+class ReplicaReadMixin:
+    """
+    Read safe-method requests (GET, HEAD, OPTIONS) from a replica
+    (``admin_panel.db_router``), unless the caller is pinned to the primary
+    after a recent write. Authentication and permission checks still read
+    from the primary.
+
+    The routing ends with ``dispatch()``, before a ``StreamingHttpResponse``
+    body is consumed: streamed querysets are bound to ``read_alias()`` up
+    front so exports also read from the replica.
+    """
+
+    def read_alias(self, model):
+        """Database this request reads ``model`` from (a replica or ``default``)."""
+        return router.db_for_read(model)
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        if request.method not in permissions.SAFE_METHODS or not db_router.replicas():
+            return
+        user = request.user
+        if user.is_authenticated and db_router.pinned_to_primary(user.pk):
+            return
+        self._replica_reads = ExitStack()
+        self._replica_reads.enter_context(db_router.use_replicas())
+
+    def dispatch(self, request, *args, **kwargs):
+        try:
+            return super().dispatch(request, *args, **kwargs)
+        finally:
+            replica_reads = self.__dict__.pop('_replica_reads', None)
+            if replica_reads is not None:
+                replica_reads.close()
+
+
+class ResponseCacheMixin:
+    """
+    Serve ``cached_actions`` from the versioned response cache
+    (``admin_panel.response_cache``) and answer conditional requests.
+
+    Entries are keyed by ``cache_namespace``, the caller's ``cache_scope``
+    and the full URL (including the negotiated format). ``ETag`` and
+    ``Last-Modified`` come from ``max(updated_at)`` and the row count of the
+    filtered queryset, plus ``cache_state()`` for data the payload reads
+    from other tables, so ``If-None-Match`` / ``If-Modified-Since`` get a
+    304 without serializing anything, and from a cache hit without any
+    query at all.
+
+    Custom actions opt in by returning
+    ``self.cached_response(request, build, queryset)``.
+    """
+    cache_namespace = None
+    cached_actions = ('list', 'retrieve')
+
+    def cache_scope(self, request):
+        """Key part shared by every caller who can see the same rows."""
+        user = request.user
+        return f'user:{user.pk}' if user.is_authenticated else 'public'
+
+    def list(self, request, *args, **kwargs):
+        build = lambda: super(ResponseCacheMixin, self).list(request, *args, **kwargs)  # noqa: E731
+        if 'list' not in self.cached_actions:
+            return build()
+        return self.cached_response(request, build, self.filter_queryset(self.get_queryset()))
+
+    def retrieve(self, request, *args, **kwargs):
+        build = lambda: super(ResponseCacheMixin, self).retrieve(request, *args, **kwargs)  # noqa: E731
+        if 'retrieve' not in self.cached_actions:
+            return build()
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        queryset = self.filter_queryset(self.get_queryset()).filter(
+            **{self.lookup_field: kwargs[lookup_url_kwarg]}
+        )
+        return self.cached_response(request, build, queryset)
+
+    def cache_state(self, queryset):
+        """``(token, last modified)`` of payload data outside ``queryset``'s rows."""
+        return '', None
+
+    def _validators(self, scope, digest, queryset):
+        stamp = queryset.order_by().aggregate(last_modified=Max('updated_at'), count=Count('pk'))
+        state, state_modified = self.cache_state(queryset)
+        last_modified = max(filter(None, (stamp['last_modified'], state_modified)), default=None)
+        token = f"{scope}|{digest}|{last_modified.isoformat() if last_modified else ''}|{stamp['count']}|{state}"
+        return {
+            'etag': '"%s"' % hashlib.sha1(token.encode()).hexdigest(),
+            'last_modified': int(last_modified.timestamp()) if last_modified else None,
+        }
+
+    def _with_validators(self, response, entry, outcome, scope):
+        response['ETag'] = entry['etag']
+        if entry['last_modified'] is not None:
+            response['Last-Modified'] = http_date(entry['last_modified'])
+        response['Cache-Control'] = 'no-cache' if scope == 'public' else 'private, no-cache'
+        response['X-Cache'] = outcome
+        patch_vary_headers(response, ('Authorization',))
+        return response
+
+    def cached_response(self, request, build, queryset):
+        options = response_cache.config()
+        if not options['ENABLED'] or self.cache_namespace is None or request.method not in ('GET', 'HEAD'):
+            return build()
+
+        scope = self.cache_scope(request)
+        digest = hashlib.sha256(
+            f'{request.accepted_renderer.format}|{request.build_absolute_uri()}'.encode()
+        ).hexdigest()
+        key = response_cache.KEY.format(
+            namespace=self.cache_namespace,
+            version=response_cache.namespace_version(self.cache_namespace),
+            scope=hashlib.sha1(scope.encode()).hexdigest() if len(scope) > 64 else scope,
+            digest=digest,
+        )
+        cache = response_cache.get_cache()
+        entry = cache.get(key)
+        outcome = 'HIT'
+        if entry is None:
+            outcome = 'MISS'
+            # Built for the current namespace version: read from the primary.
+            with db_router.use_primary():
+                entry = self._validators(scope, digest, queryset)
+
+        not_modified = get_conditional_response(
+            request._request, etag=entry['etag'], last_modified=entry['last_modified']
+        )
+        if not_modified is not None:
+            return self._with_validators(not_modified, entry, outcome, scope)
+
+        if 'data' in entry:
+            return self._with_validators(Response(entry['data']), entry, outcome, scope)
+
+        with db_router.use_primary():
+            response = build()
+        if response.status_code != 200:
+            return response
+        cache.set(key, {**entry, 'data': response.data}, options['TIMEOUT'])
+        return self._with_validators(response, entry, outcome, scope)
@@ -6,16 +6,17 @@ from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from django_filters.rest_framework import DjangoFilterBackend
-from admin_panel.models import User, ActivityLog
-from django.contrib.contenttypes.models import ContentType
+from admin_panel.models import User
+from admin_panel.audit import log_activity
 from admin_panel.serializers import (
     UserListSerializer, UserDetailSerializer, UserCreateUpdateSerializer,
     UserProfileSerializer
 )
 from admin_panel.permissions import IsSuperAdmin, IsInstitutionAdmin
+from admin_panel.viewsets.mixins import QueryPlannerMixin, SerializerTimingMixin
 
 
-class UserViewSet(viewsets.ModelViewSet):
+class UserViewSet(QueryPlannerMixin, SerializerTimingMixin, viewsets.ModelViewSet):
     """
     ViewSet for user management with role-based permissions.
     - Super Admin: Can manage all users
@@ -69,11 +70,10 @@ class UserViewSet(viewsets.ModelViewSet):
     def perform_create(self, serializer):
         """Create a new user."""
         user = serializer.save()
-        ActivityLog.objects.create(
+        log_activity(
             user=user,
             action='create',
-            content_type=ContentType.objects.get_for_model(User),
-            object_id=user.id,
+            obj=user,
             description=f'User account created: {user.username}',
             ip_address=self.get_client_ip(),
             user_agent=self.request.META.get('HTTP_USER_AGENT', '')
@@ -128,11 +128,10 @@ class UserViewSet(viewsets.ModelViewSet):
         user.status = new_status
         user.save()
         
-        ActivityLog.objects.create(
+        log_activity(
             user=request.user,
             action='update',
-            content_type=ContentType.objects.get_for_model(User),
-            object_id=user.id,
+            obj=user,
             description=f'Changed user status to {new_status}',
             ip_address=self.get_client_ip(),
             user_agent=request.META.get('HTTP_USER_AGENT', '')
@@ -5,6 +5,7 @@ Django settings for facultyplus project.
 from pathlib import Path
 import os
 from datetime import timedelta
+from decouple import Csv, config
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -40,6 +41,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'admin_panel.middleware.RequestMetricsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
@@ -48,6 +50,7 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'admin_panel.middleware.ReplicaPinMiddleware',
 ]
 
 ROOT_URLCONF = 'facultyplus.urls'
@@ -71,13 +74,58 @@ TEMPLATES = [
 WSGI_APPLICATION = 'facultyplus.wsgi.application'
 
 
-# Database
-DATABASES = {
-    'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
+# Database, from the environment (or a .env file):
+# DB_ENGINE=sqlite (default) or postgresql, DB_NAME, DB_USER, DB_PASSWORD,
+# DB_HOST, DB_PORT. PostgreSQL connections are kept for DB_CONN_MAX_AGE
+# seconds and checked before reuse (DB_CONN_HEALTH_CHECKS).
+# DB_PGBOUNCER=True behind PgBouncer in transaction pooling mode: server-side
+# cursors are disabled, so QuerySet.iterator() fetches whole results.
+# DB_REPLICAS: comma-separated read replicas, host[:port] for PostgreSQL or
+# file paths for SQLite, as aliases replica1, replica2, ... (admin_panel.db_router).
+DB_ENGINE = config('DB_ENGINE', default='sqlite')
+DB_REPLICAS = config('DB_REPLICAS', default='', cast=Csv())
+
+if DB_ENGINE == 'postgresql':
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.postgresql',
+            'NAME': config('DB_NAME', default='facultyplus'),
+            'USER': config('DB_USER', default='postgres'),
+            'PASSWORD': config('DB_PASSWORD', default=''),
+            'HOST': config('DB_HOST', default='localhost'),
+            'PORT': config('DB_PORT', default='5432'),
+            'CONN_MAX_AGE': config('DB_CONN_MAX_AGE', default=600, cast=int),
+            'CONN_HEALTH_CHECKS': config('DB_CONN_HEALTH_CHECKS', default=True, cast=bool),
+            'DISABLE_SERVER_SIDE_CURSORS': config('DB_PGBOUNCER', default=False, cast=bool),
+            'OPTIONS': {
+                'connect_timeout': config('DB_CONNECT_TIMEOUT', default=5, cast=int),
+                'sslmode': config('DB_SSLMODE', default='prefer'),
+            },
+        }
     }
-}
+elif DB_ENGINE == 'sqlite':
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': config('DB_NAME', default=str(BASE_DIR / 'db.sqlite3')),
+        }
+    }
+else:
+    raise ValueError(f'Unsupported DB_ENGINE {DB_ENGINE!r}; use sqlite or postgresql')
+
+for number, replica in enumerate(DB_REPLICAS, 1):
+    if DB_ENGINE == 'postgresql':
+        host, _, port = replica.partition(':')
+        location = {'HOST': host, 'PORT': port or DATABASES['default']['PORT']}
+    else:
+        location = {'NAME': replica}
+    # Tests run against default only; replicas mirror it.
+    DATABASES[f'replica{number}'] = {**DATABASES['default'], **location, 'TEST': {'MIRROR': 'default'}}
+
+DATABASE_REPLICAS = [f'replica{number}' for number in range(1, len(DB_REPLICAS) + 1)]
+DATABASE_ROUTERS = ['admin_panel.db_router.ReplicaRouter'] if DATABASE_REPLICAS else []
+# After a write, the user's reads stay on the primary this long (> replica lag).
+DATABASE_REPLICA_PIN_SECONDS = config('DB_REPLICA_PIN_SECONDS', default=5, cast=int)
 
 
 # Password validation
@@ -97,6 +145,18 @@ AUTH_PASSWORD_VALIDATORS = [
 ]
 
 
+# Password hashing: PBKDF2 with a configurable work factor (admin_panel.hashers).
+# PASSWORD_HASHER_ITERATIONS=0 keeps Django's default; lower it only for load tests.
+PASSWORD_HASHER_ITERATIONS = config('PASSWORD_HASHER_ITERATIONS', default=0, cast=int)
+PASSWORD_HASHERS = [
+    'admin_panel.hashers.PBKDF2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+    'django.contrib.auth.hashers.Argon2PasswordHasher',
+    'django.contrib.auth.hashers.BCryptSHA256PasswordHasher',
+    'django.contrib.auth.hashers.ScryptPasswordHasher',
+]
+
+
 # Internationalization
 LANGUAGE_CODE = 'en-us'
 TIME_ZONE = 'UTC'
@@ -124,10 +184,10 @@ REST_FRAMEWORK = {
         'rest_framework.filters.SearchFilter',
         'rest_framework.filters.OrderingFilter',
     ],
-    'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
+    'DEFAULT_PAGINATION_CLASS': 'admin_panel.pagination.DefaultPagination',
     'PAGE_SIZE': 10,
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'admin_panel.authentication.ClaimsJWTAuthentication',
         'rest_framework.authentication.TokenAuthentication',
         'rest_framework.authentication.SessionAuthentication',
     ],
@@ -136,6 +196,78 @@ REST_FRAMEWORK = {
     ],
 }
 
+# Report per-request query counts (X-Query-Count header) from QueryPlannerMixin
+QUERY_PLANNER_DEBUG = DEBUG
+
+# Cache backend: CACHE_BACKEND=locmem (default), file or redis.
+# Use redis (or file) when several processes must share invalidations.
+CACHE_BACKEND = config('CACHE_BACKEND', default='locmem')
+if CACHE_BACKEND == 'redis':
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': config('REDIS_URL', default='redis://127.0.0.1:6379/1'),
+        }
+    }
+elif CACHE_BACKEND == 'file':
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+            'LOCATION': config('CACHE_LOCATION', default=os.path.join(BASE_DIR, 'cache')),
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'facultyplus',
+        }
+    }
+
+# Cached job responses (admin_panel.response_cache); TIMEOUT in seconds.
+RESPONSE_CACHE = {
+    'ENABLED': True,
+    'ALIAS': 'default',
+    'TIMEOUT': 300,
+}
+
+# Per-request instrumentation (admin_panel.metrics): Server-Timing headers,
+# Prometheus histograms at /api/_metrics (readable by super admins, and from
+# METRICS_ALLOWED_IPS) and a warning on the admin_panel logger for requests
+# slower than SLOW_REQUEST_MS. Leave METRICS_ALLOWED_IPS empty behind a
+# reverse proxy on the same host: every request then comes from 127.0.0.1.
+REQUEST_METRICS = {
+    'ENABLED': True,
+    'SERVER_TIMING': True,
+    'SLOW_REQUEST_MS': 1000,
+    'ALLOWED_IPS': config('METRICS_ALLOWED_IPS', default='', cast=Csv()),
+}
+
+# Max users kept in the per-process role-scope LRU (admin_panel.scope)
+SCOPE_CACHE_SIZE = 2048
+
+# Job ?search= backend (admin_panel.search): 'auto' uses the full-text index
+# of the database in use (PostgreSQL tsvector / SQLite FTS5); 'basic' forces
+# icontains matching.
+SEARCH_BACKEND = 'auto'
+
+# Audit trail writer (admin_panel.audit): 'sync', 'thread' or 'celery'.
+# DURABLE writes each entry in the request thread when its transaction commits.
+ACTIVITY_LOG_WRITER = {
+    'BACKEND': 'thread',
+    'BATCH_SIZE': 100,
+    'FLUSH_INTERVAL': 2.0,
+    'DURABLE': False,
+}
+
+# ActivityLog retention (admin_panel.partitions, archive_activity_logs command).
+# Months older than RETAIN_MONTHS are moved to gzip JSONL files in ARCHIVE_DIR.
+ACTIVITY_LOG_RETENTION = {
+    'RETAIN_MONTHS': 12,
+    'PARTITIONS_AHEAD': 2,
+    'ARCHIVE_DIR': os.path.join(BASE_DIR, 'archives', 'activity_log'),
+}
+
 # Simple JWT settings
 SIMPLE_JWT = {
     'ACCESS_TOKEN_LIFETIME': timedelta(minutes=30),
@@ -143,6 +275,9 @@ SIMPLE_JWT = {
     'ROTATE_REFRESH_TOKENS': False,
     'BLACKLIST_AFTER_ROTATION': True,
     'AUTH_HEADER_TYPES': ('Bearer',),
+    # Tokens carry role/institution/scope-version claims (admin_panel.authentication)
+    'TOKEN_OBTAIN_SERIALIZER': 'admin_panel.authentication.ClaimsTokenObtainPairSerializer',
+    'TOKEN_REFRESH_SERIALIZER': 'admin_panel.authentication.ClaimsTokenRefreshSerializer',
 }
 
 
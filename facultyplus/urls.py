@@ -7,7 +7,7 @@ from django.conf import settings
 from django.conf.urls.static import static
 from rest_framework.routers import DefaultRouter
 from drf_spectacular.views import SpectacularAPIView, SpectacularSwaggerView, SpectacularRedocView
-from admin_panel import auth_views
+from admin_panel import auth_views, metrics
 from admin_panel.viewsets import (
     UserViewSet, InstitutionViewSet, CollegeViewSet, DepartmentViewSet,
     JobViewSet, ApplicationViewSet, ApplicantViewSet, ActivityLogViewSet,
@@ -52,6 +52,7 @@ swagger_patterns = [
 urlpatterns = [
     path('admin/', admin.site.urls),
     path('api/auth/', include(auth_patterns)),
+    path('api/_metrics', metrics.metrics_view, name='metrics'),
     path('api/', include(router.urls)),
     path('', include(swagger_patterns)),
 ]